@@ -0,0 +1,76 @@
+# Simulation box and configuration shared by the benchmarks, each benchmark overriding only the keys it varies.
+import numpy as np
+
+import sys
+sys.path.append("../../")
+import src
+
+from src.core.boxes.simulation import SimulationBoxMethods
+
+from src.core.engines.solvers.nls.eq_coefs.models import CoupledWavevectorPhotorefractiveModel
+
+from src.core.engines.solvers.nls.solver_2d.coupled_solver import CoupledSplitStepSolver
+
+from src.fields.fields_2d import SecondMoireLatticeGaussian2D
+
+inheritance = {
+    CoupledSplitStepSolver,
+    SecondMoireLatticeGaussian2D,
+    CoupledWavevectorPhotorefractiveModel,
+}
+
+storage_config = {"home": "./Data/",
+                  "store": "last",
+                  }
+
+simulation_config = {"Nx": 2*1024,
+                     "Ny": 2*1024,
+                     "Nz": 50,
+                     "lx": 1.5*1e-3,
+                     "ly": 1.5*1e-3,
+                     "lz": 1*20e-3,
+                     "noise": .05,
+                     "seed": 0,  # same noise in every run
+                     }
+
+crystal_config = {"n": 2.36,
+                  "n1": 2.36,
+                  "electro_optic_coef":250e-12,
+                  "electro_optic_coef1": 250e-12,
+                  "tension": 400,
+                  "Isat": 3.75,
+                  "alpha": 0.,
+                  "alpha1": 0.,
+                  "Lx": 5e-3,
+                  "Ly": 5e-3,
+                  "Lz": 20e-3,
+                  }
+
+beam_config = {"wavelength": 633e-9,
+               "wavelength1": 532e-9,
+               "c": -1.,
+               "c1": -.1,
+               }
+
+lattice_config = {"angle": np.atan(3/4),
+                  "angle1": 0.,
+                  "a": .25*np.pi*27e-6,
+                  "a1": .25*np.pi*27e-6,
+                  "p": 1.,
+                  "p1": 1.,
+                  }
+
+modulation_config = {
+    "landscape_config": {},
+    "envelope_config": {"I": .3, "width": 11.5e-6, "center": (0,0), "exponent": 1.},
+    "landscape1_config": lattice_config,
+    "envelope1_config": {"I": 16*crystal_config["Isat"], "width": 700e-6, "center": (0,0), "exponent": 4.},
+}
+
+device_config = {
+    "device": 0,
+    "backend": "cuda",
+}
+
+class SimulationBox(*inheritance, SimulationBoxMethods):
+    pass
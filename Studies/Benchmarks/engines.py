@@ -0,0 +1,53 @@
+# Imports
+import time
+from copy import deepcopy
+
+import numpy as np
+
+from benchmark_config import SimulationBox, crystal_config, beam_config, simulation_config, modulation_config, storage_config
+
+# Head-to-head per-step wall time of the array engines on the same simulation box.
+
+device_configs = {
+    "arrayfire cuda": {"device": 0, "backend": "cuda"},
+    "arrayfire cpu": {"device": 0, "backend": "cpu"},
+    "numpy / scipy.fft": {"device": 0, "backend": "numpy"},
+    "pyfftw": {"device": 0, "backend": "fftw"},
+}
+
+fields = {}
+for name, device_config in device_configs.items():
+    try:
+        simbox = SimulationBox(
+            crystal_config = crystal_config,
+            beam_config = beam_config,
+            simulation_config = simulation_config,
+            device_config = device_config,
+            modulation_config = deepcopy(modulation_config),
+            storage_config = dict(storage_config, home="./Data/Engines/"),
+        )
+        simbox.init()
+    except Exception as error:  # engine not available on this machine
+        print(f"{name}: unavailable ({error})")
+        continue
+    
+    simbox.modulate_field()
+    simbox.add_noise()
+    
+    simbox.init_af()
+    simbox.step_solver()  # warm up plans and JIT caches
+    simbox.ops.sync()
+    
+    start = time.perf_counter()
+    for z in range(simbox.Nsteps):
+        simbox.step_solver()
+    simbox.ops.sync()
+    elapsed = time.perf_counter() - start
+    
+    simbox.end_af()
+    fields[name] = simbox.field
+    print(f"{name}: {1e3 * elapsed / simbox.Nsteps:.3f} ms / step")
+
+reference = next(iter(fields.values()))
+for name, field in fields.items():
+    print(f"{name}: relative difference {np.linalg.norm(field - reference) / np.linalg.norm(reference):.2e}")
@@ -0,0 +1,59 @@
+# Imports
+import time
+from copy import deepcopy
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+from benchmark_config import SimulationBox, crystal_config, beam_config, simulation_config, device_config, modulation_config, storage_config
+
+# Error against wall time of the Strang, Yoshida 4th order and RK4IP integrators, to pick the cheapest scheme for a
+# target accuracy.
+
+storage_config = dict(storage_config, home="./Data/Integrators/")
+
+def propagate(scheme, Nz):
+    """ Propagate the same input with a scheme and a number of steps, returning the output fields and the wall time."""
+    simbox = SimulationBox(
+        crystal_config = crystal_config,
+        beam_config = beam_config,
+        simulation_config = dict(simulation_config, Nz=Nz, scheme=scheme),
+        device_config = device_config,
+        modulation_config = deepcopy(modulation_config),
+        storage_config = storage_config,
+    )
+    simbox.init()
+    
+    simbox.init_af()
+    simbox.ops.sync()
+    start = time.perf_counter()
+    simbox.iterate()
+    simbox.ops.sync()
+    elapsed = time.perf_counter() - start
+    simbox.end_af()
+    return simbox.field, simbox.field1, elapsed
+
+# Reference: fourth order scheme at a step well below the ones being compared.
+reference, reference1, _ = propagate("yoshida4", 2048)
+
+steps = [8, 16, 32, 64, 128, 256]
+fig, ax = plt.subplots()
+for scheme in ["strang", "yoshida4", "rk4ip"]:
+    errors, times = [], []
+    for Nz in steps:
+        field, field1, elapsed = propagate(scheme, Nz)
+        error = np.sqrt(
+            (np.linalg.norm(field - reference)**2 + np.linalg.norm(field1 - reference1)**2)
+            / (np.linalg.norm(reference)**2 + np.linalg.norm(reference1)**2)
+            )
+        errors.append(error)
+        times.append(elapsed)
+        print(f"{scheme} Nz={Nz}: {elapsed:.3f} s, relative error {error:.2e}")
+    ax.loglog(times, errors, "o-", label=scheme)
+
+ax.set_xlabel("Wall time (s)")
+ax.set_ylabel("Relative error")
+ax.set_title("Convergence of the integration schemes")
+ax.legend()
+fig.savefig(storage_config["home"] + "convergence.png", dpi=150)
+plt.show()
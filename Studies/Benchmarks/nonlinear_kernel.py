@@ -0,0 +1,36 @@
+# Imports
+import time
+from copy import deepcopy
+
+from benchmark_config import SimulationBox, crystal_config, beam_config, simulation_config, device_config, modulation_config, storage_config
+
+# Per-step wall time of the standard and the JIT-fused nonlinear kernels.
+
+simbox = SimulationBox(
+    crystal_config = crystal_config,
+    beam_config = beam_config,
+    simulation_config = simulation_config,
+    device_config = device_config,
+    modulation_config = deepcopy(modulation_config),
+    storage_config = dict(storage_config, home="./Data/NonlinearKernel/"),
+)
+simbox.init()
+
+input_field, input_field1 = simbox.field.copy(), simbox.field1.copy()
+
+for kernel in ["standard", "fused"]:
+    simbox.nonlinear_kernel = kernel
+    simbox.field, simbox.field1 = input_field.copy(), input_field1.copy()
+    
+    simbox.init_af()
+    simbox.step_solver()  # warm up the JIT cache
+    simbox.ops.sync()
+    
+    start = time.perf_counter()
+    for z in range(simbox.Nsteps):
+        simbox.step_solver()
+    simbox.ops.sync()
+    elapsed = time.perf_counter() - start
+    
+    simbox.end_af()
+    print(f"{kernel}: {1e3 * elapsed / simbox.Nsteps:.3f} ms / step")
@@ -0,0 +1,46 @@
+# Imports
+import time
+from copy import deepcopy
+
+import numpy as np
+
+from benchmark_config import SimulationBox, crystal_config, beam_config, simulation_config, device_config, modulation_config, storage_config
+
+# Per-step wall time, memory and accuracy of single and mixed precision against double precision, over a long propagation.
+
+fields, fields1 = {}, {}
+for precision in ["double", "single", "mixed"]:
+    simbox = SimulationBox(
+        crystal_config = crystal_config,
+        beam_config = beam_config,
+        simulation_config = dict(simulation_config, Nz=400, precision=precision),  # long enough for rounding to accumulate
+        device_config = device_config,
+        modulation_config = deepcopy(modulation_config),
+        storage_config = dict(storage_config, home="./Data/Precision/"),
+    )
+    simbox.init()
+    power, power1 = np.sum(simbox.get_intensity(), dtype=np.float64), np.sum(simbox.get_intensity1(), dtype=np.float64)
+    
+    simbox.init_af()
+    simbox.step_solver()  # warm up plans and JIT caches
+    simbox.ops.sync()
+    
+    start = time.perf_counter()
+    for z in range(simbox.Nsteps):
+        simbox.step_solver()
+    simbox.ops.sync()
+    elapsed = time.perf_counter() - start
+    
+    simbox.end_af()
+    fields[precision], fields1[precision] = simbox.field, simbox.field1
+    
+    drift = np.sum(simbox.get_intensity(), dtype=np.float64) / power - 1
+    drift1 = np.sum(simbox.get_intensity1(), dtype=np.float64) / power1 - 1
+    print(f"{precision}: {1e3 * elapsed / simbox.Nsteps:.3f} ms / step, {simbox.field.nbytes / 2**20:.0f} MiB / field, "
+          f"power drift {drift:.2e} {drift1:.2e}")
+
+# Accuracy check: relative L2 distance of the single and mixed precision fields to the double precision ones. Without
+# absorption the power is conserved, so its drift measures the accumulated rounding error of each precision.
+for precision in ["single", "mixed"]:
+    for field, reference in [(fields[precision], fields["double"]), (fields1[precision], fields1["double"])]:
+        print(f"{precision} vs double: relative difference {np.linalg.norm(field - reference) / np.linalg.norm(reference):.2e}")
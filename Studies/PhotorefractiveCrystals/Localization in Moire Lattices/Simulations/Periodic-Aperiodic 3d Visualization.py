@@ -26,22 +26,28 @@ inheritance = {
     CoupledWavevectorPhotorefractiveModel,
 }
 
+# only the central window of the plots is stored, every 10 steps
+storage_window = ((824, 1224), (824, 1224))
+
 periodic_storage_config = {"home": "./Data/Periodic/",
                   "store": "stride",
                   "extension": ".h5",
-                  "stride": 1
+                  "stride": 10,
+                  "window": storage_window,
                   }
 
 aperiodic_storage_config = {"home": "./Data/Aperiodic/",
                             "store": "stride",
                             "extension": ".h5",
-                            "stride": 1,
+                            "stride": 10,
+                            "window": storage_window,
                             }
 
 free_storage_config = {"home": "./Data/Free/",
                             "store": "stride",
                             "extension": ".h5",
-                            "stride": 1,
+                            "stride": 10,
+                            "window": storage_window,
                             }
 
 simulation_config = {"Nx": 2*1024,
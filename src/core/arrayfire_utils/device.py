@@ -1,12 +1,28 @@
 import arrayfire as af
 
+from ..backends.threads import set_thread_budget
+
+BACKENDS = ("cpu", "cuda", "opencl", "unified", "default")
+
+def set_af_device(device: int, backend: str, threads: int | None = None):
+    """ Set the arrayfire backend, device and host thread budget.
+
+    Args:
+        device (int): Device index.
+        backend (str): Arrayfire backend, ignored if it is not one of BACKENDS.
+        threads (int | None, optional): Host threads of the CPU backend. Defaults to None.
+    """
+    set_thread_budget(threads)
+    if str(backend).lower() in BACKENDS:
+        af.set_backend(str(backend).lower())
+    af.set_device(device)
+    print("Backend:", af.get_active_backend())
+    print(af.info())
+
 class DeviceMethods:
     def set_device(self,):
         """
         Set the arrayfire device based on the configuration. 
         This method is called during initialization and sets the device for all subsequent computations.
         """
-        # af.set_backend(self.backend)
-        af.set_device(self.device)
-        print("Backend:", af.get_active_backend())
-        print(af.info()) 
\ No newline at end of file
+        set_af_device(self.device, self.backend, self.threads)
@@ -15,7 +15,8 @@ class Arrayfire(DeviceMethods, NpConversionMethods):
 
         Args:
             device_config (dict): The configuration dictionary for the device and backend. 
-                It should contain keys "device" and "backend" with values int and str, respectively. For example:
+                It should contain keys "device" and "backend" with values int and str, respectively, and optionally
+                "threads" (int) to limit the host threads of the CPU backend. For example:
 
         device_config = {
             "device": 0,
@@ -25,6 +26,11 @@ class Arrayfire(DeviceMethods, NpConversionMethods):
         self.device = device_config["device"]
         self.backend = device_config["backend"]
         
+        if "threads" in device_config.keys():
+            self.threads = device_config["threads"]
+        else:
+            self.threads = None
+        
         super().__init__(
             *args,
             **kwargs,
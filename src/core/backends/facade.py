@@ -0,0 +1,91 @@
+def load_ops(backend: str, threads: int | None = None):
+    """ Load the array engine of a backend, importing its library only when it is used.
+
+    Args:
+        backend (str): "numpy" (or "scipy") for the NumPy/SciPy engine, "fftw" (or "pyfftw") for the pyFFTW engine,
+            any arrayfire backend otherwise.
+        threads (int | None, optional): Host threads of the engine. Defaults to None.
+    """
+    if str(backend).lower() in ("numpy", "scipy"):
+        from ..numpy_utils.ops import NumpyOps
+        return NumpyOps(threads)
+    if str(backend).lower() in ("fftw", "pyfftw"):
+        from ..fftw_utils.ops import FftwOps
+        return FftwOps(threads)
+    from ..arrayfire_utils.ops import ArrayfireOps
+    return ArrayfireOps(threads)
+
+class ArrayBackend:
+    def __init__(
+        self,
+        device_config: dict,
+        *args,
+        **kwargs,
+    ):
+        """ Initialize the array backend of the solvers.
+
+        The backend selects the array engine used by the split-step methods, so that the same simulation box runs on
+        ArrayFire or on NumPy/SciPy by changing the device configuration only.
+
+        Args:
+            device_config (dict): The configuration dictionary for the device and backend. 
+                It should contain keys "device" and "backend" with values int and str, respectively, and optionally
+                "threads" (int) to limit the host threads and "fields" (str) to generate the initial fields on the "host"
+                (default) or directly on the "device" from the 1D axes of the mesh. Use "backend": "numpy" for the NumPy/SciPy engine and "backend": "fftw" for the pyFFTW engine. For example:
+
+        device_config = {
+            "device": 0,
+            "backend: "cuda",
+        }
+        """
+        self.device = device_config["device"]
+        self.backend = device_config["backend"]
+        
+        if "threads" in device_config.keys():
+            self.threads = device_config["threads"]
+        else:
+            self.threads = None
+            
+        if "fields" in device_config.keys():
+            self.field_generation = device_config["fields"].lower()
+        else:
+            self.field_generation = "host"
+            
+        self.ops = load_ops(self.backend, self.threads)
+        
+        super().__init__(
+            *args,
+            **kwargs,
+            )
+        
+    @property
+    def device_generation(self,):
+        """ Whether the initial fields are generated by the array engine instead of NumPy on the host."""
+        return self.field_generation == "device"
+    
+    def set_device(self,):
+        """ Set the device of the array engine."""
+        self.ops.set_device(self.device, self.backend)
+        
+    @property
+    def plans_path(self,):
+        """ File of the persistent FFT plans, in the storage home."""
+        return self.home + "fftw_wisdom.pickle"
+    
+    def load_plans(self,):
+        """ Load the FFT plans of previous runs, when the box has a storage home."""
+        if hasattr(self, "home"):
+            self.ops.load_plans(self.plans_path)
+            
+    def store_plans(self,):
+        """ Store the FFT plans of the engine, when the box has a storage home."""
+        if hasattr(self, "home"):
+            self.ops.store_plans(self.plans_path)
+        
+    def np_to_af(self, arr):
+        """ Move a numpy array to the array engine."""
+        return self.ops.to_device(arr)
+    
+    def af_to_np(self, arr):
+        """ Move an array of the array engine to numpy."""
+        return self.ops.to_host(arr)
@@ -0,0 +1,14 @@
+import os
+
+THREAD_VARIABLES = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS")
+
+def set_thread_budget(threads: int | None):
+    """ Limit the threads used by the host-side math libraries (OpenMP, MKL, OpenBLAS) of the CPU backend.
+    Only effective before those libraries start their thread pools, i.e. early in a fresh process.
+
+    Args:
+        threads (int | None): Number of threads, None leaves the library defaults.
+    """
+    if threads is not None:
+        for variable in THREAD_VARIABLES:
+            os.environ[variable] = str(threads)
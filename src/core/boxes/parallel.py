@@ -0,0 +1,165 @@
+import os
+import pickle
+
+from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+
+from numpy.random import SeedSequence
+
+from ..backends.threads import set_thread_budget
+
+_worker_device = None
+
+def init_worker(devices, threads: int | None):
+    """ Pin a worker process to a device and set its thread budget, before arrayfire is loaded in the worker.
+
+    Args:
+        devices (Queue): Queue of device indices, each worker takes one.
+        threads (int | None): Number of host threads of the worker.
+    """
+    global _worker_device
+    set_thread_budget(threads)
+    _worker_device = devices.get()
+
+def merge_configs(configs: dict, point: dict) -> dict:
+    """ Recursively update nested configuration dictionaries with the values of a sweep point.
+
+    Args:
+        configs (dict): Configuration dictionaries keyed by argument name, e.g. "modulation_config".
+        point (dict): Nested dictionary with the values to update.
+
+    Returns:
+        dict: Updated configuration dictionaries.
+    """
+    for key, value in point.items():
+        if isinstance(value, dict) and isinstance(configs.get(key), dict):
+            merge_configs(configs[key], value)
+        else:
+            configs[key] = value
+    return configs
+
+def run_point(box_class, configs: dict, index: int, backend: str, threads: int | None) -> int:
+    """ Initialize and solve a single sweep point inside a worker process.
+
+    Args:
+        box_class (type): Simulation box class, must be importable from the worker.
+        configs (dict): Configuration dictionaries passed as keyword arguments to box_class.
+        index (int): Index of the sweep point, and spawn key of its noise stream.
+        backend (str): Arrayfire backend of the worker.
+        threads (int | None): Number of host threads of the worker.
+
+    Returns:
+        int: Index of the solved sweep point.
+    """
+    configs = deepcopy(configs)
+    configs["storage_config"] = {**configs["storage_config"], "sweep_index": index}  # keep the shared home, store under Sweep/point_<index>/
+    configs["device_config"] = {**configs["device_config"], "device": _worker_device, "backend": backend, "threads": threads}
+    
+    box = box_class(**configs)
+    box.init()
+    box.solve()
+    return index
+
+class ParallelSweep:
+    """ Fans independent simulations of a sweep out across a process pool.
+    
+    Every worker is a fresh (spawned) process with its own arrayfire backend, device and thread budget.
+    The box class must therefore be importable by the workers, i.e. defined at module level of a script guarded by if __name__ == "__main__".
+    
+    Every point draws its noise from the child SeedSequence(seed).spawn(...)[index] of the seed of the sweep, as the
+    points of the serial sweep runner do, so that both runners give the same results for a seed.
+    """
+    def __init__(
+        self,
+        box_class,
+        configs: dict,
+        workers: int | None = None,
+        backend: str = "cpu",
+        devices: list | None = None,
+        threads: int | None = None,
+    ):
+        """ Initialize the parallel sweep.
+
+        Args:
+            box_class (type): Simulation box class.
+            configs (dict): Base configuration dictionaries keyed by argument name of box_class.
+            workers (int | None, optional): Number of worker processes. Defaults to the number of cores.
+            backend (str, optional): Arrayfire backend of the workers. Defaults to "cpu".
+            devices (list | None, optional): Devices assigned to the workers in turn. Defaults to device 0 for every worker.
+            threads (int | None, optional): Host threads per worker. Defaults to the cores evenly split among workers.
+        """
+        self.box_class = box_class
+        self.configs = configs
+        self.workers = workers if workers is not None else os.cpu_count()
+        self.backend = backend
+        self.devices = devices if devices is not None else [0]
+        self.threads = threads if threads is not None else max(1, os.cpu_count() // self.workers)
+        
+        if "seed" in configs["simulation_config"].keys():
+            self.seed = configs["simulation_config"]["seed"]
+        else:
+            self.seed = SeedSequence().entropy  # fresh seed of the sweep, stored with the sweep points
+        
+    def point_configs(self, point, update=None) -> dict:
+        """ Configuration dictionaries of a sweep point.
+
+        Args:
+            point (dict | Any): Sweep point.
+            update (Callable, optional): update(configs, point) returning the configurations of the point. Defaults to merge_configs.
+        """
+        configs = deepcopy(self.configs)
+        if update is None:
+            configs = merge_configs(configs, point)
+        else:
+            configs = update(configs, point)
+        configs["simulation_config"] = {**configs["simulation_config"], "seed": self.seed}  # points spawn their child stream from the sweep index
+        return configs
+        
+    def run(self, points, update=None) -> dict:
+        """ Solve every sweep point in the process pool.
+
+        Args:
+            points (Iterable): Sweep points.
+            update (Callable, optional): update(configs, point) returning the configurations of the point. Defaults to merge_configs.
+
+        Returns:
+            dict: Sweep points by index.
+        """
+        points = dict(enumerate(points))
+        
+        context = get_context("spawn")
+        devices = context.Queue()
+        for worker in range(self.workers):
+            devices.put(self.devices[worker % len(self.devices)])
+            
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=context,
+            initializer=init_worker,
+            initargs=(devices, self.threads),
+        ) as executor:
+            futures = [
+                executor.submit(run_point, self.box_class, self.point_configs(point, update), index, self.backend, self.threads)
+                for index, point in points.items()
+            ]
+            for future in as_completed(futures):
+                print(f"Sweep point: {future.result() + 1} / {len(points)}")
+                
+        self.store_sweep_points(points)
+        return points
+    
+    def store_sweep_points(self, points: dict):
+        """ Store the index to sweep point map in the shared home.
+
+        Args:
+            points (dict): Sweep points by index.
+        """
+        directory = os.path.join(self.configs["storage_config"]["home"], "Sweep")
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "sweep_points.pickle"), "wb") as fpkl:
+            pickle.dump(points, fpkl, protocol=pickle.HIGHEST_PROTOCOL)
+        fpkl.close()
+        with open(os.path.join(directory, "sweep_seed.pickle"), "wb") as fpkl:
+            pickle.dump(self.seed, fpkl, protocol=pickle.HIGHEST_PROTOCOL)
+        fpkl.close()
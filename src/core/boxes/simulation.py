@@ -16,4 +16,12 @@ class SimulationBoxMethods(*default_inheritances):
         self.store_field(index="0")  # store initial state
         if hasattr(self, "plot_flag"):
             if self.plot_flag:
-                self.init_plot()
\ No newline at end of file
+                self.init_plot()
+                
+    def init_resume(self,):
+        """ Initialize the box for resume, the fields and the noise state being restored from the checkpoint, without
+        generating the input fields."""
+        self.init_model()
+        self.init_solver()
+        
+        self.adimensionalize_field()
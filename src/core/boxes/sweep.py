@@ -0,0 +1,101 @@
+import pickle
+
+from .simulation import SimulationBoxMethods
+
+
+class SweepBoxMethods(SimulationBoxMethods):
+    """ Runs many modulation configurations on a single initialized solver.
+    
+    Model, device, mesh, k-grid and propagators are initialized once, only the fields are re-modulated at every sweep point.
+    Results of each point are stored under Sweep/point_<index>/ of the storage home, with the point and the sweep seed in
+    sweep_point.pickle. A point holds the attribute values it sets on the box, in the units of the box after
+    initialization, not configuration dictionaries: the configuration of a point is the base configuration, stored in the
+    home by store_configs before the sweep, updated by the point.
+    """
+    def init_sweep(self,):
+        """ One-time initialization shared by every sweep point."""
+        self.init_model()
+        self.init_solver()
+        
+        self.adimensionalize_field()
+        
+        self.init_af_mesh()
+        
+    def end_sweep(self,):
+        """ Release the device-side mesh and leave the sweep directories."""
+        self.end_af_mesh()
+        self.sweep_index = None
+        
+    def update_point(self, point: dict):
+        """ Set the attributes of a sweep point, values are taken in the units used by the box after initialization.
+
+        Args:
+            point (dict): Attribute names and values of the sweep point.
+        """
+        for key, value in point.items():
+            setattr(self, key, value)
+        
+    def run_point(self, index: int,):
+        """ Modulate, propagate and store the fields of a single sweep point.
+
+        Args:
+            index (int): Index of the sweep point.
+        """
+        self.sweep_index = index
+        
+        self.modulate_field()
+        self.add_noise()
+        self.store_field(index="0")  # store initial state
+        
+        self.init_af_fields()
+        self.iterate()
+        self.end_af_fields()
+        
+    def sweep(self, points, update=None):
+        """ Run the simulation for every point of the sweep.
+
+        Args:
+            points (Iterable): Sweep points.
+            update (Callable, optional): update(box, point) applying a point to the box. Defaults to update_point, setting the attributes of a dict point.
+        """
+        self.init_sweep()
+        
+        stored_points = {}
+        for index, point in enumerate(points):
+            if update is None:
+                self.update_point(point)
+            else:
+                update(self, point)
+                
+            self.run_point(index)
+            self.store_point(point)
+            stored_points[index] = point
+            print(f"Sweep point: {index + 1}")
+            
+        self.end_sweep()
+        self.store_sweep_points(stored_points)
+        
+    def store_point(self, point):
+        """ Store the current sweep point and the seed of its noise in the directory of the point.
+
+        Args:
+            point (dict | Any): Sweep point, as passed to update.
+        """
+        self.make_folder(self.point_rel_directory)
+        with open(self.get_directory(self.point_rel_directory + "sweep_point.pickle"), "wb") as fpkl:
+            pickle.dump({"point": point, "sweep_index": self.sweep_index, "seed": self.seed}, fpkl, protocol=pickle.HIGHEST_PROTOCOL)
+        fpkl.close()
+        
+    def store_sweep_points(self, points: dict):
+        """ Store the index to sweep point map.
+
+        Args:
+            points (dict): Sweep points by index.
+        """
+        self.make_folder(self.sweep_rel_directory)
+        with open(self.get_directory(self.sweep_rel_directory + "sweep_points.pickle"), "wb") as fpkl:
+            pickle.dump(points, fpkl, protocol=pickle.HIGHEST_PROTOCOL)
+        fpkl.close()
+        with open(self.get_directory(self.sweep_rel_directory + "sweep_seed.pickle"), "wb") as fpkl:
+            pickle.dump(self.seed, fpkl, protocol=pickle.HIGHEST_PROTOCOL)  # points spawn their noise streams from the seed
+        fpkl.close()
@@ -10,7 +10,7 @@ class PrecisionControl:
         """Initialize the PrecisionControl object with the desired precision.
 
         Args:
-            precision (str, optional): Precision parameter "double" for double precision or "single" for single precision. Defaults to None.
+            precision (str, optional): Precision parameter "double" for double precision, "single" for single precision or "mixed" for single precision fields with double precision phases. Defaults to None.
         """
         self.precision = precision_config["precision"].lower()
         
@@ -21,10 +21,19 @@ class PrecisionControl:
             from numpy import float64, complex128
             self.np_float = float64
             self.np_complex = complex128
+            self.np_phase = float64
         elif self.precision == "single":
             from numpy import float32, complex64
             self.np_float = float32
             self.np_complex = complex64
+            self.np_phase = float32
+        elif self.precision == "mixed":
+            from numpy import float32, float64, complex64
+            self.np_float = float32
+            self.np_complex = complex64
+            self.np_phase = float64  # phases are computed in double precision
+        else:
+            raise ValueError('Precision must be "double", "single" or "mixed", got "{}".'.format(self.precision))
 
 
 class AfPrecisionControl(PrecisionControl):
@@ -37,7 +46,7 @@ class AfPrecisionControl(PrecisionControl):
         """Initialize the PrecisionControl object with the desired precision.
 
         Args:
-            precision (str, optional): Precision parameter "double" for double precision or "single" for single precision. Defaults to None.
+            precision (str, optional): Precision parameter "double" for double precision, "single" for single precision or "mixed" for single precision fields with double precision phases. Defaults to None.
         """
         super().__init__(
             precision_config = precision_config,
@@ -51,6 +60,12 @@ class AfPrecisionControl(PrecisionControl):
         if self.precision == "double":
             self.af_float = af.Dtype.f64
             self.af_complex = af.Dtype.c64
+            self.af_phase = af.Dtype.f64
         elif self.precision == "single":
             self.af_float = af.Dtype.f32
-            self.af_complex = af.Dtype.c32
\ No newline at end of file
+            self.af_complex = af.Dtype.c32
+            self.af_phase = af.Dtype.f32
+        elif self.precision == "mixed":
+            self.af_float = af.Dtype.f32
+            self.af_complex = af.Dtype.c32
+            self.af_phase = af.Dtype.f64
\ No newline at end of file
@@ -1,20 +1,225 @@
 class Iterator:
-    """ Base iterator class for solvers."""    
+    """ Base iterator class for solvers."""
+    @property
+    def iteration_mode(self,):
+        """ "standard", "fused" or "adaptive", from the "iteration" key of the simulation configuration."""
+        if not hasattr(self, '_iteration_mode'):
+            simulation_config = getattr(self, "simulation_config", {})
+            if "iteration" in simulation_config.keys():
+                self.iteration_mode = simulation_config["iteration"]
+            else:
+                self.iteration_mode = "standard"
+        return self._iteration_mode
+    
+    @iteration_mode.setter
+    def iteration_mode(self, value):
+        self._iteration_mode = value.lower()
+        
+    @property
+    def start_index(self,):
+        """ Steps already done, non zero when resuming from a checkpoint."""
+        if not hasattr(self, '_start_index'):
+            self._start_index = 0
+        return self._start_index
+    
+    @start_index.setter
+    def start_index(self, value):
+        self._start_index = value
+        
+    @property
+    def step_levels(self,):
+        """ Distinct longitudinal steps in use at once."""
+        return 1
+    
     def solve(self,):
         """ Main solve method to iterate through steps."""
-        for z in range(self.Nsteps):
+        self.iterate()
+        
+    def iterate(self,):
+        """ Iterate through steps with the configured iteration mode."""
+        if self.iteration_mode == "fused":
+            self.fused_solve()
+        else:
+            self.standard_solve()
+            
+    def standard_solve(self,):
+        """ Iterate through steps, each one a full symmetric split-step."""
+        for z in range(self.start_index, self.Nsteps):
             self.step_solver()  # solves (in place) for the next step
 
             self.store_step(z+1)
+            self.checkpoint_step(z+1)
 
             print(f"{z + 1} / {self.Nz}", end="\r")
             
-class AfIterator(Iterator):
+    def fused_solve(self,):
+        """ Iterate through steps merging the closing half linear step of a step with the opening half linear step of the next.
+        
+        A step is only closed with a half linear step when it is stored, checkpointed or when it is the last one.
+        """
+        step = .5
+        for z in range(self.start_index, self.Nsteps):
+            self.linear_steps(step)
+            self.nonlinear_steps()
+            
+            if self.is_stored_step(z+1) or self.is_checkpoint_step(z+1) or (z+1 == self.Nsteps):
+                self.linear_steps(.5)  # close the step
+                self.store_step(z+1)
+                self.checkpoint_step(z+1)
+                step = .5
+            else:
+                step = 1.  # merge the two half steps
+
+            print(f"{z + 1} / {self.Nz}", end="\r")
+            
+class AdaptiveIterator(Iterator):
+    """ Iterator with an adaptive longitudinal step, controlled by step-doubling error estimates.
+
+    Steps are dz * 2**level, dz being the step of the grid, so that propagators are reused across steps and every
+    storage plane is hit exactly. Positions are counted in integer ticks of dz / 2**max_refinement.
+    """
+    @property
+    def adaptive_tolerance(self,):
+        """ Local error of the adaptive steps, from the "tolerance" key of the simulation configuration."""
+        if not hasattr(self, '_adaptive_tolerance'):
+            simulation_config = getattr(self, "simulation_config", {})
+            if "tolerance" in simulation_config.keys():
+                self._adaptive_tolerance = simulation_config["tolerance"]
+            else:
+                self._adaptive_tolerance = 1e-5
+        return self._adaptive_tolerance
+    
+    @adaptive_tolerance.setter
+    def adaptive_tolerance(self, value):
+        self._adaptive_tolerance = value
+        
+    @property
+    def adaptive_max_refinement(self,):
+        """ Smallest adaptive step is dz / 2**max_refinement, from the "max_refinement" key of the simulation configuration."""
+        if not hasattr(self, '_adaptive_max_refinement'):
+            simulation_config = getattr(self, "simulation_config", {})
+            if "max_refinement" in simulation_config.keys():
+                self._adaptive_max_refinement = simulation_config["max_refinement"]
+            else:
+                self._adaptive_max_refinement = 8
+        return self._adaptive_max_refinement
+    
+    @adaptive_max_refinement.setter
+    def adaptive_max_refinement(self, value):
+        self._adaptive_max_refinement = value
+        
+    @property
+    def step_levels(self,):
+        """ Distinct longitudinal steps in use at once, the current step, its half for the error estimates and the next
+        level of a step change."""
+        if self.iteration_mode == "adaptive":
+            return 3
+        return super().step_levels
+        
+    def iterate(self,):
+        if self.iteration_mode == "adaptive":
+            self.adaptive_solve()
+        else:
+            super().iterate()
+            
+    def level_ticks(self, level):
+        """ Number of ticks of a step of dz * 2**level."""
+        return 2**(self.adaptive_max_refinement + level)
+    
+    def aligned_level(self, level, z, target):
+        """ Largest level up to level whose step starts on a multiple of its size and does not overshoot target.
+
+        Args:
+            level (int): Requested level.
+            z (int): Current position, in ticks.
+            target (int): Next storage plane, in ticks.
+        """
+        while (level > -self.adaptive_max_refinement) and ((z % self.level_ticks(level)) or (z + self.level_ticks(level) > target)):
+            level -= 1
+        return level
+    
+    def doubling_step(self, fields):
+        """ Advance the fields by two half steps, estimating the local error against a single full step.
+
+        Args:
+            fields (tuple): Copies of the fields at the start of the step.
+
+        Returns:
+            float: Relative distance between the full step and the two half steps.
+        """
+        self.step_solver()
+        coarse = self.get_fields(copy=False)
+        
+        self.set_fields(tuple(self.ops.copy(field) for field in fields))
+        self.dz /= 2
+        self.step_solver()
+        self.step_solver()
+        self.dz *= 2
+        
+        fine = self.get_fields(copy=False)
+        error = sum(self.ops.norm(f - c)**2 for f, c in zip(fine, coarse))
+        norm = sum(self.ops.norm(f)**2 for f in fine)
+        return (error / norm)**.5 if norm > 0 else 0.
+    
+    def adaptive_solve(self,):
+        """ Iterate up to every storage plane with steps chosen from step-doubling error estimates.
+
+        A step is rejected and halved when its local error exceeds the tolerance, and doubled when the error is small
+        enough for the doubled step (local error scales as dz**(scheme_order + 1)) to pass. The accepted steps are kept in
+        adaptive_history as (z, dz, error).
+        """
+        dz = self.dz
+        ticks = self.level_ticks(0)
+        if self.start_index == 0:
+            self.adaptive_history = []
+            self.adaptive_level = 0
+        
+        level, z = self.adaptive_level, self.start_index * ticks
+        for index in range(self.start_index + 1, self.Nsteps + 1):
+            if not (self.is_stored_step(index) or self.is_checkpoint_step(index) or (index == self.Nsteps)):
+                continue
+            
+            target = index * ticks
+            while z < target:
+                step_level = self.aligned_level(level, z, target)
+                self.dz = dz * 2.**step_level
+                
+                fields = self.get_fields()
+                error = self.doubling_step(fields)
+                if (error > self.adaptive_tolerance) and (step_level > -self.adaptive_max_refinement):
+                    self.set_fields(fields)  # reject
+                    level = step_level - 1
+                    continue
+                
+                z += self.level_ticks(step_level)
+                self.adaptive_history.append((z * dz / ticks, self.dz, error))
+                if (step_level == level) and (error < self.adaptive_tolerance / 2**(self.scheme_order + 1)):
+                    level += 1
+                    
+            self.store_step(index)
+            self.dz, self.adaptive_level = dz, level
+            self.checkpoint_step(index)
+            
+            print(f"{index} / {self.Nz}", end="\r")
+        self.dz = dz
+            
+class AfIterator(AdaptiveIterator):
     """ Iterator with arrayfire initialization."""
     def solve(self,):
         self.init_af()
-        super().solve()
+        self.iterate()
         self.end_af()
+        
+    def resume(self,):
+        """ Continue an interrupted propagation from the last checkpoint of its storage home.
+
+        Called on a new box built with the configuration of the interrupted run, in place of init and solve. The
+        propagation continues bit for bit, as long as the iteration mode and scheme are unchanged.
+        """
+        self.init_resume()
+        self.load_checkpoint()
+        self.solve()
+        self.start_index = 0
             
 class AfTimeSpaceAnalogIterator(AfIterator):
     """ Iterator for time-analog solvers with arrayfire initialization."""
@@ -26,4 +231,4 @@ class AfTimeSpaceAnalogIterator(AfIterator):
     
     @Nsteps.setter
     def Nsteps(self, value):
-        self._Nsteps = value
\ No newline at end of file
+        self._Nsteps = value
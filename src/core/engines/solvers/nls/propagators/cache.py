@@ -0,0 +1,82 @@
+from collections import OrderedDict
+
+from numpy import isscalar
+
+class PropagatorCache:
+    """ Cache of the k-space propagators used by the linear step of the split-step solvers.
+
+    Propagators are keyed on (kinetic, dz, step, absorption) and are only valid for the grid they were built on,
+    the whole cache is dropped as soon as the grid changes. The least recently used propagator is evicted first.
+    """
+    @property
+    def fold_absorption(self,):
+        if not hasattr(self, "_fold_absorption"):
+            self._fold_absorption = True
+        return self._fold_absorption
+
+    @fold_absorption.setter
+    def fold_absorption(self, value):
+        self._fold_absorption = value
+        self.reset_propagators()
+
+    def absorbs_in_propagator(self, absorption) -> bool:
+        """ Whether the absorption is applied by the propagator instead of a separate absorption step.
+        Only spatially uniform (scalar) absorption commutes with the linear step and can be folded. It is always folded
+        by the Yoshida scheme, whose composition is only fourth order with symmetric Strang steps.
+
+        Args:
+            absorption (float | ndarray): Absorption coefficient.
+        """
+        return (self.fold_absorption or self.scheme == "yoshida4") and isscalar(absorption)
+
+    def folded_absorption(self, absorption):
+        """ Absorption coefficient to build the propagator with, zero when absorption is not folded."""
+        return absorption if self.absorbs_in_propagator(absorption) else 0.
+
+    @property
+    def propagator_cache_size(self,):
+        """ Propagators kept in the cache, by default one per linear step fraction of the scheme, step level and field."""
+        if getattr(self, "_propagator_cache_size", None) is None:
+            return len(self.linear_fractions) * self.step_levels * len(self.get_fields(copy=False))
+        return self._propagator_cache_size
+
+    @propagator_cache_size.setter
+    def propagator_cache_size(self, value):
+        self._propagator_cache_size = value
+
+    @property
+    def propagators(self,):
+        if not hasattr(self, "_propagators"):
+            self.reset_propagators()
+        return self._propagators
+
+    def reset_propagators(self,):
+        """ Drop every cached propagator."""
+        self._propagators = OrderedDict()
+        self._propagators_grid = None
+
+    def propagator(self, kinetic, dz, step=.5, absorption=0.):
+        """ Get the propagator exp(i*step*dz*k^2*kinetic - step*dz*absorption), building it only when it is not cached.
+
+        Args:
+            kinetic (float): Kinetic coefficient.
+            dz (float): Longitudinal step.
+            step (float, optional): Fraction of dz to propagate. Defaults to .5.
+            absorption (float, optional): Uniform absorption coefficient folded in the propagator. Defaults to 0..
+
+        Returns:
+            af.Array: Propagator on the k-space grid.
+        """
+        if self.propagators and self._propagators_grid != self.grid_key:  # invalidate on grid change
+            self.reset_propagators()
+        self._propagators_grid = self.grid_key
+
+        key = (kinetic, dz, step, absorption)
+        if key in self._propagators:
+            self._propagators.move_to_end(key)
+            return self._propagators[key]
+        
+        while len(self._propagators) >= max(self.propagator_cache_size, 1):
+            self._propagators.popitem(last=False)  # evict the least recently used entry
+        self._propagators[key] = self.build_propagator(kinetic, dz, step, absorption)
+        return self._propagators[key]
@@ -0,0 +1,19 @@
+import math
+
+class PhaseFactors:
+    """ Complex exponentials of the split-step phases, in the precision of the box.
+
+    In mixed precision the fields and their transforms are single precision while the phases are computed in double
+    precision. Phases are reduced modulo 2π to [-π, π) before they are rounded to single precision, so that the exponential runs
+    in single precision without losing the accuracy of large phases.
+    """
+    def phase_factor(self, phase, decay=0.):
+        """ exp(1j*phase - decay) in the complex precision of the box.
+
+        Args:
+            phase (ndarray | af.Array): Real phase, in the phase precision of the box.
+            decay (float, optional): Uniform decay of the factor. Defaults to 0..
+        """
+        if self.precision == "mixed":
+            phase = self.ops.astype(self.ops.mod(phase + math.pi, 2*math.pi) - math.pi, self.np_float)  # in [-π, π)
+        return self.ops.astype(self.ops.exp(1j*phase - decay), self.np_complex)
@@ -0,0 +1,129 @@
+import warnings
+
+YOSHIDA_W1 = 1. / (2. - 2.**(1/3))
+YOSHIDA_W0 = - 2.**(1/3) / (2. - 2.**(1/3))
+
+SCHEME_ORDERS = {
+    "strang": 2,
+    "yoshida4": 4,
+    "rk4ip": 4,
+}
+
+SCHEME_LINEAR_FRACTIONS = {
+    "strang": (.5, 1.),  # whole steps of the fused iteration mode
+    "yoshida4": (.5 * YOSHIDA_W1, .5 * (YOSHIDA_W1 + YOSHIDA_W0)),
+    "rk4ip": (.5,),
+}
+
+class IntegrationSchemes:
+    """ Selectable integrators of a single longitudinal step of the split-step solvers.
+
+    - "strang": second order symmetric splitting, implemented by the solvers as strang_step.
+    - "yoshida4": fourth order Yoshida (Forest-Ruth) composition of three Strang steps of w1*dz, w0*dz and w1*dz, with
+      the adjacent half linear steps merged. Uniform absorption is folded in the linear steps, non-uniform absorption
+      brings the scheme back to second order.
+    - "rk4ip": fourth order Runge-Kutta in the interaction picture (Hult, J. Lightwave Technol. 25, 3770 (2007)), with
+      the linear step in the interaction picture and the nonlinear terms given by the solvers as nonlinear_terms.
+    """
+    @property
+    def scheme(self,):
+        """ "strang", "yoshida4" or "rk4ip", from the "scheme" key of the simulation configuration."""
+        if not hasattr(self, "_scheme"):
+            simulation_config = getattr(self, "simulation_config", {})
+            if "scheme" in simulation_config.keys():
+                self.scheme = simulation_config["scheme"]
+            else:
+                self._scheme = "strang"
+        return self._scheme
+    
+    @scheme.setter
+    def scheme(self, value):
+        if value.lower() not in SCHEME_ORDERS.keys():
+            raise ValueError("Unknown integration scheme {}, use one of {}.".format(value, list(SCHEME_ORDERS.keys())))
+        self._scheme = value.lower()
+        
+    @property
+    def scheme_order(self,):
+        """ Global order of accuracy of the integration scheme in dz."""
+        return SCHEME_ORDERS[self.scheme]
+    
+    @property
+    def linear_fractions(self,):
+        """ Distinct fractions of dz of the linear steps of the integration scheme."""
+        return SCHEME_LINEAR_FRACTIONS[self.scheme]
+    
+    def step_solver(self,):
+        """ Inplace single step evolution with the selected integration scheme."""
+        if self.scheme == "yoshida4":
+            self.yoshida_step()
+        elif self.scheme == "rk4ip":
+            self.rk4ip_step()
+        else:
+            self.strang_step()
+            
+    def fused_solve(self,):
+        """ Half step merging across steps only applies to Strang splitting, other schemes iterate standard steps."""
+        if self.scheme != "strang":
+            self.standard_solve()
+        else:
+            super().fused_solve()
+            
+    def fractional_nonlinear_steps(self, step):
+        """ Nonlinear and absorption steps of a fraction of dz.
+
+        Args:
+            step (float): Fraction of dz to propagate.
+        """
+        dz = self.dz
+        self.dz = step * dz
+        self.nonlinear_steps()
+        self.dz = dz
+        
+    def yoshida_step(self,):
+        """ Inplace fourth order Yoshida step, as the composition S(w1*dz) S(w0*dz) S(w1*dz) of Strang steps."""
+        if not all(self.absorbs_in_propagator(absorption) for absorption in (self.absorption, getattr(self, "absorption1", 0.))):
+            warnings.warn("Non-uniform absorption is applied outside of the linear steps, the yoshida4 scheme is second order.")
+        self.linear_steps(.5 * YOSHIDA_W1)
+        self.fractional_nonlinear_steps(YOSHIDA_W1)
+        self.linear_steps(.5 * (YOSHIDA_W1 + YOSHIDA_W0))
+        self.fractional_nonlinear_steps(YOSHIDA_W0)
+        self.linear_steps(.5 * (YOSHIDA_W0 + YOSHIDA_W1))
+        self.fractional_nonlinear_steps(YOSHIDA_W1)
+        self.linear_steps(.5 * YOSHIDA_W1)
+        
+    def rk4ip_step(self,):
+        """ Inplace fourth order Runge-Kutta step in the interaction picture.
+
+        With P the half step propagator and k(u) = dz*N(u)*u the nonlinear terms:
+            u_I = P u, k1 = P k(u), k2 = k(u_I + k1/2), k3 = k(u_I + k2/2), k4 = k(P (u_I + k3)),
+            u(z + dz) = P (u_I + k1/6 + k2/3 + k3/3) + k4/6.
+        """
+        fields = self.get_fields()
+        
+        # u_I
+        self.linear_steps(.5)
+        fields_I = self.get_fields(copy=False)
+        
+        # k1
+        self.set_fields(fields)
+        self.set_fields(self.nonlinear_terms())
+        self.linear_steps(.5)
+        k1 = self.get_fields(copy=False)
+        
+        # k2, k3
+        self.set_fields(tuple(u + k/2 for u, k in zip(fields_I, k1)))
+        k2 = self.nonlinear_terms()
+        self.ops.eval(*k2)
+        self.set_fields(tuple(u + k/2 for u, k in zip(fields_I, k2)))
+        k3 = self.nonlinear_terms()
+        self.ops.eval(*k3)
+        
+        # k4
+        self.set_fields(tuple(u + k for u, k in zip(fields_I, k3)))
+        self.linear_steps(.5)
+        k4 = self.nonlinear_terms()
+        
+        self.set_fields(tuple(u + k_1/6 + (k_2 + k_3)/3 for u, k_1, k_2, k_3 in zip(fields_I, k1, k2, k3)))
+        self.linear_steps(.5)
+        self.set_fields(tuple(u + k/6 for u, k in zip(self.get_fields(copy=False), k4)))
+        self.ops.eval(*self.get_fields(copy=False))
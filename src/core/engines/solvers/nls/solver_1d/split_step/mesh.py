@@ -14,13 +14,46 @@ class SplitStepMesh(Mesh1D):
 
     def init_af(self,):
         """ Initialize arrayfire arrays for field and k-grid."""
-        self.field = self.np_to_af(self.field)
+        self.init_af_fields()
+        self.init_af_mesh()
         
+    def init_af_fields(self,):
+        """ Upload the field to the device, in the precision of the box."""
+        self.field = self.ops.astype(self.np_to_af(self.field), self.np_complex)
+        
+    def init_af_mesh(self,):
+        """ Upload the k-grid to the device, load the FFT plans and build the propagators."""
         self.init_k_grid()
         self.kx = self.np_to_af(self.kx)
+        self.load_plans()
+        
+        self.init_propagators()
+        
+    @property
+    def grid_key(self,):
+        return (self.Nx, self.dx)
+    
+    def get_fields(self, copy=True):
+        """ Fields propagated by the solver, copied on the device by default."""
+        return (self.ops.copy(self.field),) if copy else (self.field,)
+    
+    def set_fields(self, fields):
+        """ Bind the fields propagated by the solver, as returned by get_fields."""
+        (self.field,) = fields
         
     def end_af(self,):
         """ Convert arrayfire arrays back to numpy arrays."""
+        self.end_af_fields()
+        self.end_af_mesh()
+        
+    def end_af_fields(self,):
+        """ Close the background writer and download the field from the device."""
+        self.close_storage()
         self.field = self.af_to_np(self.field)
         
+    def end_af_mesh(self,):
+        """ Drop the propagators, store the FFT plans and download the k-grid from the device."""
+        self.reset_propagators()
+        self.store_plans()
+        
         self.kx = self.af_to_np(self.kx)
\ No newline at end of file
@@ -1,53 +1,79 @@
-import arrayfire as af
+import math
 
-from ......arrayfire_utils.facade import Arrayfire
+from ......backends.facade import ArrayBackend
 from ...iterators.solver import AfTimeSpaceAnalogIterator
 from ......storage.store_methods import StorageField
 
+from ...propagators.cache import PropagatorCache
+from ...propagators.phase import PhaseFactors
+from ...schemes.integrators import IntegrationSchemes
+
 from .mesh import SplitStepMesh
 
-class SplitStepMethods:
-    def linear_step(self, field, kinetic):
-        """ Perform the linear step in the split-step method."""
-        field[:] = af.signal.fft(field)
+class SplitStepMethods(PropagatorCache, PhaseFactors, IntegrationSchemes):
+    def build_propagator(self, kinetic, dz, step=.5, absorption=0.):
+        """ Build the k-space propagator of the linear step."""
+        return self.phase_factor(step*dz * self.kx**2 * kinetic, step*dz*absorption)
         
-        exp = af.exp(1j * .5*self.dz * self.kx**2 * kinetic)
+    def linear_step(self, field, kinetic, step=.5, absorption=0.):
+        """ Perform the linear step in the split-step method."""
+        self.ops.fft_inplace(field)
         
-        field[:] = exp * field
-        field[:] = af.signal.ifft(field)
+        self.ops.multiply_inplace(field, self.propagator(kinetic, self.dz, step, absorption))
+        self.ops.ifft_inplace(field)
         
     def absorption_step(self, field, absorption):
         """ Perform the absorption step in the split-step method."""
-        x = -absorption*self.dz
-        exp = af.exp(af.constant(x, 1, 1, dtype=field.dtype()))
-        field[:] = field * exp
+        self.ops.multiply_inplace(field, math.exp(-absorption*self.dz))
         
     def nonlinear_step(self, field, potential):
         """ Perform the nonlinear step in the split-step method."""
-        field[:] = af.exp(-1j*self.dz*potential) * field[:]
+        self.ops.multiply_inplace(field, self.phase_factor(-self.dz*potential))
         
-class SplitStepSolver(StorageField, Arrayfire, SplitStepMesh, SplitStepMethods, AfTimeSpaceAnalogIterator):
+class SplitStepSolver(StorageField, ArrayBackend, SplitStepMesh, SplitStepMethods, AfTimeSpaceAnalogIterator):
     def init_solver(self,):
         """ Initialize the solver by setting device and initializing mesh."""
         self.set_device()
         
         self.init_mesh()
+        
+    def init_propagators(self,):
+        """ Build the half-step propagator once, before the propagation loop."""
+        self.reset_propagators()
+        self.propagator(self.kinetic, self.dz, .5, self.folded_absorption(self.absorption))
     
     def af_get_intensity(self,):
-        """ Compute the intensity of the field in arrayfire."""
-        return (self.field) * af.conjg(self.field)
+        """ Compute the real-typed intensity of the field with the array engine, in the phase precision."""
+        return self.ops.astype(self.ops.abs2(self.field), self.np_phase)
     
     def af_potential_function(self, field, potential):
-        """ Compute the nonlinear potential function in arrayfire."""
-        return self.potential * (self.af_get_intensity() / (self.Isat + self.af_get_intensity()))
+        """ Compute the nonlinear potential function with the array engine, evaluating the intensity once."""
+        intensity = self.af_get_intensity()
+        self.ops.eval(intensity)
+        return self.potential * (intensity / (self.Isat + intensity))
     
-    def step_solver(self, ):
-        """ Perform a single step of the split-step solver."""
-        self.linear_step(self.field, self.kinetic)
+    def linear_steps(self, step=.5):
+        """ Perform the linear step of the field."""
+        self.linear_step(self.field, self.kinetic, step, self.folded_absorption(self.absorption))
         
+    def nonlinear_steps(self,):
+        """ Perform the nonlinear and absorption steps of the field. Uniform absorption is left to the propagator."""
         self.nonlinear_step(self.field,
                             self.af_potential_function(self.field, self.potential))
         
-        self.absorption_step(self.field, self.absorption)
+        if not self.absorbs_in_propagator(self.absorption):
+            self.absorption_step(self.field, self.absorption)
+    
+    def nonlinear_terms(self,):
+        """ dz times the nonlinear and absorption terms of the field, as used by the RK4IP scheme."""
+        potential = self.af_potential_function(self.field, self.potential)
+        absorption = self.absorption - self.folded_absorption(self.absorption)  # absorption not applied by the propagator
+        return (self.ops.astype(self.field * (-1j*self.dz*potential - self.dz*absorption), self.np_complex),)
+    
+    def strang_step(self, ):
+        """ Perform a single Strang step of the split-step solver."""
+        self.linear_steps()
+        
+        self.nonlinear_steps()
         
-        self.linear_step(self.field, self.kinetic)
\ No newline at end of file
+        self.linear_steps()
\ No newline at end of file
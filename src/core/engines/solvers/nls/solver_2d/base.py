@@ -1,19 +1,48 @@
-import arrayfire as af
+import math
 
-class SplitStepMethods:
-    def linear_step(self, field, kinetic, dz, step=.5):
+from ..propagators.cache import PropagatorCache
+from ..propagators.phase import PhaseFactors
+from ..schemes.integrators import IntegrationSchemes
+
+class SplitStepMethods(PropagatorCache, PhaseFactors, IntegrationSchemes):
+    @property
+    def nonlinear_kernel(self,):
+        """ "standard" or "fused", from the "nonlinear_kernel" key of the simulation configuration."""
+        if not hasattr(self, "_nonlinear_kernel"):
+            simulation_config = getattr(self, "simulation_config", {})
+            if "nonlinear_kernel" in simulation_config.keys():
+                self.nonlinear_kernel = simulation_config["nonlinear_kernel"]
+            else:
+                self._nonlinear_kernel = "standard"
+        return self._nonlinear_kernel
+    
+    @nonlinear_kernel.setter
+    def nonlinear_kernel(self, value):
+        self._nonlinear_kernel = value.lower()
+        
+    def build_propagator(self, kinetic, dz, step=.5, absorption=0.):
+        """Build the k-space propagator of the linear step.
+
+        Args:
+            kinetic (float): Kinetic coefficient.
+            dz (float): Longitudinal step.
+            step (float, optional): Fraction of dz to propagate. Defaults to .5.
+            absorption (float, optional): Uniform absorption coefficient. Defaults to 0..
+        """
+        k2 = self.k2 if self.lean_mesh else self.kxx**2 + self.kyy**2
+        return self.phase_factor(step*dz * k2 * kinetic, step*dz*absorption)  # minus sign is absorbed in the kinetic coefficient
+
+    def linear_step(self, field, kinetic, dz, step=.5, absorption=0.):
         """Inplace implementation of the linear step of the split-step Fourier method for the 2D NLSE.
 
         Args:
             field (_type_): _description_
             kinetic (_type_): _description_
         """
-        field[:,:] = af.signal.fft2(field)
+        self.ops.fft2_inplace(field)
         
-        exp = af.exp((1j * step*dz * (self.kxx**2 + self.kyy**2) * kinetic))  # minus sign is absorbed in the kinetic coefficient
-        
-        field[:,:] = exp * field
-        field[:,:] = af.signal.ifft2(field)
+        self.ops.multiply_inplace(field, self.propagator(kinetic, dz, step, absorption))
+        self.ops.ifft2_inplace(field)
         
     def absorption_step(self, field, exp):
         """Inplace implementation of the absorption step of the split-step Fourier method for the 2D NLSE.
@@ -25,15 +54,15 @@ class SplitStepMethods:
             np_float (np.float): _description_
             af_complex (af.Dtype.c): _description_
         """
-        field[:, :] = field * exp
+        self.ops.multiply_inplace(field, exp)
         
     @property
     def exp(self,):
-        return af.exp(af.constant(-self.absorption*self.dz, 1, 1, dtype=self.field.dtype()))
+        return math.exp(-self.absorption*self.dz)
 
     @property
     def exp1(self,):
-        return af.exp(af.constant(-self.absorption1*self.dz, 1, 1, dtype=self.field.dtype()))
+        return math.exp(-self.absorption1*self.dz)
         
     def nonlinear_step(self, field, potential):
         """Inplace implementation of the nonlinear step of the split-step Fourier method for the 2D NLSE.
@@ -46,4 +75,20 @@ class SplitStepMethods:
         """
         
         # nonlinear term
-        field[:, :] = af.exp(-1j*self.dz*potential) * field[:, :]
+        self.ops.multiply_inplace(field, self.phase_factor(-self.dz*potential))
+        
+    def fused_nonlinear_step(self, field, potential, absorption=0.):
+        """Nonlinear and absorption steps of the split-step Fourier method built as a single ArrayFire JIT tree.
+
+        The returned array is left unevaluated, so that the fields of a step can be evaluated together with ops.eval.
+        On the NumPy engine the expression is evaluated eagerly.
+
+        Args:
+            field (af.Array): Field to evolve.
+            potential (af.Array): Unevaluated potential field.
+            absorption (float, optional): Absorption coefficient that is not folded in the propagator. Defaults to 0..
+
+        Returns:
+            af.Array: Unevaluated exp(-1j*dz*potential - dz*absorption) * field.
+        """
+        return field * self.phase_factor(-self.dz*potential, self.dz*absorption)
\ No newline at end of file
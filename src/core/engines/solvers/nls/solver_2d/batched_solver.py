@@ -0,0 +1,23 @@
+from .solver import SplitStepSolver
+from .coupled_solver import CoupledSplitStepSolver
+
+from .mesh import BatchedSplitStepMesh, BatchedCoupledSplitStepMesh
+
+class BatchedSplitStepSolver(BatchedSplitStepMesh, SplitStepSolver):
+    """Split-step solver propagating N independent realizations of the field stacked along the third dimension.
+    
+    Realizations are added with push_realization after modulating the field, and retrieved with get_realization after solving.
+    The 2D transforms are batched over the stack, the cached (Nx, Ny) propagators are broadcast over it and the
+    potentials are computed per slice.
+    """
+    pass
+        
+        
+class BatchedCoupledSplitStepSolver(BatchedCoupledSplitStepMesh, CoupledSplitStepSolver):
+    """Coupled split-step solver propagating N independent realizations of both fields stacked along the third dimension.
+    
+    Realizations are added with push_realization after modulating the fields, and retrieved with get_realization and get_realization1 after solving.
+    The 2D transforms are batched over the stack, the cached (Nx, Ny) propagators are broadcast over it and the
+    potentials are computed per slice.
+    """
+    pass
@@ -1,6 +1,4 @@
-import arrayfire as af
-
-from .....arrayfire_utils.facade import Arrayfire
+from .....backends.facade import ArrayBackend
 
 from .....storage.store_methods import CoupledStorageField
 
@@ -10,49 +8,118 @@ from ..iterators.solver import AfTimeSpaceAnalogIterator
 
 from .base import SplitStepMethods
 
-class CoupledSplitStepSolver(CoupledStorageField, Arrayfire, CoupledSplitStepMesh, SplitStepMethods, AfTimeSpaceAnalogIterator):
+class CoupledSplitStepSolver(CoupledStorageField, ArrayBackend, CoupledSplitStepMesh, SplitStepMethods, AfTimeSpaceAnalogIterator):
     @property
     def arrayfire_flag(self,):
-        return True
+        return self.ops.name == "arrayfire"
         
     def init_solver(self,):
         self.set_device()
         
         self.init_mesh()
         
+    def init_propagators(self,):
+        """Build the half-step propagators of both fields once, before the propagation loop."""
+        self.reset_propagators()
+        self.propagator(self.kinetic, self.dz, .5, self.folded_absorption(self.absorption))
+        self.propagator(self.kinetic1, self.dz, .5, self.folded_absorption(self.absorption1))
+        
     def af_get_intensity(self,):
-        return (self.field)*af.conjg(self.field) + (self.field1)*af.conjg(self.field1)
+        """Real-typed total intensity of both fields, in the phase precision."""
+        return self.ops.astype(self.ops.abs2(self.field) + self.ops.abs2(self.field1), self.np_phase)
     
-    def af_potential_function(self,):
-        return self.potential * (self.af_get_intensity() / (self.Isat + self.af_get_intensity()))
+    def af_saturation(self, intensity=None, evaluate=True):
+        """Saturable response I/(Isat + I), evaluated once so that it can be shared by both potentials.
 
-    def af_potential_function1(self,):
-        return self.potential1 * (self.af_get_intensity() / (self.Isat + self.af_get_intensity()))
+        Args:
+            intensity (af.Array, optional): Total intensity. Defaults to the total intensity of the current fields.
+            evaluate (bool, optional): Evaluate the saturation instead of leaving it in the JIT tree. Defaults to True.
+        """
+        if intensity is None:
+            intensity = self.af_get_intensity()
+        saturation = intensity / (self.Isat + intensity)
+        if evaluate:
+            self.ops.eval(saturation)
+        return saturation
+    
+    def af_potential_function(self, saturation=None):
+        if saturation is None:
+            saturation = self.af_saturation()
+        return self.potential * saturation
+
+    def af_potential_function1(self, saturation=None):
+        if saturation is None:
+            saturation = self.af_saturation()
+        return self.potential1 * saturation
         
-    def step_solver(self,):
-        """Inplace single step evolution of the coupled 2D NLSE using the split-step Fourier method.
+    def linear_steps(self, step=.5):
+        """Inplace linear step of both fields.
+
+        Args:
+            step (float, optional): Fraction of dz to propagate. Defaults to .5.
         """
-        # half linear step
-        self.linear_step(self.field, self.kinetic, self.dz)
-        self.linear_step(self.field1, self.kinetic1, self.dz)
+        self.linear_step(self.field, self.kinetic, self.dz, step, self.folded_absorption(self.absorption))
+        self.linear_step(self.field1, self.kinetic1, self.dz, step, self.folded_absorption(self.absorption1))
         
-        # nonlinear step
-        auxiliary_intensity = self.af_potential_function1()
+    def nonlinear_steps(self,):
+        """Inplace nonlinear and absorption steps of both fields. Uniform absorption is left to the propagators."""
+        if self.nonlinear_kernel == "fused":
+            self.fused_nonlinear_steps()
+            return
+        
+        # nonlinear step, total intensity is computed once from the initial step conditions
+        saturation = self.af_saturation()
         self.nonlinear_step(self.field,  # apply nonlinearity in first field.
-                    self.af_potential_function(),
+                    self.af_potential_function(saturation),
                     )
-        # apply nonlinearity in second field with intensity field stored from initial step conditions
+        # apply nonlinearity in second field
         self.nonlinear_step(self.field1,
-                    auxiliary_intensity,
+                    self.af_potential_function1(saturation),
                     )
         
         # absorption step
-        self.absorption_step(self.field, self.exp)
-        self.absorption_step(self.field1, self.exp1)
+        if not self.absorbs_in_propagator(self.absorption):
+            self.absorption_step(self.field, self.exp)
+        if not self.absorbs_in_propagator(self.absorption1):
+            self.absorption_step(self.field1, self.exp1)
+        
+    def fused_nonlinear_steps(self,):
+        """Nonlinear and absorption steps of both fields evaluated together as a single JIT kernel."""
+        saturation = self.af_saturation(evaluate=False)
+        field = self.fused_nonlinear_step(
+            self.field,
+            self.af_potential_function(saturation),
+            self.absorption - self.folded_absorption(self.absorption),  # absorption not applied by the propagator
+        )
+        field1 = self.fused_nonlinear_step(
+            self.field1,
+            self.af_potential_function1(saturation),
+            self.absorption1 - self.folded_absorption(self.absorption1),
+        )
+        self.ops.eval(field, field1)
+        self.field, self.field1 = field, field1
+        
+    def nonlinear_terms(self,):
+        """dz times the nonlinear and absorption terms of both fields, as used by the RK4IP scheme."""
+        saturation = self.af_saturation()
+        absorption = self.absorption - self.folded_absorption(self.absorption)  # absorption not applied by the propagators
+        absorption1 = self.absorption1 - self.folded_absorption(self.absorption1)
+        return (
+            self.ops.astype(self.field * (-1j*self.dz*self.af_potential_function(saturation) - self.dz*absorption), self.np_complex),
+            self.ops.astype(self.field1 * (-1j*self.dz*self.af_potential_function1(saturation) - self.dz*absorption1), self.np_complex),
+        )
+    
+    def strang_step(self,):
+        """Inplace single Strang step evolution of the coupled 2D NLSE using the split-step Fourier method.
+        """
+        # half linear step
+        self.linear_steps()
+        
+        # nonlinear and absorption steps
+        self.nonlinear_steps()
         
         # half linear step
-        self.linear_step(self.field, self.kinetic, self.dz)
-        self.linear_step(self.field1, self.kinetic1, self.dz)
+        self.linear_steps()
         
     def freespace_solver(self, dz, kinetic):
         self.linear_step(self.field1, kinetic, dz, step=1.)
\ No newline at end of file
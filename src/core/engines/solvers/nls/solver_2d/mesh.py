@@ -1,25 +1,158 @@
+from numpy import stack
+
 from .....mesh.z_2d import Mesh2D
 
 class SplitStepMesh(Mesh2D):
     def init_af(self,):
-        self.field = self.np_to_af(self.field)
+        self.init_af_fields()
+        self.init_af_mesh()
+        
+    def init_af_fields(self,):
+        """Upload the field to the device, in the precision of the box. Fields generated on the device stay in place."""
+        self.field = self.ops.astype(self.np_to_af(self.field), self.np_complex)
+        
+    def init_af_mesh(self,):
+        """Upload the k-space grid to the device, load the FFT plans and build the propagators.
 
+        Lean meshes upload kxx**2 + kyy**2 only, their single dense k-space array.
+        """
         self.init_k_grid()
-        self.kxx = self.np_to_af(self.kxx)
-        self.kyy = self.np_to_af(self.kyy)
+        if self.lean_mesh:
+            self.k2 = self.np_to_af(self.kxx**2 + self.kyy**2)
+        else:
+            self.kxx = self.np_to_af(self.kxx)
+            self.kyy = self.np_to_af(self.kyy)
+        self.load_plans()
+        
+        self.init_propagators()
+        
+    @property
+    def grid_key(self,):
+        return (self.Nx, self.Ny, self.dx, self.dy)
+    
+    def get_fields(self, copy=True):
+        """Fields propagated by the solver, copied on the device by default."""
+        return (self.ops.copy(self.field),) if copy else (self.field,)
+    
+    def set_fields(self, fields):
+        """Bind the fields propagated by the solver, as returned by get_fields."""
+        (self.field,) = fields
         
     def end_af(self,):
+        self.end_af_fields()
+        self.end_af_mesh()
+        
+    def end_af_fields(self,):
+        """Close the background writer and download the field from the device."""
+        self.close_storage()
         self.field = self.af_to_np(self.field)
         
-        self.kxx = self.af_to_np(self.kxx)
-        self.kyy = self.af_to_np(self.kyy)
+    def end_af_mesh(self,):
+        """Drop the propagators, store the FFT plans and download the k-space grid from the device."""
+        self.reset_propagators()
+        self.store_plans()
+        
+        if self.lean_mesh:
+            self.k2 = None  # rebuilt by init_af_mesh
+        else:
+            self.kxx = self.af_to_np(self.kxx)
+            self.kyy = self.af_to_np(self.kyy)
 
 
 class CoupledSplitStepMesh(SplitStepMesh):
-    def init_af(self,):
-        super().init_af()
-        self.field1 = self.np_to_af(self.field1)
+    def get_fields(self, copy=True):
+        if copy:
+            return (self.ops.copy(self.field), self.ops.copy(self.field1))
+        return (self.field, self.field1)
+    
+    def set_fields(self, fields):
+        self.field, self.field1 = fields
         
-    def end_af(self,):
-        super().end_af()
-        self.field1 = self.af_to_np(self.field1)
\ No newline at end of file
+    def init_af_fields(self,):
+        super().init_af_fields()
+        self.field1 = self.ops.astype(self.np_to_af(self.field1), self.np_complex)
+        
+    def end_af_fields(self,):
+        super().end_af_fields()
+        self.field1 = self.af_to_np(self.field1)
+
+
+class BatchedSplitStepMesh(SplitStepMesh):
+    """ Split-step mesh propagating a stack of independent realizations of the field along the third dimension.
+
+    The pushed realizations are stacked into the field by the next run, which empties the list for the realizations of
+    the following run, e.g. the next point of a sweep. A field that already holds a batch, e.g. restored from a
+    checkpoint or propagated by a previous run, is propagated as is.
+    """
+    @property
+    def realizations(self,):
+        if not hasattr(self, "_realizations"):
+            self._realizations = []
+        return self._realizations
+    
+    @property
+    def nbatch(self,):
+        """ Number of realizations, the pushed ones until they are stacked into the field."""
+        if self.realizations:
+            return len(self.realizations)
+        return self.field.shape[-1] if len(self.field.shape) > len(self.field_shape) else 0
+    
+    def push_realization(self,):
+        """ Append a copy of the current field to the batch."""
+        self.realizations.append(self.field.copy())
+        
+    def clear_realizations(self,):
+        """ Empty the batch."""
+        self._realizations = []
+        
+    def stack_realizations(self,):
+        """ Stack the realizations into a (Nx, Ny, nbatch) field and empty the list."""
+        if self.realizations:
+            self.field = stack(self.realizations, axis=-1)
+            self.clear_realizations()
+            
+    def get_realization(self, index):
+        """ Get a single realization from the stacked field."""
+        return self.field[..., index]
+    
+    def init_af_fields(self,):
+        """ Stack the pushed realizations and upload the batch.
+
+        Raises:
+            ValueError: In adaptive iteration, whose step-doubling error would be a single norm over the whole batch.
+        """
+        if getattr(self, "iteration_mode", "standard") == "adaptive":
+            raise ValueError("Adaptive steps are chosen from one error norm of the whole batch, solve the realizations separately.")
+        if self.realizations:
+            self.stack_realizations()
+            self.store_field(index="0")  # stored steps share the (Nx, Ny, nbatch) shape of the batch
+        super().init_af_fields()
+        
+
+class BatchedCoupledSplitStepMesh(BatchedSplitStepMesh, CoupledSplitStepMesh):
+    """ Split-step mesh propagating a stack of independent realizations of both coupled fields."""
+    @property
+    def realizations1(self,):
+        if not hasattr(self, "_realizations1"):
+            self._realizations1 = []
+        return self._realizations1
+    
+    def push_realization(self,):
+        """ Append a copy of both current fields to the batch."""
+        super().push_realization()
+        self.realizations1.append(self.field1.copy())
+        
+    def clear_realizations(self,):
+        """ Empty the batch."""
+        super().clear_realizations()
+        self._realizations1 = []
+        
+    def stack_realizations(self,):
+        """ Stack the realizations of both fields into (Nx, Ny, nbatch) fields and empty the lists."""
+        if self.realizations1:
+            self.field1 = stack(self.realizations1, axis=-1)
+        super().stack_realizations()
+            
+    def get_realization1(self, index):
+        """ Get a single realization of the second field from the stacked field."""
+        return self.field1[..., index]
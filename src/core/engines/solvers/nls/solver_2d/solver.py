@@ -1,6 +1,4 @@
-import arrayfire as af
-
-from .....arrayfire_utils.facade import Arrayfire
+from .....backends.facade import ArrayBackend
 
 from .....storage.store_methods import StorageField
 
@@ -12,31 +10,61 @@ from .base import SplitStepMethods
 
 class SplitStepSolver(
     StorageField,
-    Arrayfire,
+    ArrayBackend,
     SplitStepMesh,
     SplitStepMethods,
     AfTimeSpaceAnalogIterator,
 ):
     @property
     def arrayfire_flag(self,):
-        return True
+        return self.ops.name == "arrayfire"
     
     def init_solver(self,):
         self.set_device()
         
         self.init_mesh()
         
+    def init_propagators(self,):
+        """Build the half-step propagator once, before the propagation loop."""
+        self.reset_propagators()
+        self.propagator(self.kinetic, self.dz, .5, self.folded_absorption(self.absorption))
+        
     def af_get_intensity(self,):
-        return (self.field)*af.conjg(self.field)
+        """Real-typed intensity of the field, in the phase precision."""
+        return self.ops.astype(self.ops.abs2(self.field), self.np_phase)
+    
+    def af_saturation(self, intensity=None, evaluate=True):
+        """Saturable response I/(Isat + I), evaluated once so that it can be shared by the potentials.
+
+        Args:
+            intensity (af.Array, optional): Total intensity. Defaults to the intensity of the current field.
+            evaluate (bool, optional): Evaluate the saturation instead of leaving it in the JIT tree. Defaults to True.
+        """
+        if intensity is None:
+            intensity = self.af_get_intensity()
+        saturation = intensity / (self.Isat + intensity)
+        if evaluate:
+            self.ops.eval(saturation)
+        return saturation
     
-    def af_potential_function(self,):
-        return self.potential * (self.af_get_intensity() / (self.Isat + self.af_get_intensity()))
+    def af_potential_function(self, saturation=None):
+        if saturation is None:
+            saturation = self.af_saturation()
+        return self.potential * saturation
     
-    def step_solver(self,):
-        """Inplace single step evolution of the 2D NLSE using the split-step Fourier method.
+    def linear_steps(self, step=.5):
+        """Inplace linear step of the field.
+
+        Args:
+            step (float, optional): Fraction of dz to propagate. Defaults to .5.
         """
-        # half linear step
-        self.linear_step(self.field, self.kinetic, self.dz)
+        self.linear_step(self.field, self.kinetic, self.dz, step, self.folded_absorption(self.absorption))
+        
+    def nonlinear_steps(self,):
+        """Inplace nonlinear and absorption steps of the field. Uniform absorption is left to the propagator."""
+        if self.nonlinear_kernel == "fused":
+            self.fused_nonlinear_steps()
+            return
         
         # nonlinear step
         self.nonlinear_step(
@@ -45,7 +73,32 @@ class SplitStepSolver(
         )
         
         # absorption step
-        self.absorption_step(self.field, self.exp)
+        if not self.absorbs_in_propagator(self.absorption):
+            self.absorption_step(self.field, self.exp)
+    
+    def fused_nonlinear_steps(self,):
+        """Nonlinear and absorption steps of the field evaluated as a single JIT kernel."""
+        self.field = self.fused_nonlinear_step(
+            self.field,
+            self.af_potential_function(self.af_saturation(evaluate=False)),
+            self.absorption - self.folded_absorption(self.absorption),  # absorption not applied by the propagator
+        )
+        self.ops.eval(self.field)
+    
+    def nonlinear_terms(self,):
+        """dz times the nonlinear and absorption terms of the field, as used by the RK4IP scheme."""
+        potential = self.af_potential_function()
+        absorption = self.absorption - self.folded_absorption(self.absorption)  # absorption not applied by the propagator
+        return (self.ops.astype(self.field * (-1j*self.dz*potential - self.dz*absorption), self.np_complex),)
+    
+    def strang_step(self,):
+        """Inplace single Strang step evolution of the 2D NLSE using the split-step Fourier method.
+        """
+        # half linear step
+        self.linear_steps()
+        
+        # nonlinear and absorption steps
+        self.nonlinear_steps()
         
         # half linear step
-        self.linear_step(self.field, self.kinetic, self.dz)
\ No newline at end of file
+        self.linear_steps()
\ No newline at end of file
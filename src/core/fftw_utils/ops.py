@@ -0,0 +1,96 @@
+import os
+import pickle
+import numpy as np
+import pyfftw
+
+from ..numpy_utils.ops import NumpyOps
+from ..backends.threads import set_thread_budget
+
+class FftwOps(NumpyOps):
+    """ pyFFTW array engine of the split-step solvers.
+
+    Elementwise operations are the NumPy ones. Transforms run through FFTW plans built once per (shape, dtype, axes,
+    direction, threads) on SIMD-aligned buffers and executed in place on the fields, which are aligned when uploaded.
+    The accumulated wisdom can be stored and loaded, so that later runs of the same grid skip the planning.
+    """
+    name = "fftw"
+    planner_effort = "FFTW_MEASURE"
+    
+    def __init__(self, threads: int | None = None):
+        super().__init__(threads)
+        self.fftw_threads = threads if threads is not None else os.cpu_count()
+        self.plans = {}
+    
+    def set_device(self, device: int, backend: str):
+        set_thread_budget(self.threads)
+        print("Backend: pyfftw", pyfftw.__version__, "threads:", self.fftw_threads, "planner:", self.planner_effort)
+        
+    def to_device(self, arr):
+        return pyfftw.byte_align(np.ascontiguousarray(arr))
+    
+    def copy(self, arr):
+        """ Aligned copy of arr."""
+        out = pyfftw.empty_aligned(arr.shape, dtype=arr.dtype)
+        out[...] = arr
+        return out
+    
+    def plan(self, shape: tuple, dtype, axes: tuple, direction: str):
+        """ Inplace FFTW plan of a transform, built on an aligned buffer the first time it is requested.
+
+        Args:
+            shape (tuple): Shape of the transformed arrays.
+            dtype: Complex dtype of the transformed arrays.
+            axes (tuple): Transformed axes, the remaining ones are batched.
+            direction (str): "FFTW_FORWARD" or "FFTW_BACKWARD".
+
+        Returns:
+            tuple: The plan and its aligned buffer.
+        """
+        key = (tuple(shape), np.dtype(dtype), axes, direction, self.fftw_threads)
+        if key not in self.plans:
+            buffer = pyfftw.empty_aligned(shape, dtype=dtype)
+            plan = pyfftw.FFTW(
+                buffer,
+                buffer,
+                axes=axes,
+                direction=direction,
+                flags=(self.planner_effort,),
+                threads=self.fftw_threads,
+                )
+            self.plans[key] = (plan, buffer)
+        return self.plans[key]
+    
+    def transform(self, field, axes, direction):
+        """ Inplace transform of field along axes, extra dimensions are batched. The backward transform is normalized."""
+        plan, buffer = self.plan(field.shape, field.dtype, axes, direction)
+        if pyfftw.is_byte_aligned(field) and field.flags.c_contiguous:
+            plan(field, field)
+        else:
+            buffer[...] = field
+            plan(buffer, buffer)
+            field[...] = buffer
+        
+    def fft_inplace(self, field):
+        self.transform(field, (0,), "FFTW_FORWARD")
+        
+    def ifft_inplace(self, field):
+        self.transform(field, (0,), "FFTW_BACKWARD")
+        
+    def fft2_inplace(self, field):
+        self.transform(field, (0, 1), "FFTW_FORWARD")
+        
+    def ifft2_inplace(self, field):
+        self.transform(field, (0, 1), "FFTW_BACKWARD")
+        
+    def load_plans(self, path: str):
+        """ Import the FFTW wisdom stored at path, if any."""
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                pyfftw.import_wisdom(pickle.load(f))
+                
+    def store_plans(self, path: str):
+        """ Export the FFTW wisdom to path. The file is replaced atomically, as sweep workers may share it."""
+        tmp_path = path + ".%d.tmp" % os.getpid()
+        with open(tmp_path, "wb") as f:
+            pickle.dump(pyfftw.export_wisdom(), f)
+        os.replace(tmp_path, path)
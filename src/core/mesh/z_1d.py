@@ -1,6 +1,8 @@
 from numpy import ndarray, array, arange, pi, linspace
 from numpy.fft import fftshift, fftfreq
 
+from ..control.precision_control import PrecisionControl
+
 class Box1D:
     """ Class to store the simulation box configuration."""
     def __init__(
@@ -9,7 +11,12 @@ class Box1D:
         *args,
         **kwargs,
         ):
-        """ Initialize the box variables."""
+        """ Initialize the box variables.
+
+        Keys of the simulation configuration owned by a solver or field feature, e.g. "scheme", "iteration" or "seed",
+        are read from simulation_config by the class of that feature.
+        """
+        self.simulation_config = simulation_config
         self.Nx = simulation_config["Nx"]
         self.Nz = simulation_config["Nz"]
         self.lx = simulation_config["lx"]
@@ -20,7 +27,11 @@ class Box1D:
         if "noise" in simulation_config.keys():
             self.noise = simulation_config["noise"]
 
+        if "precision" in simulation_config.keys():
+            self.precision = simulation_config["precision"]  # "double", "single" or "mixed"
+        
         self.init_metadata()
+        self.init_precision()
                 
         super().__init__(
             *args,
@@ -36,6 +47,16 @@ class Box1D:
         if not hasattr(self, "extent"):
             self.extent = array([x_min, x_max])
             
+    def init_precision(self,):
+        """ Initialize the numpy dtypes of the fields and phases from the precision of the box."""
+        if not hasattr(self, "precision"):
+            self.precision = "double"
+        precision_control = PrecisionControl({"precision": self.precision})
+        self.precision = precision_control.precision
+        self.np_float = precision_control.np_float
+        self.np_complex = precision_control.np_complex
+        self.np_phase = precision_control.np_phase
+            
 class Mesh1D(Box1D):
     """ Class to create a 1D mesh for the position representation of functions."""
     def init_mesh(self,):
@@ -44,9 +65,9 @@ class Mesh1D(Box1D):
         self.init_steps()
         
     def init_steps(self,):
-        """ Initialize the steps in the mesh."""
-        self.dx = self.x[1] - self.x[0]
-        self.dz = self.z[1] - self.z[0]
+        """ Initialize the steps in the mesh. Python floats do not promote single precision arrays to double."""
+        self.dx = float(self.x[1] - self.x[0])
+        self.dz = float(self.z[1] - self.z[0])
         
     def grid(self,):
         """ Initialize the mesh grid for the 1D box."""
@@ -68,7 +89,7 @@ class Mesh1D(Box1D):
             
     def init_k_grid(self,):
         """ Initialize the momentum space grid."""
-        self.kx = 2 * pi * fftfreq(self.Nx, self.dx)
+        self.kx = (2 * pi * fftfreq(self.Nx, self.dx)).astype(self.np_phase)
         
         self.dkx = self.kx[1] - self.kx[0]
         
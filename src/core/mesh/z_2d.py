@@ -3,6 +3,8 @@ from typing import Tuple
 from numpy import meshgrid, pi, cos, sin, ndarray, arange, array, linspace
 from numpy.fft import fftfreq, fftshift
 
+from ..control.precision_control import PrecisionControl
+
 class Box2D:
     """Class to store the simulation box configuration."""
     def __init__(
@@ -11,7 +13,12 @@ class Box2D:
         *args,
         **kwargs,
         ):
-        """Initialize the box variables."""
+        """Initialize the box variables.
+
+        Keys of the simulation configuration owned by a solver or field feature, e.g. "scheme", "iteration" or "seed",
+        are read from simulation_config by the class of that feature.
+        """
+        self.simulation_config = simulation_config
         self.Nx = simulation_config["Nx"]
         self.Ny = simulation_config["Ny"]
         self.Nz = simulation_config["Nz"]
@@ -24,7 +31,11 @@ class Box2D:
         if "noise" in simulation_config.keys():
             self.noise = simulation_config["noise"]
         
+        if "precision" in simulation_config.keys():
+            self.precision = simulation_config["precision"]  # "double", "single" or "mixed"
+        
         self.init_metadata()
+        self.init_precision()
         
         super().__init__(
             *args,
@@ -43,18 +54,51 @@ class Box2D:
             y_max = self.ly/2
         if not hasattr(self, "extent"):
             self.extent = array([x_min, x_max, y_min, y_max])
+            
+    def init_precision(self,):
+        """ Initialize the numpy dtypes of the fields and phases from the precision of the box."""
+        if not hasattr(self, "precision"):
+            self.precision = "double"
+        precision_control = PrecisionControl({"precision": self.precision})
+        self.precision = precision_control.precision
+        self.np_float = precision_control.np_float
+        self.np_complex = precision_control.np_complex
+        self.np_phase = precision_control.np_phase
 
 class Mesh2D(Box2D):
-    """Class to create a 2D mesh for the position representation of functions."""
+    """Class to create a 2D mesh for the position representation of functions.
+
+    The "lean" mesh mode keeps xx, yy, kxx and kyy as broadcastable row and column vectors instead of dense Nx x Ny
+    grids, the split-step solvers only materializing kxx**2 + kyy**2 on the device.
+    """
+    @property
+    def mesh_mode(self,):
+        """ "dense" or "lean", from the "mesh" key of the simulation configuration."""
+        if not hasattr(self, "_mesh_mode"):
+            simulation_config = getattr(self, "simulation_config", {})
+            if "mesh" in simulation_config.keys():
+                self.mesh_mode = simulation_config["mesh"]
+            else:
+                self.mesh_mode = "dense"
+        return self._mesh_mode
+    
+    @mesh_mode.setter
+    def mesh_mode(self, value):
+        self._mesh_mode = value.lower()
+    
+    @property
+    def lean_mesh(self,):
+        return self.mesh_mode == "lean"
+    
     def init_mesh(self,):
         self.init_grid()
         self.init_steps()
         
     def init_steps(self,):
-        """Initialize the steps in the mesh."""
-        self.dx = self.x[1] - self.x[0]
-        self.dy = self.y[1] - self.y[0]
-        self.dz = self.z[1] - self.z[0]
+        """Initialize the steps in the mesh. Python floats do not promote single precision arrays to double."""
+        self.dx = float(self.x[1] - self.x[0])
+        self.dy = float(self.y[1] - self.y[0])
+        self.dz = float(self.z[1] - self.z[0])
         
     def grid(self,):
         """Initialize the mesh grid for the 2D box."""
@@ -62,7 +106,7 @@ class Mesh2D(Box2D):
         self.y = arange(-int(self.Ny/2), int(self.Ny/2)) * self.ly/self.Ny
         
         self.z = linspace(0, self.lz, self.Nz + 1)
-        self.xx, self.yy = meshgrid(self.x, self.y)
+        self.xx, self.yy = meshgrid(self.x, self.y, sparse=self.lean_mesh)
         
     def adim_grid(self,):
         self.x = arange(-int(self.Nx/2), int(self.Nx/2)) * self.adimensionalize_length(self.lx)/self.Nx
@@ -70,7 +114,7 @@ class Mesh2D(Box2D):
         
         self.z = linspace(0, self.adimensionalize_time(self.lz), self.Nz + 1)
 
-        self.xx, self.yy = meshgrid(self.x, self.y)
+        self.xx, self.yy = meshgrid(self.x, self.y, sparse=self.lean_mesh)
         
     def init_grid(self,):
         if hasattr(self, "adimensionalize_length") and hasattr(self, "adimensionalize_time"):
@@ -78,6 +122,16 @@ class Mesh2D(Box2D):
         else:
             self.grid()
         
+    def generation_mesh(self,) -> Tuple[ndarray, ndarray]:
+        """Returns the X and Y grids of the field functions.
+
+        When the fields are generated on the device, the grids are built by the array engine from the 1D axes, without
+        the host meshgrid.
+        """
+        if getattr(self, "device_generation", False):
+            return self.ops.mesh(self.x, self.y)
+        return self.xx, self.yy
+        
     def rotate_mesh(self, angle: float,) -> Tuple[ndarray, ndarray]:
         """Returns the mesh rotated by the given angle in radians.
 
@@ -87,7 +141,8 @@ class Mesh2D(Box2D):
         Returns:
             Tuple[ndarray, ndarray]: Rotated X and Y mesh grids.
         """
-        return self.xx*cos(angle) - self.yy*sin(angle), self.xx*sin(angle) + self.yy*cos(angle)
+        xx, yy = self.generation_mesh()
+        return xx*cos(angle) - yy*sin(angle), xx*sin(angle) + yy*cos(angle)
         
     def init_k_grid(self,):
         """Initialize the k-space mesh."""
@@ -99,4 +154,4 @@ class Mesh2D(Box2D):
         
         self.kz = 2*pi*(fftfreq(self.Nz, self.dz))
         
-        self.kxx, self.kyy = meshgrid(self.kx, self.ky)
\ No newline at end of file
+        self.kxx, self.kyy = meshgrid(self.kx.astype(self.np_phase), self.ky.astype(self.np_phase), sparse=self.lean_mesh)
\ No newline at end of file
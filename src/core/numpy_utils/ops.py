@@ -0,0 +1,123 @@
+import numpy as np
+
+try:
+    import scipy.fft as fft_module
+    SCIPY_FFT = True
+except ImportError:
+    import numpy.fft as fft_module
+    SCIPY_FFT = False
+
+from ..backends.threads import set_thread_budget
+
+class NumpyOps:
+    """ NumPy/SciPy array engine of the split-step solvers.
+
+    Transforms use scipy.fft (pocketfft) with overwrite_x, so complex fields are transformed in place, and a fixed
+    number of workers. Pocketfft keeps its own cache of plans, so repeated transforms of the same shape are preplanned.
+    Falls back to numpy.fft when scipy is not installed.
+    """
+    name = "numpy"
+    
+    def __init__(self, threads: int | None = None):
+        self.threads = threads
+        self.workers = threads if threads is not None else -1  # -1 uses every core
+    
+    def set_device(self, device: int, backend: str):
+        set_thread_budget(self.threads)
+        print("Backend:", "scipy.fft" if SCIPY_FFT else "numpy.fft", "workers:", self.workers)
+        
+    def to_device(self, arr):
+        return np.ascontiguousarray(arr)
+    
+    def to_host(self, arr):
+        return arr
+    
+    def copy(self, arr):
+        return arr.copy()
+    
+    def assign(self, field, value):
+        """ Inplace assignment of value to every element of field."""
+        field[...] = value
+        
+    def transform(self, function, field, axes):
+        """ Inplace transform of field along axes, extra dimensions are batched."""
+        if SCIPY_FFT:
+            out = function(field, axes=axes, overwrite_x=True, workers=self.workers)
+        else:
+            out = function(field, axes=axes)
+        if not np.shares_memory(out, field):
+            field[...] = out
+        
+    def fft_inplace(self, field):
+        self.transform(fft_module.fftn, field, axes=(0,))
+        
+    def ifft_inplace(self, field):
+        self.transform(fft_module.ifftn, field, axes=(0,))
+        
+    def fft2_inplace(self, field):
+        self.transform(fft_module.fftn, field, axes=(0, 1))
+        
+    def ifft2_inplace(self, field):
+        self.transform(fft_module.ifftn, field, axes=(0, 1))
+        
+    def multiply_inplace(self, field, factor):
+        """ Inplace product of field with factor, broadcasting factor over the batch dimensions of field."""
+        if isinstance(factor, np.ndarray) and (factor.ndim < field.ndim):
+            factor = factor.reshape(factor.shape + (1,) * (field.ndim - factor.ndim))
+        np.multiply(field, factor, out=field)
+        
+    def exp(self, x):
+        return np.exp(x)
+    
+    def mod(self, x, y):
+        return np.mod(x, y)
+    
+    def abs2(self, x):
+        """ Real-typed squared modulus."""
+        return x.real**2 + x.imag**2
+    
+    def sqrt(self, x):
+        return np.sqrt(x)
+    
+    def abs(self, x):
+        return np.abs(x)
+    
+    def max(self, x):
+        """ Largest element of x."""
+        return np.max(x)
+    
+    def matmul(self, a, b):
+        return np.matmul(a, b)
+    
+    def normal(self, shape, dtype, seed):
+        """ Standard normal array of a real dtype, drawn from a Philox stream of a given seed."""
+        return np.random.Generator(np.random.Philox(seed)).standard_normal(shape, dtype=dtype)
+    
+    def mesh(self, x, y):
+        """ Broadcastable x and y grids of meshgrid(x, y), as views of the 1D axes."""
+        return self.to_device(x)[None, :], self.to_device(y)[:, None]
+    
+    def angle(self, x):
+        """ Real-typed argument of x, in [-pi, pi]."""
+        return np.angle(x)
+    
+    def norm(self, x):
+        """ Euclidean norm of every element of x."""
+        return float(np.linalg.norm(x))
+    
+    def astype(self, x, dtype):
+        """ Cast x to a numpy dtype, without copy when it already has it."""
+        return x.astype(dtype, copy=False)
+    
+    def load_plans(self, path: str):
+        """ Pocketfft plans are not persistent, nothing to load."""
+        pass
+    
+    def store_plans(self, path: str):
+        pass
+    
+    def eval(self, *arrays):
+        pass
+    
+    def sync(self,):
+        pass
@@ -0,0 +1,55 @@
+import queue
+import threading
+
+class AsyncWriter:
+    """ Background thread running storage jobs from a bounded queue.
+
+    submit blocks while the queue is full, which applies backpressure to the propagation when the disk is slower than
+    the solver. Errors raised by a job are raised again in the calling thread by the next submit or drain.
+    """
+    def __init__(self, queue_size: int = 1):
+        """ Start the writer thread.
+
+        Args:
+            queue_size (int, optional): Jobs waiting while another one is written. Defaults to 1, double buffering.
+        """
+        self.jobs = queue.Queue(maxsize=queue_size)
+        self.error = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        
+    def run(self,):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                self.jobs.task_done()
+                break
+            function, args = job
+            try:
+                if self.error is None:
+                    function(*args)
+            except BaseException as error:
+                self.error = error
+            finally:
+                self.jobs.task_done()
+                
+    def raise_error(self,):
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+        
+    def submit(self, function, *args):
+        """ Queue function(*args), waiting for a free place in the queue."""
+        self.raise_error()
+        self.jobs.put((function, args))
+        
+    def drain(self,):
+        """ Wait until every queued job is written."""
+        self.jobs.join()
+        self.raise_error()
+        
+    def close(self,):
+        """ Drain the queue and stop the writer thread."""
+        self.drain()
+        self.jobs.put(None)
+        self.thread.join()
@@ -0,0 +1,141 @@
+import os
+import h5py
+import pickle
+import numpy as np
+
+def config_mismatches(stored, current, prefix=""):
+    """ Keys of two nested configuration dictionaries whose values differ.
+
+    Args:
+        stored (dict): Configuration stored with the checkpoint.
+        current (dict): Configuration of the resuming box.
+        prefix (str, optional): Key path of the compared dictionaries. Defaults to "".
+
+    Returns:
+        list: Key paths of the differing values.
+    """
+    mismatches = []
+    for key in sorted(set(stored.keys()) | set(current.keys()), key=str):
+        path = prefix + str(key)
+        if (key not in stored) or (key not in current):
+            mismatches.append(path)
+        elif isinstance(stored[key], dict) and isinstance(current[key], dict):
+            mismatches += config_mismatches(stored[key], current[key], path + ".")
+        elif not np.array_equal(stored[key], current[key]):
+            mismatches.append(path)
+    return mismatches
+
+
+class CheckpointStore:
+    """ Periodic checkpoints of the solver state, from which an interrupted propagation is resumed.
+
+    A checkpoint holds the propagated fields in their solver precision and units, the number of steps done, dz, the
+    state of the noise generator, the adaptive step state and the configuration dictionaries of store_configs. It is rewritten
+    atomically, so that a run killed while checkpointing keeps its previous checkpoint.
+    """
+    @property
+    def checkpoint_filename(self,):
+        return "checkpoint.h5"
+
+    def get_checkpoint_directory(self,):
+        """ Get the full directory path of the checkpoint of the current simulation or sweep point."""
+        return self.get_directory(self.point_rel_directory) + self.checkpoint_filename
+
+    def is_checkpoint_step(self, index=None):
+        """ Whether the solver state is checkpointed after the step at a given index."""
+        if not self.checkpoint:
+            return False
+        return index % self.checkpoint == 0
+
+    def checkpoint_step(self, index=None):
+        """ Checkpoint the solver state after the step at a given index, if it is a checkpoint step."""
+        if self.is_checkpoint_step(index):
+            self.store_checkpoint(index)
+
+    def checkpoint_state(self, index):
+        """ Solver state stored with the fields, see load_checkpoint."""
+        return {
+            "z_index": index,
+            "dz": self.dz,
+            "noise_state": self.noise_generator.bit_generator.state if hasattr(self, "noise_generator") else None,
+            "adaptive_level": getattr(self, "adaptive_level", 0),
+            "adaptive_history": getattr(self, "adaptive_history", []),
+            "config_dict": getattr(self, "config_dict", None),
+        }
+
+    def store_checkpoint(self, index):
+        """ Write the fields and solver state after the step at index.
+
+        Stored steps still queued in the background writer are written first, so that every step stored before the
+        checkpoint is on disk when the checkpoint is.
+
+        Args:
+            index (int): Number of steps done.
+        """
+        self.drain_storage()
+        directory = self.get_checkpoint_directory()
+        temporary = directory + f".{os.getpid()}.tmp"
+        with h5py.File(temporary, "w") as hf:
+            for number, field in enumerate(self.get_fields(copy=False)):
+                hf.create_dataset(f"field{number}", data=np.asarray(self.af_to_np(field)))
+            hf.create_dataset("state", data=np.void(pickle.dumps(self.checkpoint_state(index), protocol=pickle.HIGHEST_PROTOCOL)))
+        hf.close()
+        os.replace(temporary, directory)
+
+    @property
+    def resume_config_keys(self,):
+        """ Configuration dictionaries that may change on resume, e.g. to resume on another device."""
+        return ("device_config", "storage_config")
+
+    def check_checkpoint(self, fields, state):
+        """ Raise if the checkpoint was written by a propagation of another configuration than the one of the box.
+
+        The grid of the fields and dz are always compared, the stored configuration dictionaries, except those of
+        resume_config_keys and the noise seed, when both the checkpoint and the box hold them, see store_configs.
+
+        Args:
+            fields (tuple): Fields of the checkpoint.
+            state (dict): Solver state of the checkpoint.
+        """
+        for field in fields:
+            if tuple(field.shape[:len(self.field_shape)]) != tuple(self.field_shape):
+                raise ValueError(f"Checkpoint fields of shape {field.shape} do not match the grid {self.field_shape}.")
+        if state["dz"] != self.dz:
+            raise ValueError(f"Checkpoint dz {state['dz']} does not match the dz {self.dz} of the box.")
+
+        stored, current = state["config_dict"], getattr(self, "config_dict", None)
+        if (stored is None) or (current is None):
+            return
+        stored, current = ({key: value for key, value in config.items() if key not in self.resume_config_keys} for config in (stored, current))
+        mismatches = [key for key in config_mismatches(stored, current) if key != "simulation_config.seed"]
+        if mismatches:
+            raise ValueError(f"Checkpoint configuration differs from the configuration of the box in {', '.join(mismatches)}.")
+
+    def load_checkpoint(self,):
+        """ Restore the fields and solver state of the last checkpoint, the propagation resuming after its step.
+
+        Trajectory files are truncated to the steps stored up to the checkpoint.
+
+        Raises:
+            ValueError: If the checkpoint was written with another configuration, see check_checkpoint.
+        """
+        with h5py.File(self.get_checkpoint_directory(), "r") as hf:
+            fields = tuple(hf[f"field{number}"][()] for number in range(len(hf.keys()) - 1))
+            state = pickle.loads(hf["state"][()].tobytes())
+        hf.close()
+
+        self.check_checkpoint(fields, state)
+        self.set_fields(fields)
+        self.dz = state["dz"]
+        if (state["config_dict"] is not None) and ("seed" in state["config_dict"]["simulation_config"]):
+            self.seed = state["config_dict"]["simulation_config"]["seed"]  # noise of the resumed run
+        if state["noise_state"] is not None:
+            self.noise_generator.bit_generator.state = state["noise_state"]
+        self.adaptive_level = state["adaptive_level"]
+        self.adaptive_history = state["adaptive_history"]
+        self.start_index = state["z_index"]
+
+        if self.storage_format == "trajectory":
+            directories = self.get_trajectory_directory()
+            for directory in directories if isinstance(directories, tuple) else (directories,):
+                self.truncate_trajectory(directory, self.start_index)
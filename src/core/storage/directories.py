@@ -1,4 +1,5 @@
 import os
+import numpy as np
 
 class StorageConfig:
     """ Class to handle storage configuration."""
@@ -13,23 +14,112 @@ class StorageConfig:
         Args:
             storage_config (dict): Dictionary containing storage configuration parameters. With the following keys:
                 - home (str): Base directory for storage.
-                - store (str, optional): Storage mode, either "last" or "stride". Defaults to "last".
-                - stride (int, optional): Stride value for "stride" storage mode. Required if store is "stride".
+                - store (str, optional): Storage mode, "last" for the last step, "stride" for every stride-th step or
+                    "planes" for the steps listed in planes. The initial state and the last step are always stored.
+                    Defaults to "last".
+                - stride (int, optional): Steps between stored steps of the "stride" storage mode. Defaults to 1.
+                - planes (list, optional): Step indices stored by the "planes" storage mode.
+                - window (tuple, optional): (start, stop) grid indices of every transverse dimension stored, e.g.
+                    ((768, 1280), (768, 1280)) for the central 512x512 window of a 2048x2048 grid. Defaults to the whole
+                    grid.
+                - downsample (int | tuple, optional): Stored grid points are every downsample-th point of the window,
+                    per transverse dimension if a tuple. Defaults to 1.
+                - sweep_index (int, optional): Index of the sweep point, results are stored under Sweep/point_<sweep_index>/.
+                - format (str, optional): "files" for one .h5 file per stored step or "trajectory" for a single
+                    trajectory.h5 file per field with a (steps, Nx, Ny) dataset chunked per step. Defaults to "files".
+                - compression (str, optional): h5py compression filter of the trajectory, e.g. "gzip" or "lzf".
+                    Defaults to None.
+                - compression_opts (int, optional): Options of the compression filter, e.g. the gzip level.
+                - quantity (str, optional): Stored quantity, "field" for the complex field, "intensity" for its squared
+                    modulus or "amplitude_phase" for its modulus and argument stacked along a trailing dimension of size 2.
+                    Intensities and amplitudes are computed on the device, before the download. Defaults to "field".
+                - dtype (str, optional): Stored dtype of the "intensity" and "amplitude_phase" quantities, e.g. "float32"
+                    or "float16". Defaults to "float32".
+                - checkpoint (int, optional): Steps between checkpoints of the solver state, from which resume continues
+                    an interrupted propagation. Defaults to None, no checkpoints.
+                - async (bool, optional): Write the stored steps from a background thread while the propagation
+                    continues. Defaults to False.
+                - queue_size (int, optional): Snapshots waiting for the background writer before the propagation
+                    blocks. Defaults to 1.
         """
         self.home = storage_config["home"]
         
+        if "sweep_index" in storage_config.keys():
+            self.sweep_index = storage_config["sweep_index"]
+        
         if "store" in storage_config.keys():
             self.store = storage_config["store"]
         else:
             self.store = "last"
         
-        if hasattr(self, "stride"):
-            if self.store.lower() == "stride":
-                self.stride = storage_config["stride"]
+        if "format" in storage_config.keys():
+            self.storage_format = storage_config["format"].lower()
+        else:
+            self.storage_format = "files"
+            
+        if "compression" in storage_config.keys():
+            self.compression = storage_config["compression"]
+        else:
+            self.compression = None
+            
+        if "compression_opts" in storage_config.keys():
+            self.compression_opts = storage_config["compression_opts"]
+        else:
+            self.compression_opts = None
+        
+        if "quantity" in storage_config.keys():
+            self.storage_quantity = storage_config["quantity"].lower()
+        else:
+            self.storage_quantity = "field"
+        if self.storage_quantity not in ("field", "intensity", "amplitude_phase"):
+            raise ValueError(f"Unknown stored quantity {self.storage_quantity}, use field, intensity or amplitude_phase.")
+            
+        if "dtype" in storage_config.keys():
+            self.storage_dtype = np.dtype(storage_config["dtype"])
+        else:
+            self.storage_dtype = np.dtype(np.float32)
+        
+        if "checkpoint" in storage_config.keys():
+            self.checkpoint = storage_config["checkpoint"]
+        else:
+            self.checkpoint = None
+        
+        if "async" in storage_config.keys():
+            self.async_storage = storage_config["async"]
+        else:
+            self.async_storage = False
+            
+        if "queue_size" in storage_config.keys():
+            self.queue_size = storage_config["queue_size"]
+        else:
+            self.queue_size = 1
+        
+        if self.store.lower() == "stride":
+            if "stride" in storage_config.keys():
+                self.stride = int(storage_config["stride"])
             else:
-                self.stride = None
+                self.stride = 1
+            if self.stride < 1:
+                raise ValueError(f"Storage stride must be a positive number of steps, got {self.stride}.")
         else:
             self.stride = None
+            
+        if self.store.lower() == "planes":
+            if "planes" not in storage_config.keys():
+                raise ValueError("The planes storage mode needs the step indices to store in a planes key.")
+            self.planes = sorted(set(int(index) for index in storage_config["planes"]))
+        else:
+            self.planes = None
+            
+        if "window" in storage_config.keys():
+            self.window = storage_config["window"]
+        else:
+            self.window = None
+            
+        if "downsample" in storage_config.keys():
+            self.downsample = storage_config["downsample"]
+        else:
+            self.downsample = 1
         
         self.endswith_dash()
         
@@ -42,6 +132,39 @@ class StorageConfig:
         """ Ensure the home directory ends with a slash."""
         if not self.home.endswith("/"):
             self.home += "/"
+            
+    @property
+    def storage_steps(self,):
+        """ Number of steps of the stored propagation, the grid steps for boxes that only load."""
+        if hasattr(self, "Nsteps"):
+            return self.Nsteps
+        return self.Nz
+    
+    def is_stored_step(self, index=None):
+        """ Whether the step at a given index is written to storage.
+
+        Args:
+            index (int, optional): step index. Defaults to None.
+
+        Returns:
+            bool: True if store_step writes the step.
+        """
+        if index == self.storage_steps:
+            return True  # the propagated state is stored whatever the stride or planes
+        if self.store.lower() == "last":
+            return False
+        elif self.store.lower() == "stride":
+            return index % self.stride == 0
+        elif self.store.lower() == "planes":
+            return index in self.planes
+        return False
+    
+    @property
+    def stored_indices(self,):
+        """ Step indices written to storage, the initial state included."""
+        if self.store.lower() == "last":
+            return [0, self.storage_steps]
+        return [0] + [index for index in range(1, self.storage_steps + 1) if self.is_stored_step(index)]
         
 class FolderMethods(StorageConfig):
     def __init__(
@@ -60,13 +183,13 @@ class FolderMethods(StorageConfig):
     def home_folder(self,):
         """ Ensure the home folder exists."""
         if not os.path.exists(self.home):
-            os.makedirs(self.home)
+            os.makedirs(self.home, exist_ok=True)  # other sweep workers may create it concurrently
     
     def make_folder(self, relative_directory,):
         """ Create a folder at the specified relative directory if it does not exist."""
         self.home_folder()
         if not os.path.exists(self.home + relative_directory):
-            os.makedirs(self.home + relative_directory)
+            os.makedirs(self.home + relative_directory, exist_ok=True)
             
     def get_directory(self, relative_directory=""):
         """ Get the full directory path for a given relative directory, creating it if necessary."""
@@ -89,9 +212,20 @@ class FieldDirectories(FolderMethods):
             )
         self.make_folder(relative_directory = self.field_rel_directory)
         
+    @property
+    def point_rel_directory(self,):
+        """ Relative directory of the current sweep point, empty outside of sweeps."""
+        if getattr(self, "sweep_index", None) is None:
+            return ""
+        return self.sweep_rel_directory + "point_" + str(self.sweep_index) + "/"
+    
+    @property
+    def sweep_rel_directory(self,):
+        return "Sweep/"
+        
     @property
     def field_rel_directory(self,):
-        return "Field/"
+        return self.point_rel_directory + "Field/"
         
     def automatic_stride(self,):
         """ Automatically manage stride count for field storage."""
@@ -118,6 +252,14 @@ class FieldDirectories(FolderMethods):
         self.automatic_stride()
         return self.get_directory(self.field_rel_directory) + self.field_filename(index)
     
+    @property
+    def trajectory_filename(self,):
+        return "trajectory.h5"
+    
+    def get_trajectory_directory(self,):
+        """ Get the full directory path for the trajectory file of the field."""
+        return self.get_directory(self.field_rel_directory) + self.trajectory_filename
+    
 class CoupledFieldDirectories(FieldDirectories):
     def __init__(
         self,
@@ -133,10 +275,16 @@ class CoupledFieldDirectories(FieldDirectories):
         
     @property
     def field_rel_directory1(self,):
-        return "Field1/"
+        return self.point_rel_directory + "Field1/"
         
     def get_field_directory(self, index=None):
         """ Get the full directory paths for both coupled fields based on the storage mode and index."""
         field_directory = super().get_field_directory(index)
         field1_directory = self.get_directory(self.field_rel_directory1) + self.field_filename(index)
-        return field_directory, field1_directory
\ No newline at end of file
+        return field_directory, field1_directory
+    
+    def get_trajectory_directory(self,):
+        """ Get the full directory paths for the trajectory files of both coupled fields."""
+        trajectory_directory = super().get_trajectory_directory()
+        trajectory1_directory = self.get_directory(self.field_rel_directory1) + self.trajectory_filename
+        return trajectory_directory, trajectory1_directory
\ No newline at end of file
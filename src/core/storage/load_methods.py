@@ -3,6 +3,7 @@ import numpy as np
 
 from .directories import FieldDirectories
 from .directories import CoupledFieldDirectories
+from .trajectory_view import TrajectoryView
 
 class LoadField(FieldDirectories):
     """ Class to load simulation fields from storage."""
@@ -19,6 +20,113 @@ class LoadField(FieldDirectories):
             field = f["field"][:]
         f.close()
         return field
+    
+    def get_field_dtype(
+        self,
+        directory: str,
+        ):
+        """ Get the dtype of the field stored in directory, without reading the field.
+
+        Args:
+            directory (str): Directory of the field .h5 file.
+        """
+        with h5py.File(directory, "r") as f:
+            dtype = f["field"].dtype
+        f.close()
+        return dtype
+    
+    def get_field_shape(
+        self,
+        directory: str,
+        ):
+        """ Get the shape of the field stored in directory, the stored window and downsampling applied.
+
+        Args:
+            directory (str): Directory of the field .h5 file.
+        """
+        with h5py.File(directory, "r") as f:
+            shape = f["field"].shape
+        f.close()
+        return shape
+    
+    def get_field_quantity(
+        self,
+        directory: str,
+        ):
+        """ Get the quantity stored in directory, "field", "intensity" or "amplitude_phase".
+
+        Args:
+            directory (str): Directory of the field or trajectory .h5 file.
+        """
+        with h5py.File(directory, "r") as f:
+            quantity = f["field"].attrs.get("quantity", "field")
+        f.close()
+        return quantity
+    
+    def get_field_seed(
+        self,
+        directory: str,
+        ):
+        """ Get the noise seed of the run stored in directory, None if it was not recorded.
+
+        Args:
+            directory (str): Directory of the field or trajectory .h5 file.
+        """
+        with h5py.File(directory, "r") as f:
+            seed = f["field"].attrs.get("seed", None)
+        f.close()
+        return None if seed is None else int(seed)
+    
+    def stored_intensity(self, stored, quantity="field"):
+        """ Intensity of stored steps, whatever their stored quantity.
+
+        Args:
+            stored (ndarray): Stored steps, as loaded from storage.
+            quantity (str, optional): Stored quantity, see get_field_quantity. Defaults to "field".
+        """
+        if quantity == "intensity":
+            return stored
+        elif quantity == "amplitude_phase":
+            return stored[..., 0]**2
+        return np.abs(stored)**2
+    
+    def get_trajectory(
+        self,
+        directory: str,
+        z = None,
+        window: tuple = None,
+        ):
+        """ Read a range of stored steps and a subwindow from a trajectory file. Only the requested steps are read.
+
+        Args:
+            directory (str): Directory of the trajectory .h5 file.
+            z (int | slice | list, optional): Positions of the stored steps to read, lists must be increasing.
+                Defaults to every stored step.
+            window (tuple, optional): Slices of the transverse dimensions, e.g. (slice(512, 1536), slice(512, 1536)).
+                Defaults to the whole field.
+        """
+        if z is None:
+            z = slice(None)
+        if window is None:
+            window = ()
+        with h5py.File(directory, "r") as f:
+            field = f["field"][(z, *window)]
+        f.close()
+        return field
+    
+    def get_trajectory_indices(
+        self,
+        directory: str,
+        ):
+        """ Get the step indices of the slices of a trajectory file.
+
+        Args:
+            directory (str): Directory of the trajectory .h5 file.
+        """
+        with h5py.File(directory, "r") as f:
+            z_index = f["z_index"][:]
+        f.close()
+        return z_index
 
 class LoadSimulation(LoadField):
     """ Class to load entire simulation fields from storage."""
@@ -29,20 +137,63 @@ class LoadSimulation(LoadField):
     def get_input_field(self,):
         return self.get_field(self.get_field_directory(0))
     
-    def mount_field(self, index = None):
-        """ Load a specific field and mount it into the fields array."""
-        self.fields[index] = self.get_field(self.get_field_directory(index))
+    def mount_field(self, index = None, position = None):
+        """ Load a specific field and mount it into the fields array, at position if given."""
+        self.fields[index if position is None else position] = self.get_field(self.get_field_directory(index))
+    
+    def load_trajectory(self, z=None, window=None):
+        """ Load a range of stored steps and a subwindow of the trajectory into the fields array.
+
+        Args:
+            z (int | slice | list, optional): Positions of the stored steps to read. Defaults to every stored step.
+            window (tuple, optional): Slices of the transverse dimensions. Defaults to the whole field.
+        """
+        self.fields = self.get_trajectory(self.get_trajectory_directory(), z, window)
+        self.z_index = self.get_trajectory_indices(self.get_trajectory_directory())
+        
+    def stored_field_directories(self,):
+        """ Directories of the stored steps, in the order of stored_indices."""
+        last = self.store.lower() == "last"
+        return [self.get_field_directory("last" if (last and index) else index) for index in self.stored_indices]
     
-    def load_field(self,):
-        """ Load the entire simulation fields from storage."""
+    def view_field(self, cache_size=None):
+        """ Lazy view of the stored steps of the field, read on demand.
+
+        Args:
+            cache_size (int, optional): Bytes of compressed steps kept in memory. Defaults to 1 GiB.
+
+        Returns:
+            TrajectoryView: Array-like view indexed as view[z, x, y].
+        """
+        if self.storage_format == "trajectory":
+            return TrajectoryView.from_trajectory(self.get_trajectory_directory(), cache_size)
+        return TrajectoryView.from_files(self.stored_field_directories(), self.stored_indices, cache_size)
+        
+    def load_field(self, lazy=False, cache_size=None):
+        """ Load the entire simulation fields from storage, in their stored precision.
+
+        Args:
+            lazy (bool, optional): Mount a TrajectoryView instead of reading every stored step. Defaults to False.
+            cache_size (int, optional): Bytes of compressed steps kept in memory by the view. Defaults to 1 GiB.
+        """
+        if lazy:
+            self.fields = self.view_field(cache_size)
+            self.z_index = self.fields.z_index
+            return
+        if self.storage_format == "trajectory":
+            self.load_trajectory()
+            return
+        dtype = self.get_field_dtype(self.get_field_directory(0))
+        shape = self.get_field_shape(self.get_field_directory(0))
+        self.z_index = np.array(self.stored_indices)
         if self.store.lower() == "last":
-            self.fields = np.zeros((2, *self.field_shape), dtype=np.complex128)
+            self.fields = np.zeros((2, *shape), dtype=dtype)
             self.fields[0] = self.get_input_field()
             self.fields[1] = self.get_last_field()
         else:
-            self.fields = np.zeros((self.Nsteps+1, *self.field_shape), dtype=np.complex128)
-            for i in range(self.Nsteps + 1):
-                self.mount_field(index = i)
+            self.fields = np.zeros((len(self.z_index), *shape), dtype=dtype)
+            for position, index in enumerate(self.z_index):
+                self.mount_field(index = index, position = position)
                 
 class LoadCoupledSimulation(CoupledFieldDirectories, LoadSimulation):
     """ Class to load entire coupled simulation fields from storage."""
@@ -53,18 +204,19 @@ class LoadCoupledSimulation(CoupledFieldDirectories, LoadSimulation):
     def get_input_field(self,):
         return self.get_field(self.get_field_directory(0)[0])
     
-    def mount_field(self, index = None):
-        """ Load a specific field and mount it into the fields array."""
-        self.fields[index] = self.get_field(self.get_field_directory(index)[0])
+    def mount_field(self, index = None, position = None):
+        """ Load a specific field and mount it into the fields array, at position if given."""
+        self.fields[index if position is None else position] = self.get_field(self.get_field_directory(index)[0])
     
-    def mount_field1(self, index = None):
-        """ Load a specific field and mount it into the fields array."""
-        self.fields1[index] = self.get_field(self.get_field_directory(index)[1])
+    def mount_field1(self, index = None, position = None):
+        """ Load a specific field and mount it into the fields array, at position if given."""
+        self.fields1[index if position is None else position] = self.get_field(self.get_field_directory(index)[1])
     
-    def mount_fields(self, index = None):
-        """ Mount fields."""
-        self.fields[index] = self.get_field(self.get_field_directory(index)[0])
-        self.fields1[index] = self.get_field(self.get_field_directory(index)[1])
+    def mount_fields(self, index = None, position = None):
+        """ Mount fields, at position if given."""
+        position = index if position is None else position
+        self.fields[position] = self.get_field(self.get_field_directory(index)[0])
+        self.fields1[position] = self.get_field(self.get_field_directory(index)[1])
     
     def get_input_field1(self,):
         return self.get_field(self.get_field_directory(0)[1])
@@ -73,42 +225,91 @@ class LoadCoupledSimulation(CoupledFieldDirectories, LoadSimulation):
         """ Load the last stored field into the fields array."""
         return self.get_field(self.get_field_directory("last")[1])
 
-    def load_field(self,):
-        """ Load the entire simulation fields from storage."""
+    def load_trajectory(self, z=None, window=None):
+        """ Load a range of stored steps and a subwindow of the trajectory of the first field."""
+        self.fields = self.get_trajectory(self.get_trajectory_directory()[0], z, window)
+        self.z_index = self.get_trajectory_indices(self.get_trajectory_directory()[0])
+        
+    def load_trajectory1(self, z=None, window=None):
+        """ Load a range of stored steps and a subwindow of the trajectory of the second field."""
+        self.fields1 = self.get_trajectory(self.get_trajectory_directory()[1], z, window)
+        self.z_index = self.get_trajectory_indices(self.get_trajectory_directory()[1])
+        
+    def view_field(self, cache_size=None):
+        """ Lazy view of the stored steps of the first field, read on demand."""
+        if self.storage_format == "trajectory":
+            return TrajectoryView.from_trajectory(self.get_trajectory_directory()[0], cache_size)
+        directories = [directory[0] for directory in self.stored_field_directories()]
+        return TrajectoryView.from_files(directories, self.stored_indices, cache_size)
+    
+    def view_field1(self, cache_size=None):
+        """ Lazy view of the stored steps of the second field, read on demand."""
+        if self.storage_format == "trajectory":
+            return TrajectoryView.from_trajectory(self.get_trajectory_directory()[1], cache_size)
+        directories = [directory[1] for directory in self.stored_field_directories()]
+        return TrajectoryView.from_files(directories, self.stored_indices, cache_size)
+    
+    def load_field(self, lazy=False, cache_size=None):
+        """ Load the entire simulation fields from storage, in their stored precision, as a TrajectoryView if lazy."""
+        if lazy:
+            self.fields = self.view_field(cache_size)
+            self.z_index = self.fields.z_index
+            return
+        if self.storage_format == "trajectory":
+            self.load_trajectory()
+            return
+        dtype = self.get_field_dtype(self.get_field_directory(0)[0])
+        shape = self.get_field_shape(self.get_field_directory(0)[0])
+        self.z_index = np.array(self.stored_indices)
         if self.store.lower() == "last":
-            self.fields = np.zeros((2, *self.field_shape), dtype=np.complex128)
+            self.fields = np.zeros((2, *shape), dtype=dtype)
             self.fields[0] = self.get_input_field()
             self.fields[1] = self.get_last_field()
         else:
-            self.fields = np.zeros((self.Nsteps+1, *self.field_shape), dtype=np.complex128)
-            for i in range(self.Nsteps + 1):
-                self.mount_field(index = i)
+            self.fields = np.zeros((len(self.z_index), *shape), dtype=dtype)
+            for position, index in enumerate(self.z_index):
+                self.mount_field(index = index, position = position)
     
-    def load_field1(self,):
-        """ Load the entire simulation fields from storage."""
+    def load_field1(self, lazy=False, cache_size=None):
+        """ Load the entire simulation fields from storage, in their stored precision, as a TrajectoryView if lazy."""
+        if lazy:
+            self.fields1 = self.view_field1(cache_size)
+            self.z_index = self.fields1.z_index
+            return
+        if self.storage_format == "trajectory":
+            self.load_trajectory1()
+            return
+        dtype = self.get_field_dtype(self.get_field_directory(0)[1])
+        shape = self.get_field_shape(self.get_field_directory(0)[1])
+        self.z_index = np.array(self.stored_indices)
         if self.store.lower() == "last":
-            self.fields1 = np.zeros((2, *self.field_shape), dtype=np.complex128)
+            self.fields1 = np.zeros((2, *shape), dtype=dtype)
             self.fields1[0] = self.get_input_field1()
             self.fields1[1] = self.get_last_field1()
         else:
-            self.fields1 = np.zeros((self.Nsteps+1, *self.field_shape), dtype=np.complex128)
-            for i in range(self.Nsteps + 1):
-                self.mount_field1(index = i)
+            self.fields1 = np.zeros((len(self.z_index), *shape), dtype=dtype)
+            for position, index in enumerate(self.z_index):
+                self.mount_field1(index = index, position = position)
         
     def load_fields(
         self,
         field_number = None,
+        lazy = False,
+        cache_size = None,
     ):
         if field_number == 0:
-            self.load_field()
+            self.load_field(lazy, cache_size)
         elif field_number == 1:
-            self.load_field1()
+            self.load_field1(lazy, cache_size)
         else:
-            if self.store.lower() == "last":
-                self.load_field()
-                self.load_field1()
-            elif self.store.lower() == "stride":
-                self.fields = np.zeros((self.Nsteps+1, *self.field_shape), dtype=np.complex128)
-                self.fields1 = np.zeros((self.Nsteps+1, *self.field_shape), dtype=np.complex128)
-                for i in range(self.Nsteps + 1):
-                    self.mount_fields(index = i)
\ No newline at end of file
+            if lazy or (self.store.lower() == "last") or (self.storage_format == "trajectory"):
+                self.load_field(lazy, cache_size)
+                self.load_field1(lazy, cache_size)
+            else:
+                dtype = self.get_field_dtype(self.get_field_directory(0)[0])
+                shape = self.get_field_shape(self.get_field_directory(0)[0])
+                self.z_index = np.array(self.stored_indices)
+                self.fields = np.zeros((len(self.z_index), *shape), dtype=dtype)
+                self.fields1 = np.zeros((len(self.z_index), *shape), dtype=dtype)
+                for position, index in enumerate(self.z_index):
+                    self.mount_fields(index = index, position = position)
\ No newline at end of file
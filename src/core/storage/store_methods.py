@@ -1,7 +1,23 @@
 import h5py
+import zlib
 import pickle
+import numpy as np
 
 from .directories import FieldDirectories, CoupledFieldDirectories
+from .async_writer import AsyncWriter
+from .checkpoint import CheckpointStore
+from ..numpy_utils.ops import NumpyOps
+
+
+HOST_OPS = NumpyOps()
+
+
+def host_snapshot(field):
+    """ Host copy of a field, device arrays are downloaded into a new host array."""
+    if isinstance(field, np.ndarray):
+        return field.copy()
+    return np.asarray(field)
+
 
 
 class StoreConfig:
@@ -24,6 +40,9 @@ class StoreConfig:
             modulation_config (dict): Modulation configuration dictionary.
             storage_config (dict): Storage configuration dictionary.
         """
+        if getattr(self, "seed", None) is not None:
+            simulation_config = {**simulation_config, "seed": self.seed}  # reproduce the noise of runs without a configured seed
+        
         config_dict = {
             "medium_config": crystal_config,
             "beam_config": beam_config,
@@ -33,60 +52,221 @@ class StoreConfig:
             "storage_config": storage_config,   
         }
 
-        with open(self.get_directory("config_dicts.pickle"), "wb") as fpkl:
+        self.config_dict = config_dict
+        self.make_folder(self.point_rel_directory)
+        with open(self.get_directory(self.point_rel_directory + "config_dicts.pickle"), "wb") as fpkl:
             pickle.dump(config_dict, fpkl, protocol=pickle.HIGHEST_PROTOCOL)
         fpkl.close()
 
-class StorageField(FieldDirectories, StoreConfig):
-    """ Class to store simulation fields to storage."""
+class StoragePolicy:
+    """ Decides which part of the grid of the stored steps, see StorageConfig.is_stored_step, is written to storage."""
+    @property
+    def storage_slices(self,):
+        """ Slices of the transverse dimensions written to storage."""
+        ndim = len(self.field_shape)
+        window = self.window if self.window is not None else ((None, None),) * ndim
+        downsample = self.downsample if isinstance(self.downsample, (tuple, list)) else (self.downsample,) * ndim
+        return tuple(slice(start, stop, step) for (start, stop), step in zip(window, downsample))
+    
+    def reduce_field(self, field):
+        """ Stored subwindow and downsampled grid of a field, sliced on the device before any download.
+
+        Batched fields keep their trailing batch dimension.
+        """
+        if (self.window is None) and (self.downsample == 1):
+            return field
+        return field[self.storage_slices]
+    
     def store_step(self, index=None):
-        """ Store the field at a given step based on storage mode.
+        """ Store the field(s) at a given step based on storage mode.
 
         Args:
-            index (_type_, optional): step index to store. Defaults to None.
+            index (str | int, optional): step index to store. Defaults to None.
         """
-        if self.store.lower() == "last":
-            if index == self.Nsteps:
+        if self.is_stored_step(index):
+            if self.store.lower() == "last":
                 self.store_field(index="last")
-        elif self.store.lower() == "stride":
-            self.store_field(index=index)
+            else:
+                self.store_field(index=index)
+
+class TrajectoryStore:
+    """ Appends the stored steps of a field to a single HDF5 file.
+
+    The file holds an extendable "field" dataset of shape (steps, *field_shape), chunked per step so that any range of
+    steps or subwindow is read without touching the other steps, and a "z_index" dataset with the step index of every
+    stored slice. Storing the step 0 starts a new trajectory.
+    """
+    def trajectory_index(self, index=None):
+        """ Integer step index of a stored step, "last" being the last step."""
+        if (index is None) or (str(index).lower() == "last"):
+            return self.Nsteps
+        return int(index)
     
-    def store_field(self, index = None):
-        """ Store the field to storage.
+    def append_trajectory(self, directory, field, index=None):
+        """ Append a field to the trajectory file at directory.
 
         Args:
-            index (_type_, optional): step index to store. Defaults to None.
+            directory (str): Directory of the trajectory .h5 file.
+            field (ndarray): Field of the stored step.
+            index (str | int, optional): step index to store. Defaults to None.
         """
-        file_dir = self.get_field_directory(index)
-        with h5py.File(file_dir, "w") as hf:
-            hf.create_dataset("field", data=self.field)
+        field = np.asarray(field)  # device arrays are downloaded
+        z_index = self.trajectory_index(index)
+        with h5py.File(directory, "w" if z_index == 0 else "a") as hf:
+            if "field" not in hf:
+                hf.create_dataset(
+                    "field",
+                    shape=(0, *field.shape),
+                    maxshape=(None, *field.shape),
+                    chunks=(1, *field.shape),
+                    dtype=field.dtype,
+                    compression=self.compression,
+                    compression_opts=self.compression_opts,
+                    )
+                self.write_field_attrs(hf["field"])
+                hf.create_dataset("z_index", shape=(0,), maxshape=(None,), chunks=True, dtype="int64")
+            dataset, indices = hf["field"], hf["z_index"]
+            dataset.resize(dataset.shape[0] + 1, axis=0)
+            indices.resize(indices.shape[0] + 1, axis=0)
+            if self.compression == "gzip":
+                self.write_gzip_chunk(dataset, field)
+            else:
+                dataset[-1] = field
+            indices[-1] = z_index
         hf.close()
 
+    def truncate_trajectory(self, directory, index):
+        """ Drop the slices of a trajectory file stored after the step at index.
 
-class CoupledStorageField(CoupledFieldDirectories, StoreConfig):
-    """ Class to handle storage of coupled simulation fields."""
-    def store_step(self, index =None):
-        """ Store the coupled fields at a given step based on storage mode.
+        Args:
+            directory (str): Directory of the trajectory .h5 file.
+            index (int): Last step index kept.
+        """
+        with h5py.File(directory, "a") as hf:
+            dataset, indices = hf["field"], hf["z_index"]
+            kept = int(np.sum(indices[:] <= index))
+            dataset.resize(kept, axis=0)
+            indices.resize(kept, axis=0)
+        hf.close()
+        
+    def write_gzip_chunk(self, dataset, field):
+        """ Write a field as the last chunk of a gzip compressed dataset, deflating it with zlib.
+
+        h5py holds the GIL through its filter pipeline, zlib releases it, so that compression from the background writer
+        overlaps with the propagation.
+        """
+        level = 4 if self.compression_opts is None else self.compression_opts  # h5py gzip default
+        chunk = zlib.compress(np.ascontiguousarray(field, dtype=dataset.dtype).tobytes(), level)
+        dataset.id.write_direct_chunk((dataset.shape[0] - 1,) + (0,) * field.ndim, chunk)
+
+class FieldWriter:
+    """ Writes stored fields synchronously, or from a background writer thread when storage is asynchronous."""
+    @property
+    def async_writer(self,):
+        if not hasattr(self, "_async_writer"):
+            self._async_writer = AsyncWriter(self.queue_size)
+        return self._async_writer
+    
+    def drain_storage(self,):
+        """ Wait until the background writer has written every stored step."""
+        if hasattr(self, "_async_writer"):
+            self._async_writer.drain()
+            
+    def close_storage(self,):
+        """ Write every stored step and stop the background writer, a new one is started by the next run."""
+        if hasattr(self, "_async_writer"):
+            self._async_writer.close()
+            del self._async_writer
+            
+    def write_fields(self, directories, fields, index=None):
+        """ Write fields to their directories.
+
+        Asynchronous writes take a host snapshot of the fields first, as the solver keeps updating them in place.
 
         Args:
+            directories (tuple): Directories of the .h5 files, one per field.
+            fields (tuple): Fields to write.
             index (str | int, optional): step index to store. Defaults to None.
         """
-        if self.store.lower() == "last":
-            if index == self.Nsteps:
-                self.store_field(index="last")
-        elif self.store.lower() == "stride":
-            self.store_field(index=index)
+        fields = tuple(self.reduce_field(field) for field in fields)
+        if self.storage_quantity != "field":
+            fields = tuple(self.field_quantity(field) for field in fields)  # new host arrays
+        elif self.async_storage:
+            fields = tuple(host_snapshot(field) for field in fields)
+            
+        if self.async_storage:
+            self.async_writer.submit(self.write_host_fields, directories, fields, index)
+        else:
+            self.write_host_fields(directories, fields, index)
+            
+    def field_quantity(self, field):
+        """ Stored intensity or amplitude and phase of a field, computed by the array engine before the download.
+
+        They are downloaded in at most single precision and cast to the stored dtype on the host, so that half precision
+        outputs do not depend on the half precision support of the device.
+
+        Args:
+            field (array): Field on the device, or on the host before init_af and after end_af.
+
+        Returns:
+            ndarray: Intensity, or amplitude and phase stacked along a trailing dimension.
+        """
+        ops = HOST_OPS if isinstance(field, np.ndarray) else self.ops
+        if self.storage_quantity == "intensity":
+            quantities = (ops.abs2(field),)
+        else:
+            quantities = (ops.sqrt(ops.abs2(field)), ops.angle(field))
+        
+        download_dtype = np.float32 if self.storage_dtype.itemsize <= 4 else np.float64
+        quantities = [ops.to_host(ops.astype(quantity, download_dtype)).astype(self.storage_dtype, copy=False) for quantity in quantities]
+        if len(quantities) == 1:
+            return quantities[0]
+        return np.stack(quantities, axis=-1)
+            
+    def write_field_attrs(self, dataset):
+        """ Write the stored quantity and, for noisy runs, the noise seed to the attributes of a field dataset.
+
+        The seed defaults to fresh entropy, too large for an HDF5 integer, and is written as a decimal string.
+        """
+        dataset.attrs["quantity"] = self.storage_quantity
+        if getattr(self, "seed", None) is not None:
+            dataset.attrs["seed"] = str(self.seed)
             
+    def write_host_fields(self, directories, fields, index=None):
+        for directory, field in zip(directories, fields):
+            if self.storage_format == "trajectory":
+                self.append_trajectory(directory, field, index)
+            else:
+                with h5py.File(directory, "w") as hf:
+                    dataset = hf.create_dataset("field", data=field)
+                    self.write_field_attrs(dataset)
+                hf.close()
+
+class StorageField(StoragePolicy, CheckpointStore, FieldWriter, TrajectoryStore, FieldDirectories, StoreConfig):
+    """ Class to store simulation fields to storage."""
+    def store_field(self, index = None):
+        """ Store the field to storage.
+
+        Args:
+            index (_type_, optional): step index to store. Defaults to None.
+        """
+        if self.storage_format == "trajectory":
+            directories = (self.get_trajectory_directory(),)
+        else:
+            directories = (self.get_field_directory(index),)
+        self.write_fields(directories, (self.field,), index)
+
+
+class CoupledStorageField(StoragePolicy, CheckpointStore, FieldWriter, TrajectoryStore, CoupledFieldDirectories, StoreConfig):
+    """ Class to handle storage of coupled simulation fields."""
     def store_field(self, index=None):
         """ Store the coupled fields to storage.
 
         Args:
             index (str | int, optional): step index to store. Defaults to None.
         """
-        file_directories = self.get_field_directory(index)
-        with h5py.File(file_directories[0], "w") as hf:
-            hf.create_dataset("field", data=self.field)
-        hf.close()
-        with h5py.File(file_directories[1], "w") as hf:
-            hf.create_dataset("field", data=self.field1)
-        hf.close()
\ No newline at end of file
+        if self.storage_format == "trajectory":
+            directories = self.get_trajectory_directory()
+        else:
+            directories = self.get_field_directory(index)
+        self.write_fields(directories, (self.field, self.field1), index)
@@ -0,0 +1,145 @@
+from collections import OrderedDict
+
+import h5py
+import numpy as np
+
+
+class TrajectoryView:
+    """ Lazy, array-like view of the stored steps of a field, indexed as view[z, x, y].
+
+    Only the requested steps and windows are read. Uncompressed steps, i.e. the .h5 files of the "files" storage format
+    and uncompressed trajectories, are memory-mapped so that a window only reads its own pages. Compressed steps are
+    read whole from HDF5, one chunk per step, and kept in an LRU cache of at most cache_size bytes.
+    """
+    def __init__(
+        self,
+        frames: list,
+        z_index,
+        frame_shape: tuple,
+        dtype,
+        cache_size: int = None,
+        ):
+        """ Initialize the view.
+
+        Args:
+            frames (list): (directory, index, offset) of every stored step, index being the position of the step in
+                the "field" dataset of directory, None for single step files, and offset the byte offset of the step
+                in the file, None if it is compressed.
+            z_index (array): Step indices of the stored steps.
+            frame_shape (tuple): Shape of a stored step.
+            dtype (np.dtype): Stored dtype.
+            cache_size (int, optional): Bytes of compressed steps kept in memory. Defaults to 1 GiB.
+        """
+        self.frames = frames
+        self.z_index = np.asarray(z_index)
+        self.frame_shape = tuple(frame_shape)
+        self.dtype = np.dtype(dtype)
+        self.cache_size = 2**30 if cache_size is None else cache_size
+        self.cache = OrderedDict()
+        self.cache_bytes = 0
+        self.maps = {}
+
+    @classmethod
+    def from_trajectory(cls, directory, cache_size=None):
+        """ View of a trajectory .h5 file, steps being memory-mapped chunks when uncompressed."""
+        with h5py.File(directory, "r") as f:
+            dataset = f["field"]
+            frame_shape, dtype = dataset.shape[1:], dataset.dtype
+            z_index = f["z_index"][:]
+            mappable = (dataset.compression is None) and (dataset.chunks == (1, *frame_shape))
+            frames = []
+            for index in range(dataset.shape[0]):
+                offset = None
+                if mappable:
+                    offset = dataset.id.get_chunk_info_by_coord((index,) + (0,) * len(frame_shape)).byte_offset
+                frames.append((directory, index, offset))
+        f.close()
+        return cls(frames, z_index, frame_shape, dtype, cache_size)
+
+    @classmethod
+    def from_files(cls, directories, z_index, cache_size=None):
+        """ View of single step .h5 files, memory-mapped when their field is stored contiguously."""
+        frames = []
+        for directory in directories:
+            with h5py.File(directory, "r") as f:
+                dataset = f["field"]
+                frame_shape, dtype = dataset.shape, dataset.dtype
+                frames.append((directory, None, dataset.id.get_offset()))
+            f.close()
+        return cls(frames, z_index, frame_shape, dtype, cache_size)
+
+    @property
+    def shape(self,):
+        return (len(self.frames), *self.frame_shape)
+
+    @property
+    def ndim(self,):
+        return len(self.shape)
+
+    @property
+    def nbytes(self,):
+        return int(np.prod(self.shape)) * self.dtype.itemsize
+
+    def __len__(self,):
+        return len(self.frames)
+
+    def __array__(self, dtype=None, copy=None):
+        array = self[:]
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+    def __getitem__(self, key):
+        if not isinstance(key, tuple):
+            key = (key,)
+        z, window = key[0], key[1:]
+
+        if isinstance(z, (int, np.integer)):
+            return self.read_frame(range(len(self))[z], window)
+
+        positions = np.arange(len(self))[z]
+        if len(positions) == 0:
+            shape = np.broadcast_to(np.empty((), dtype=self.dtype), self.frame_shape)[window].shape
+            return np.empty((0, *shape), dtype=self.dtype)
+        return np.stack([self.read_frame(position, window) for position in positions])
+
+    def read_frame(self, position, window=()):
+        """ Read a window of the stored step at position.
+
+        Args:
+            position (int): Position of the stored step.
+            window (tuple, optional): Indices of the transverse dimensions. Defaults to the whole step.
+        """
+        directory, index, offset = self.frames[position]
+        if offset is not None:
+            return np.array(self.frame_map(position)[window])
+        return np.array(self.cached_frame(position)[window])
+
+    def frame_map(self, position):
+        """ Read-only memory map of an uncompressed stored step."""
+        if position not in self.maps:
+            directory, index, offset = self.frames[position]
+            self.maps[position] = np.memmap(directory, dtype=self.dtype, mode="r", offset=offset, shape=self.frame_shape)
+        return self.maps[position]
+
+    def cached_frame(self, position):
+        """ Compressed stored step, read from HDF5 unless recently used."""
+        if position in self.cache:
+            self.cache.move_to_end(position)
+            return self.cache[position]
+
+        directory, index, offset = self.frames[position]
+        with h5py.File(directory, "r") as f:
+            frame = f["field"][()] if index is None else f["field"][index]
+        f.close()
+
+        self.cache[position] = frame
+        self.cache_bytes += frame.nbytes
+        while (self.cache_bytes > self.cache_size) and (len(self.cache) > 1):
+            _, evicted = self.cache.popitem(last=False)
+            self.cache_bytes -= evicted.nbytes
+        return frame
+
+    def clear(self,):
+        """ Drop the cached steps and memory maps."""
+        self.cache.clear()
+        self.cache_bytes = 0
+        self.maps.clear()
@@ -8,6 +8,7 @@ def gaussian_25_1d(
     I: float,
     power: int,
     shape: int,
+    dtype=np.complex128,
     ) -> np.ndarray:
     """ Generate a 1D Gaussian envelope field.
 
@@ -18,11 +19,12 @@ def gaussian_25_1d(
         I (float): intensity of the Gaussian
         power (int): exponent power of the Gaussian
         shape (int): shape of the output array
+        dtype (optional): complex dtype of the output array. Defaults to np.complex128.
 
     Returns:
         np.ndarray: The generated 1D Gaussian envelope field.
     """
-    canvas = np.zeros(shape, dtype=np.complex128)
+    canvas = np.zeros(shape, dtype=dtype)
     canvas[:] = np.exp(-.5*(2*((x - center)/w)**2)**power)
 
     canvas /= np.max(np.abs(canvas)**2)
@@ -38,6 +40,8 @@ def gaussian_25_2d(
     I: float,
     power: int,
     shape: Tuple[int, int],
+    dtype=np.complex128,
+    ops=None,
 ) -> np.ndarray:
     """ Generate a 2D Gaussian envelope field.
 
@@ -49,14 +53,20 @@ def gaussian_25_2d(
         I (float): intensity of the Gaussian
         power (int): exponent power of the Gaussian
         shape (Tuple[int, int]): shape of the output array
+        dtype (optional): complex dtype of the output array. Defaults to np.complex128.
+        ops (optional): Array engine computing the envelope, the grids being arrays of the engine. Defaults to None, a
+            NumPy array of the given shape.
 
     Returns:
         np.ndarray: The generated 2D Gaussian envelope field.
     """
-    canvas = np.zeros(shape, dtype=np.complex128)
-    canvas[:, :] = np.exp(-.5*(2*(((x - center[0])/width[0])**2 + ((y - center[1])/width[1])**2))**power)
+    if ops is None:
+        canvas = np.zeros(shape, dtype=dtype)
+        canvas[:, :] = np.exp(-.5*(2*(((x - center[0])/width[0])**2 + ((y - center[1])/width[1])**2))**power)
+    else:
+        canvas = ops.astype(ops.exp(-.5*(2*(((x - center[0])/width[0])**2 + ((y - center[1])/width[1])**2))**power), dtype)
     
-    canvas /= np.max(np.abs(canvas)**2)
+    canvas /= np.max(np.abs(canvas)**2) if ops is None else ops.max(ops.abs2(canvas))
     
     canvas *= np.sqrt(I)
     
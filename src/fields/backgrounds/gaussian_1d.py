@@ -11,4 +11,5 @@ class Gaussian1D(GaussianConfig1D):
             self.I,
             self.exponent,
             self.field_shape,
+            self.np_complex,
         )
\ No newline at end of file
@@ -4,26 +4,32 @@ from .base import GaussianConfig2D, CoupledGaussianConfig2D, gaussian_25_2d
 class GaussianProfile2D(GaussianConfig2D):
     def envelope_function(self,):
         """ Compute the first Gaussian envelope function."""
+        xx, yy = self.generation_mesh()
         return gaussian_25_2d(
-            self.xx,
-            self.yy,
+            xx,
+            yy,
             self.width,
             self.center,
             self.I,
             self.exponent,
             self.field_shape,
+            self.np_complex,
+            self.ops if getattr(self, "device_generation", False) else None,
         )
 
 class CoupledGaussian2D(GaussianProfile2D, CoupledGaussianConfig2D):
     """ Coupled 2D Gaussian envelope field."""
     def envelope_function1(self,):
         """ Compute the second Gaussian envelope function."""
+        xx, yy = self.generation_mesh()
         return gaussian_25_2d(
-            self.xx,
-            self.yy,
+            xx,
+            yy,
             self.width1,
             self.center1,
             self.I1,
             self.exponent1,
             self.field_shape,
+            self.np_complex,
+            self.ops if getattr(self, "device_generation", False) else None,
         )
\ No newline at end of file
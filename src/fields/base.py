@@ -1,4 +1,4 @@
-from numpy import conjugate, angle, zeros, complex128, float64
+from numpy import conjugate, angle, zeros, ndarray
 
 from .decorators import reset_field
 
@@ -17,7 +17,7 @@ class Field:
     
     def get_intensity(self,):
         """ Get the intensity of the field."""
-        return ((self.field) * conjugate(self.field)).astype(float64)
+        return ((self.field) * conjugate(self.field)).astype(self.np_float)
 
     def get_total_intensity(self,):
         """ Get the total intensity of the field."""
@@ -29,7 +29,7 @@ class Field:
 
     def init_field(self,):
         """ Initialize the field array."""
-        self.field = zeros(self.field_shape, dtype=complex128)
+        self.field = zeros(self.field_shape, dtype=self.np_complex)
         
 class CoupledFields:
     """ Base Coupled Fields Class."""
@@ -45,16 +45,16 @@ class CoupledFields:
         
     def init_field(self,):
         """ Initialize the coupled field arrays."""
-        self.field = zeros(self.field_shape, dtype=complex128)
-        self.field1 = zeros(self.field_shape, dtype=complex128)
+        self.field = zeros(self.field_shape, dtype=self.np_complex)
+        self.field1 = zeros(self.field_shape, dtype=self.np_complex)
         
     def get_intensity(self,):
         """ Get the intensity of the first field."""
-        return ((self.field) * conjugate(self.field)).astype(float64)
+        return ((self.field) * conjugate(self.field)).astype(self.np_float)
     
     def get_intensity1(self,):
         """ Get the intensity of the second field."""
-        return ((self.field1) * conjugate(self.field1)).astype(float64)
+        return ((self.field1) * conjugate(self.field1)).astype(self.np_float)
     
     def get_total_intensity(self,):
         """ Get the total intensity of both fields."""
@@ -72,10 +72,22 @@ class Modulation:
     """ Base Modulation Class."""
     @reset_field
     def modulate_field(self,):
-        """ Modulate the field with envelope and landscape functions."""
+        """ Modulate the field with envelope and landscape functions, on the device when the fields are generated there."""
+        if getattr(self, "device_generation", False):
+            self.field = self.device_product(self.envelope_function(), self.landscape_function())
+            return
         self.field += self.envelope_function()
         self.field *= self.landscape_function()
         
+    def device_product(self, envelope, landscape):
+        """ Field of an envelope and a landscape on the device, host arrays of functions without a device version being
+        uploaded."""
+        if isinstance(envelope, ndarray):
+            envelope = self.ops.to_device(envelope)
+        if isinstance(landscape, ndarray):
+            landscape = self.ops.to_device(landscape)
+        return self.ops.astype(envelope * landscape, self.np_complex)
+        
     def adimensionalize_field(self,):
         """ Adimensionalize both envelope and landscape functions."""
         self.adimensionalize_envelope()
@@ -91,6 +103,9 @@ class CoupledModulation(Modulation):
         
     def modulate_field1(self,):
         """ Modulate the second field with its envelope and landscape functions."""
+        if getattr(self, "device_generation", False):
+            self.field1 = self.device_product(self.envelope_function1(), self.landscape_function1())
+            return
         self.field1 += self.envelope_function1()
         self.field1 *= self.landscape_function1()
         
@@ -12,7 +12,7 @@ from .base import Field
 
 from .utils import UnpackModulationConfig, CoupledUnpackModulationConfig
 
-class SecondMoireLatticeGaussian2D(CoupledGaussian2D, MoireLattice, CoupledModulation, CoupledFields, WhitenoiseCoupledFields, CoupledUnpackModulationConfig):
+class SecondMoireLatticeGaussian2D(CoupledUnpackModulationConfig, CoupledGaussian2D, MoireLattice, CoupledModulation, CoupledFields, WhitenoiseCoupledFields):
     """ Second Moire Lattice Gaussian 2D Coupled Field Class."""
     pass
 
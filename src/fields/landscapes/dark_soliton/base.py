@@ -34,6 +34,7 @@ def dip(
     center: float,
     power: int,
     shape: int,
+    dtype=np.complex128,
     ) -> np.ndarray:
     """ Generate a dark soliton (dip) landscape.
 
@@ -44,11 +45,12 @@ def dip(
         center (float): center position of the dip.
         power (int): exponent defining the shape of the dip.
         shape (int | Tuple[int, int]): shape of the output array.
+        dtype (optional): complex dtype of the output array. Defaults to np.complex128.
 
     Returns:
         np.ndarray: Dark soliton landscape array.
     """
-    canvas = np.zeros(shape, dtype=np.complex128)
+    canvas = np.zeros(shape, dtype=dtype)
     canvas[:] = np.exp(-.5*(2*((x - center)/w)**2)**power)
 
     canvas /= np.max(np.abs(canvas))
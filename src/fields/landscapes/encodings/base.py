@@ -10,12 +10,12 @@ class FeatureMacropixel:
         
 class PhaseEncoding(FeatureMacropixel):
     def phase_encoded_feature(self, f, size):
-        feature, width_px, height_px = self.feature_macropixel(size, dtype=np.complex128)
-        feature = np.exp(1.j * np.pi * f)
+        feature, width_px, height_px = self.feature_macropixel(size, dtype=self.np_complex)
+        feature = np.exp(1.j * np.pi * f).astype(self.np_complex)
         return feature, width_px, height_px
     
 class AmplitudeEncoding(FeatureMacropixel):
     def amplitude_encoded_feature(self, f, size):
-        feature, width_px, height_px = self.feature_macropixel(size, dtype=np.complex128)
+        feature, width_px, height_px = self.feature_macropixel(size, dtype=self.np_complex)
         feature += f
         return feature, width_px, height_px
\ No newline at end of file
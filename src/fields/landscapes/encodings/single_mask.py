@@ -23,7 +23,7 @@ class PhaseSingleFeature(SingleFeatureConfig, PhaseEncoding):
     def single_feature(self,):
         mx, my = self.field_shape[0]//2, self.field_shape[1]//2
 
-        landscape = np.ones(self.field_shape, dtype=np.complex128)
+        landscape = np.ones(self.field_shape, dtype=self.np_complex)
         feature, width_px, height_px = self.phase_encoded_feature(self.f, self.feature_size)
         
         landscape[mx-width_px//2:mx+width_px//2 +1, my-height_px//2:my+height_px//2 +1] = feature
@@ -40,7 +40,7 @@ class AmplitudeSingleFeature(SingleFeatureConfig, AmplitudeEncoding):
     def single_feature(self,):
         mx, my = self.field_shape[0]//2, self.field_shape[1]//2
 
-        landscape = np.ones(self.field_shape, dtype=np.complex128)
+        landscape = np.ones(self.field_shape, dtype=self.np_complex)
         feature, width_px, height_px = self.amplitude_encoded_feature(self.f, self.feature_size)
         
         landscape[mx-width_px//2:mx+width_px//2 +1, my-height_px//2:my+height_px//2 +1] = feature
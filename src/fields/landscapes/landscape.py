@@ -36,7 +36,8 @@ class PhaseStep:
                 self.x,
                 self.xx if (hasattr(self, "xx")) else None,
                 self.field_shape,
-            )
+            ),
+            dtype=self.np_complex,
         )
         
     def adimensionalize_landscape(self,):
@@ -78,4 +79,5 @@ class DarkSoliton(DarkSolitonConfig):
             self.center_env,
             self.exponent_env,
             self.field_shape,
+            self.np_complex,
         )
\ No newline at end of file
@@ -1,7 +1,11 @@
+import os
+import hashlib
+
+import numpy as np
+
 from .lattices.base import LatticeConfig
 
-from .lattices.single_lattices.two_dimensional import planewave_lattice
-from .lattices.moire_lattices.double_lattices import lattice_sum
+from .lattices.moire_lattices.double_lattices import moire_lattice, lattice_factors, moire_product
 
 from .dark_soliton.base import DarkSolitonConfig
 
@@ -13,9 +17,85 @@ class MoireLattice(LatticeConfig):
     def landscape_function1(self,):
         """ Generate the moire lattice landscape function."""
         return self.double_lattice()
+    
+    def lattice_key(self, angles: tuple = None, p: tuple = None) -> str:
+        """ Hash of a lattice geometry, i.e. angles, lattice constants, weights, lattice type and grid.
+
+        Args:
+            angles (tuple, optional): Angles of the hashed lattices. Defaults to both lattices of the box.
+            p (tuple, optional): Weights of the hashed lattices. Defaults to both lattices of the box.
+        """
+        angles = self.angle if angles is None else angles
+        p = self.p if p is None else p
+        key = hashlib.sha1(repr((
+            tuple(float(angle) for angle in angles),
+            tuple(float(a) for a in self.a),
+            tuple(float(weight) for weight in p),
+            self.lattice_type.lower(),
+        )).encode())
+        key.update(np.ascontiguousarray(self.x, dtype=np.float64).tobytes())
+        key.update(np.ascontiguousarray(self.y, dtype=np.float64).tobytes())
+        return key.hexdigest()
+    
+    def lattice_cache_directory(self, key: str) -> str:
+        """ Get the full directory path of a cached lattice."""
+        return os.path.join(self.lattice_cache, "lattice_" + key + ".npy")
         
     def double_lattice(self,):
-        """ Generate the moire lattice by summing two rotated lattices."""
-        xx_rot0, yy_rot0 = self.rotate_mesh(self.angle[0])
-        xx_rot1, yy_rot1 = self.rotate_mesh(self.angle[1])
-        return lattice_sum(xx_rot0, yy_rot0, xx_rot1, yy_rot1, self.a, self.p, planewave_lattice)
\ No newline at end of file
+        """ Generate the moire lattice by summing two rotated lattices.
+
+        Both lattices are computed from their rotated reciprocal vectors as 1D factors, kept in memory so that only a
+        changed lattice is recomputed, and summed by a single matrix product, see moire_product, on the solver engine when
+        fields are generated on the device. When a cache directory is configured, moire lattices are stored on disk and
+        reused by any box of the same geometry.
+        """
+        device_generation = getattr(self, "device_generation", False)
+        if self.lattice_cache is not None:
+            lattice = self.cached_lattice(self.lattice_key())
+            return self.ops.to_device(lattice) if device_generation else lattice
+        
+        ops = self.ops if device_generation else None
+        return moire_product([self.lattice_factors(0), self.lattice_factors(1)], self.p, ops)
+    
+    def lattice_factors(self, number: int):
+        """ 1D factors of the lattice of a given number, recomputed only when its angle, weight or the grid changed.
+
+        Args:
+            number (int): 0 for the first lattice, 1 for the second one.
+        """
+        if not hasattr(self, "_lattice_factors"):
+            self._lattice_factors = {}
+        
+        key = self.lattice_key((self.angle[number],), (self.p[number],))
+        if (number not in self._lattice_factors) or (self._lattice_factors[number][0] != key):
+            factors = lattice_factors(self.x, self.y, self.angle[number], self.a, self.p[number], self.lattice_type)
+            self._lattice_factors[number] = (key, factors)
+        return self._lattice_factors[number][1]
+    
+    def update_twist(self, twist: float):
+        """ Rotate the first lattice by a twist angle from the second one, whose factors are kept.
+
+        Sweep update of a twist angle scan, e.g. box.sweep(twists, update=MoireLattice.update_twist), every point
+        recomputing the factors of a single lattice.
+
+        Args:
+            twist (float): Angle between the lattices in radians.
+        """
+        self.angle = (self.angle[1] + twist, self.angle[1])
+    
+    def cached_lattice(self, key: str) -> np.ndarray:
+        """ Read the lattice of a given key from the disk cache, computing and storing it on a miss.
+
+        Args:
+            key (str): Hash of the lattice geometry, see lattice_key.
+        """
+        directory = self.lattice_cache_directory(key)
+        if os.path.exists(directory):
+            return np.load(directory)
+        
+        lattice = moire_lattice(self.x, self.y, self.angle, self.a, self.p, self.lattice_type)
+        os.makedirs(self.lattice_cache, exist_ok=True)
+        temporary = directory + f".{os.getpid()}.tmp.npy"
+        np.save(temporary, lattice)
+        os.replace(temporary, directory)  # concurrent sweep workers never read a partial file
+        return lattice
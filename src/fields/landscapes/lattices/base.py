@@ -17,11 +17,25 @@ class LatticeConfig(Uniform):
                 - "a": Lattice constant of the first lattice.
                 - "a1": Lattice constant of the second lattice.
                 - "p": Weight of the first lattice.
+                - "p1": Weight of the second lattice.
+                - "lattice_type" (optional): Type of both lattices. Defaults to "square".
+                - "cache" (optional): Directory of the on-disk cache of generated lattices, reused by later runs with the
+                    same angles, lattice constants, weights and grid. Defaults to None, no disk cache.
         """
         self.angle = (landscape1_config["angle"], landscape1_config["angle1"])
         self.a = (landscape1_config["a"], landscape1_config["a1"])
         self.p = (landscape1_config["p"], landscape1_config["p1"])
         
+        if "lattice_type" in landscape1_config.keys():
+            self.lattice_type = landscape1_config["lattice_type"]
+        else:
+            self.lattice_type = "square"
+            
+        if "cache" in landscape1_config.keys():
+            self.lattice_cache = landscape1_config["cache"]
+        else:
+            self.lattice_cache = None
+        
         super().__init__(*args, **kwargs)
 
     def adimensionalize_landscape1(self,):
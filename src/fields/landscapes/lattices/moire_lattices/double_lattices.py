@@ -1,5 +1,7 @@
 import numpy as np
 
+from ..single_lattices.two_dimensional import lattice_reciprocal_vectors, rotate_reciprocal_vectors, separable_planewaves
+
 def lattice_sum(
     xx_rot0,
     yy_rot0,
@@ -7,11 +9,94 @@ def lattice_sum(
     yy_rot1,
     a,
     p,
-    lattice_function
+    lattice_function,
+    ops=None,
     ):
-    l_ = p[0] * lattice_function(xx_rot0, yy_rot0, a)
-    l_ += p[1] * lattice_function(xx_rot1, yy_rot1, a)
+    l_ = p[0] * lattice_function(xx_rot0, yy_rot0, a, ops=ops)
+    l_ += p[1] * lattice_function(xx_rot1, yy_rot1, a, ops=ops)
         
-    l_ /= np.max(np.abs(l_))
+    l_ /= np.max(np.abs(l_)) if ops is None else ops.max(ops.abs(l_))
         
-    return l_
\ No newline at end of file
+    return l_
+
+def moire_lattice(
+    x,
+    y,
+    angles,
+    a,
+    p,
+    lattice_type: str = "square",
+    ops=None,
+    ):
+    """ Moire lattice of two rotated planewave lattices on the meshgrid(x, y) grid, as lattice_sum of planewave_lattice.
+
+    The lattices are rotated through their reciprocal vectors and summed as a single matrix product of 1D factors, see
+    separable_planewaves, without rotated meshgrids nor complex exponentials. Every lattice peaks at the origin, which
+    is a grid point, so the normalizations are analytic unless the weights have opposite signs.
+
+    Args:
+        x (np.ndarray): -x- coordinates.
+        y (np.ndarray): -y- coordinates.
+        angles (Tuple[float, float]): Rotation angles of the lattices in radians.
+        a (Tuple[float, float]): Lattice parameters, shared by both lattices.
+        p (Tuple[float, float]): Weights of the lattices.
+        lattice_type (str, optional): Type of the lattices. Defaults to "square".
+        ops (optional): Array engine of the product, e.g. the solver engine for a device landscape. Defaults to None,
+            NumPy.
+
+    Returns:
+        Real landscape normalized between [-1, 1].
+    """
+    factors = [lattice_factors(x, y, angle, a, weight, lattice_type) for angle, weight in zip(angles, p)]
+    return moire_product(factors, p, ops)
+
+def lattice_factors(
+    x,
+    y,
+    angle,
+    a,
+    weight,
+    lattice_type: str = "square",
+    ):
+    """ 1D factors of a single rotated planewave lattice of a moire lattice, weight at its origin peak.
+
+    Moire lattices whose lattices change one at a time, e.g. a sweep of the twist angle, reuse the factors of the
+    unchanged lattice.
+
+    Args:
+        x (np.ndarray): -x- coordinates.
+        y (np.ndarray): -y- coordinates.
+        angle (float): Rotation angle of the lattice in radians.
+        a (Tuple[float, float]): Lattice parameters.
+        weight (float): Weight of the lattice.
+        lattice_type (str, optional): Type of the lattice. Defaults to "square".
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Row and column factors, see separable_planewaves.
+    """
+    reciprocal_vectors = rotate_reciprocal_vectors(lattice_reciprocal_vectors(a, lattice_type), angle)
+    return separable_planewaves(x, y, reciprocal_vectors, weight / (2*len(reciprocal_vectors)))
+
+def moire_product(factors, p, ops=None):
+    """ Moire lattice of the 1D factors of its lattices, as a single matrix product normalized between [-1, 1].
+
+    Both lattices peak together at the origin, so the maximum is the sum of the weights unless their signs differ.
+
+    Args:
+        factors (list): Row and column factors of every lattice, see lattice_factors.
+        p (Tuple[float, float]): Weights of the lattices.
+        ops (optional): Array engine of the product. Defaults to None, NumPy.
+    """
+    rows = np.concatenate([factor[0] for factor in factors], axis=1)
+    columns = np.concatenate([factor[1] for factor in factors], axis=0)
+    
+    if ops is None:
+        l_ = rows @ columns
+    else:
+        l_ = ops.matmul(ops.to_device(rows), ops.to_device(columns))
+    
+    if p[0] * p[1] >= 0:
+        l_ /= abs(p[0]) + abs(p[1])
+    else:
+        l_ /= np.max(np.abs(l_)) if ops is None else ops.max(ops.abs(l_))
+    return l_
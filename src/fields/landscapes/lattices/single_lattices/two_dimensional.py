@@ -20,10 +20,75 @@ def lattice_reciprocal_outer(vectors: np.ndarray) -> np.ndarray:
     vectors[1, 0], vectors[1, 1] = b2[0], b2[1]
     return vectors
 
+def lattice_reciprocal_vectors(
+    lattice_parameters: Tuple[float, float],
+    lattice_type: str = "square",
+) -> np.ndarray:
+    """Get the reciprocal vectors of a 2D lattice.
+
+    Args:
+        lattice_parameters (Tuple[float, float]): Lattice parameters (a1, a2).
+        lattice_type (str, optional): Type of lattice. Defaults to "square".
+
+    Returns:
+        np.ndarray: Reciprocal lattice vectors, one per row.
+    """
+    # choose lattice vectors
+    if (lattice_type.lower() == "square") or (lattice_type.lower() == "rectangular"):
+        lattice_vectors = np.array([[1.,0.],[0.,1.]])
+        
+    lattice_vectors[0] *= lattice_parameters[0]
+    lattice_vectors[1] *= lattice_parameters[1]
+    
+    return lattice_reciprocal_outer(lattice_vectors)
+
+def rotate_reciprocal_vectors(
+    reciprocal_vectors: np.ndarray,
+    angle: float,
+) -> np.ndarray:
+    """Rotate reciprocal lattice vectors instead of the mesh, b.(R r) being (R^T b).r.
+
+    Args:
+        reciprocal_vectors (np.ndarray): Reciprocal lattice vectors, one per row.
+        angle (float): Rotation angle of the lattice in radians, as in rotate_mesh.
+
+    Returns:
+        np.ndarray: Reciprocal vectors of the rotated lattice, one per row.
+    """
+    rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    return reciprocal_vectors @ rotation
+
+def separable_planewaves(
+    x: np.ndarray,
+    y: np.ndarray,
+    reciprocal_vectors: np.ndarray,
+    weight: float = 1.,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Factor a planewave lattice, weight times the sum of 2cos(b.r) over the reciprocal vectors, into 1D factors.
+
+    As cos(bx x + by y) = cos(by y)cos(bx x) - sin(by y)sin(bx x), the lattice on the meshgrid(x, y) grid is the matrix
+    product of the returned factors.
+
+    Args:
+        x (np.ndarray): -x- coordinates.
+        y (np.ndarray): -y- coordinates.
+        reciprocal_vectors (np.ndarray): Reciprocal lattice vectors, one per row.
+        weight (float, optional): Weight of the lattice. Defaults to 1..
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (Ny, 2n) and (2n, Nx) factors, n being the number of reciprocal vectors.
+    """
+    phase_x = np.outer(reciprocal_vectors[:, 0], x)
+    phase_y = np.outer(y, reciprocal_vectors[:, 1])
+    rows = np.concatenate((np.cos(phase_y), -np.sin(phase_y)), axis=1)
+    columns = 2*weight*np.concatenate((np.cos(phase_x), np.sin(phase_x)), axis=0)
+    return rows, columns
+
 def general_planewaves(
     xx: np.ndarray,
     yy: np.ndarray,
     reciprocal_vectors: np.ndarray,
+    ops=None,
 ) -> np.ndarray:
     """Generate a general planewave lattice.
 
@@ -31,15 +96,18 @@ def general_planewaves(
         xx (np.ndarray): -x- coordinates meshgrid.
         yy (np.ndarray): -y- coordinates meshgrid.
         reciprocal_vectors (np.ndarray): Reciprocal lattice vectors.
+        ops (optional): Array engine of the meshgrids. Defaults to None, NumPy.
 
     Returns:
         np.ndarray: Planewave lattice array.
     """
-    lattice = np.exp(1j * (reciprocal_vectors[0][0]*xx + reciprocal_vectors[0][1]*yy)) + np.exp(1j * (reciprocal_vectors[1][0]*xx + reciprocal_vectors[1][1]*yy))
+    exp = np.exp if ops is None else ops.exp
+    reciprocal_vectors = np.asarray(reciprocal_vectors, dtype=float).tolist()  # python floats leave the products to the arrays
+    lattice = exp(1j * (reciprocal_vectors[0][0]*xx + reciprocal_vectors[0][1]*yy)) + exp(1j * (reciprocal_vectors[1][0]*xx + reciprocal_vectors[1][1]*yy))
     
-    lattice += np.exp(-1j * (reciprocal_vectors[0][0]*xx + reciprocal_vectors[0][1]*yy)) + np.exp(-1j * (reciprocal_vectors[1][0]*xx + reciprocal_vectors[1][1]*yy))  ## c.c.
+    lattice += exp(-1j * (reciprocal_vectors[0][0]*xx + reciprocal_vectors[0][1]*yy)) + exp(-1j * (reciprocal_vectors[1][0]*xx + reciprocal_vectors[1][1]*yy))  ## c.c.
     
-    lattice /= np.max(np.abs(lattice))  ## normalize between [-1,1].
+    lattice /= np.max(np.abs(lattice)) if ops is None else ops.max(ops.abs(lattice))  ## normalize between [-1,1].
     
     return lattice
 
@@ -48,6 +116,7 @@ def planewave_lattice(
     yy: np.ndarray,
     lattice_parameters: Tuple[float, float],
     lattice_type: str = "square",
+    ops=None,
 ) -> np.ndarray:
     """Generate a planewave lattice.
 
@@ -56,21 +125,16 @@ def planewave_lattice(
         yy (np.ndarray): -y- coordinates meshgrid.
         lattice_parameters (Tuple[float, float]): Lattice parameters (a1, a2).
         lattice_type (str, optional): Type of lattice to generate. Defaults to "square".
+        ops (optional): Array engine of the meshgrids. Defaults to None, NumPy.
 
     Returns:
         np.ndarray: Planewave lattice array.
     """
-    # choose lattice vectors
-    if (lattice_type.lower() == "square") or (lattice_type.lower() == "rectangular"):
-        lattice_vectors = np.array([[1.,0.],[0.,1.]])
-        
-    lattice_vectors[0] *= lattice_parameters[0]
-    lattice_vectors[1] *= lattice_parameters[1]
-    
-    reciprocal_vectors = lattice_reciprocal_outer(lattice_vectors)
+    reciprocal_vectors = lattice_reciprocal_vectors(lattice_parameters, lattice_type)
     
     return general_planewaves(
         xx,
         yy,
         reciprocal_vectors=reciprocal_vectors,
+        ops=ops,
     )
\ No newline at end of file
@@ -3,16 +3,26 @@ import numpy as np
 def whitenoise_field(
     A: float,
     shape,
+    generator: np.random.Generator = None,
+    dtype=np.float64,
     ) -> np.ndarray:
     """ Generate a white noise field with given amplitude and shape.
 
     Args:
         A (float): Amplitude of the noise.
         shape (int | tuple): Shape of the noise array.
+        generator (np.random.Generator, optional): Generator of the noise. Defaults to None, the global numpy RNG.
+        dtype (optional): Real dtype of the noise drawn from generator, drawn in double precision and cast so that the
+            stream does not depend on the precision of the field. Defaults to np.float64.
 
     Returns:
         np.ndarray: Generated white noise array.
     """
+    if generator is not None:
+        new_field = generator.standard_normal(shape)
+        new_field *= A
+        return new_field.astype(dtype, copy=False)
+    
     new_field = np.random.normal(0,
                        scale=A,
                        size=shape,
@@ -22,11 +32,56 @@ def whitenoise_field(
 def introduce_noise(
     field: np.ndarray,
     A: float,
+    generator: np.random.Generator = None,
+    chunk: int = None,
     ) -> None:
     """ Introduce white noise into the given field.
 
+    Noise of a generator is drawn chunk rows at a time, so that the noise of large fields never exists as a whole on the
+    host, and applied in the real precision of the field. Consecutive chunks are consecutive draws of the stream, so the noise does
+    not depend on the chunk size.
+
     Args:
         field (np.ndarray): Field to which noise will be added.
         A (float): Amplitude of the noise.
+        generator (np.random.Generator, optional): Generator of the noise. Defaults to None, the global numpy RNG.
+        chunk (int, optional): Rows of noise drawn at once. Defaults to None, the whole field.
+    """
+    if generator is None:
+        field *= (1. + whitenoise_field(A, field.shape))
+        return
+    
+    chunk = field.shape[0] if chunk is None else chunk
+    for start in range(0, field.shape[0], chunk):
+        rows = field[start:start + chunk]
+        noise = whitenoise_field(A, rows.shape, generator, field.real.dtype)
+        noise += 1.
+        rows *= noise
+
+def introduce_device_noise(
+    field,
+    A: float,
+    ops,
+    dtype=np.float64,
+    generator: np.random.Generator = None,
+    ):
+    """ Introduce white noise into a field of an array engine.
+
+    With a generator, the noise is drawn on the device by the engine from a Philox stream seeded by the generator, without
+    host temporaries, otherwise it is drawn on the host and uploaded.
+
+    Args:
+        field: Field of the array engine.
+        A (float): Amplitude of the noise.
+        ops: Array engine of the field.
+        dtype (optional): Real dtype of the noise. Defaults to np.float64.
+        generator (np.random.Generator, optional): Generator of the device seed. Defaults to None, the global numpy RNG.
+
+    Returns:
+        The noisy field.
     """
-    field *= (1. + whitenoise_field(A, field.shape))
\ No newline at end of file
+    if generator is not None:
+        seed = int(generator.integers(2**63))
+        noise = ops.astype(ops.normal(tuple(field.shape), np.float64, seed), dtype)  # same stream in every precision
+        return field * (1. + A * noise)
+    return field * ops.to_device((1. + whitenoise_field(A, field.shape)).astype(dtype))
@@ -1,14 +1,68 @@
-from .base import introduce_noise
+import numpy as np
+
+from .base import introduce_noise, introduce_device_noise
 
 class WhitenoiseField:
-    """ Method class to add white noise to a field."""
+    """ Method class to add white noise to a field.
+
+    Noise is drawn from a Philox generator seeded by the seed of the run, an independent stream being spawned for every
+    sweep point, so that sweeps, serial or parallel, are reproducible from the seed of their stored configuration.
+    Successive calls draw successive noise, e.g. independent realizations of a batch.
+    """
+    @property
+    def seed(self,):
+        """ Seed of the noise, from the "seed" key of the simulation configuration, else fresh entropy recorded with the
+        stored fields and by store_configs."""
+        if not hasattr(self, '_seed'):
+            simulation_config = getattr(self, "simulation_config", {})
+            if "seed" in simulation_config.keys():
+                self._seed = simulation_config["seed"]
+            else:
+                self._seed = np.random.SeedSequence().entropy  # fresh seed of the run
+        return self._seed
+    
+    @seed.setter
+    def seed(self, value):
+        self._seed = value
+    
+    @property
+    def noise_chunk(self,):
+        """ Rows of host noise drawn at once, from the "noise_chunk" key of the simulation configuration."""
+        if not hasattr(self, '_noise_chunk'):
+            simulation_config = getattr(self, "simulation_config", {})
+            if "noise_chunk" in simulation_config.keys():
+                self._noise_chunk = simulation_config["noise_chunk"]
+            else:
+                self._noise_chunk = None
+        return self._noise_chunk
+    
+    @noise_chunk.setter
+    def noise_chunk(self, value):
+        self._noise_chunk = value
+        
+    @property
+    def noise_generator(self,):
+        """ Philox generator of the noise of the run or of its current sweep point."""
+        point = getattr(self, "sweep_index", None)
+        if (not hasattr(self, '_noise_generator')) or (self._noise_point != point):
+            spawn_key = () if point is None else (int(point),)
+            self._noise_generator = np.random.Generator(np.random.Philox(np.random.SeedSequence(self.seed, spawn_key=spawn_key)))
+            self._noise_point = point
+        return self._noise_generator
+    
     def add_noise(self,):
         """ Add white noise to the field."""
-        introduce_noise(self.field, self.noise)
+        if isinstance(self.field, np.ndarray):
+            introduce_noise(self.field, self.noise, self.noise_generator, self.noise_chunk)
+        else:
+            self.field = introduce_device_noise(self.field, self.noise, self.ops, self.np_float, self.noise_generator)
         
 class WhitenoiseCoupledFields(WhitenoiseField):
     """ Method class to add white noise to coupled fields."""
     def add_noise(self,):
         """ Add white noise to both coupled fields."""
         super().add_noise()
-        introduce_noise(self.field1, self.noise)
\ No newline at end of file
+        if isinstance(self.field1, np.ndarray):
+            introduce_noise(self.field1, self.noise, self.noise_generator, self.noise_chunk)
+        else:
+            self.field1 = introduce_device_noise(self.field1, self.noise, self.ops, self.np_float, self.noise_generator)
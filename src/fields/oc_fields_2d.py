@@ -4,7 +4,7 @@ from .base import Modulation, CoupledModulation, CoupledFields
 
 from .noise.noise import WhitenoiseCoupledFields, WhitenoiseField
 
-from .landscapes.landscapes_2d import Uniform
+from .landscapes.base import Uniform
 from .landscapes.encodings.single_mask import PhaseSingleFeature
 from .landscapes.encodings.single_mask import AmplitudeSingleFeature
 
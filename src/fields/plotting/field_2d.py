@@ -58,6 +58,7 @@ class Plot2DField:
         extent_plot=None,
         zorder=None,
         norm=None,
+        step=None,
     ):
         """ Plot 2D field.
 
@@ -71,6 +72,8 @@ class Plot2DField:
             extent_plot (_type_, optional): _description_. Defaults to None.
             zorder (_type_, optional): _description_. Defaults to None.
             norm (_type_, optional): _description_. Defaults to None.
+            step (int, optional): Position of a stored step of the loaded fields, see window_intensity. Defaults to
+                None, the current field.
 
         Returns:
             _type_: _description_
@@ -82,7 +85,7 @@ class Plot2DField:
             self.set_extent(extent_plot)
         
         fig, axs = plot2d_wrapped(
-            intensity = self.get_intensity()[self.xx_indices, self.yy_indices],
+            intensity = self.window_intensity(step),
             extent = self.dimensionalize_extent(),
             vlims = self.vlims,
             fig = fig,
@@ -191,6 +194,7 @@ class PlotCoupledFields2D(Plot2DField, Extent, Axis):
         alpha=.5,
         filename=None,
         norms=[None, None],
+        step=None,
     ):
         """ Plot coupled fields in 2D.
 
@@ -198,17 +202,20 @@ class PlotCoupledFields2D(Plot2DField, Extent, Axis):
             alpha (float, optional): _description_. Defaults to .5.
             filename (_type_, optional): _description_. Defaults to None.
             norms (list, optional): _description_. Defaults to [None, None].
+            step (int, optional): Position of a stored step of the loaded fields, see window_intensity. Defaults to
+                None, the current fields.
 
         Returns:
             _type_: _description_
         """
-        fig, axs = self.plot_field1_2d(cmap="Greens", zorder=0, norm=norms[1])
+        fig, axs = self.plot_field1_2d(cmap="Greens", zorder=0, norm=norms[1], step=step)
         fig, axs = self.plot_field_2d(fig=fig,
                                       axs=axs,
                                       alpha=alpha,
                                       cmap="Reds",
                                       zorder=1,
                                       norm=norms[0],
+                                      step=step,
                                       )
 
         if filename is not None:
@@ -252,6 +259,7 @@ class PlotCoupledFields2D(Plot2DField, Extent, Axis):
         zorder=None,
         norm=None,
         scale=None,
+        step=None,
     ):
         """ Plot first field in 2D.
 
@@ -263,12 +271,14 @@ class PlotCoupledFields2D(Plot2DField, Extent, Axis):
             zorder (_type_, optional): _description_. Defaults to None.
             norm (_type_, optional): _description_. Defaults to None.
             scale (_type_, optional): _description_. Defaults to None.
+            step (int, optional): Position of a stored step of the loaded fields, see window_intensity. Defaults to
+                None, the current field.
 
         Returns:
             _type_: _description_
         """
         fig, axs = plot2d_wrapped(
-            intensity = self.get_intensity1()[self.xx_indices, self.yy_indices],
+            intensity = self.window_intensity(step, field_number=1),
             extent = self.dimensionalize_extent(),
             vlims = self.vlims1,
             fig = fig,
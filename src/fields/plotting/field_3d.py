@@ -59,11 +59,12 @@ class PlotCoupledFields3D(Extent, Axis):
         alpha: float = .8,
         cmap: str = "turbo",
         filename: str | None = None,
+        step: int | None = None,
     ):
         fig, axs = _plot3d_field(
             self.dimensionalize_length(self.x[self.xx_indices])*self.scale_factor,
             self.dimensionalize_length(self.y[self.yy_indices])*self.scale_factor,
-            intensity = self.get_intensity()[self.xx_indices, self.yy_indices],
+            intensity = self.window_intensity(step),
             vlims=self.vlims,
             alpha=alpha,
             cmap=cmap,
@@ -83,18 +84,17 @@ class PlotCoupledFields3D(Extent, Axis):
         alpha: float = .8,
         cmap: str = "turbo",
         filename: str | None = None,
+        step: int | None = None,
     ):
         fig, axs = _plot3d_field(
-            self.x[self.xx_indices],
-            self.y[self.yy_indices],
-            intensity=self.get_intensity1[self.xx_indices, self.yy_indices],
-            extent=self.extent_plot,
+            self.dimensionalize_length(self.x[self.xx_indices])*self.scale_factor,
+            self.dimensionalize_length(self.y[self.yy_indices])*self.scale_factor,
+            intensity=self.window_intensity(step, field_number=1),
             vlims=self.vlims,
             alpha=alpha,
             cmap=cmap,
             axis_labels=self.axis_labels,
             colorbar_label=self.colorbar_label,
-            zorder=zorder,
         )
         
         if filename is not None:
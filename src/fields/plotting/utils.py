@@ -180,6 +180,32 @@ class Extent(Scale, ExtentMethods, VLimsMethods):
         self.extent_plot = self.adimensionalize_extent()
         self.set_window()
 
+    def window_intensity(self, step=None, field_number=0):
+        """ Intensity of the plotted window, of the current field or of a stored step of the loaded fields.
+
+        Loaded fields are those of the loader classes, e.g. load_field(lazy=True), whose TrajectoryView only reads the
+        plotted window of the step. Stored steps must cover the whole grid.
+
+        Args:
+            step (int, optional): Position of the stored step in the loaded fields. Defaults to None, the current field.
+            field_number (int, optional): 0 for the first field, 1 for the second one. Defaults to 0.
+        """
+        if step is None:
+            intensity = self.get_intensity() if field_number == 0 else self.get_intensity1()
+            return intensity[self.xx_indices, self.yy_indices]
+        
+        fields = self.fields if field_number == 0 else self.fields1
+        if tuple(fields.shape[1:3]) != (self.Nx, self.Ny):
+            raise ValueError(f"Stored steps of shape {fields.shape[1:]} do not cover the ({self.Nx}, {self.Ny}) grid.")
+        window = (slice(self.x_indices[0], self.x_indices[-1] + 1), slice(self.y_indices[0], self.y_indices[-1] + 1))
+        if self.storage_format == "trajectory":
+            directory = self.get_trajectory_directory()
+        else:
+            directory = self.get_field_directory(0)
+        if isinstance(directory, tuple):
+            directory = directory[field_number]
+        return self.stored_intensity(fields[(step, *window)], self.get_field_quantity(directory)).T
+
     def scaled_extent_plot(self,):
         return [self.extent_plot[i]*self.scale_factor for i in range(4)]
 
@@ -0,0 +1,58 @@
+import os
+import sys
+import tempfile
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from test_load_methods import SimulationBox, beam_config, crystal_config, device_config, modulation_config, simulation_config
+
+def adaptive_run(tolerance, max_refinement=4):
+    """ Noiseless adaptive run of 8 nominal steps."""
+    simbox = SimulationBox(
+        crystal_config = deepcopy(crystal_config),
+        beam_config = beam_config,
+        simulation_config = {**simulation_config, "Nz": 8, "lz": 20e-3, "noise": 0., "iteration": "adaptive",
+                             "tolerance": tolerance, "max_refinement": max_refinement},
+        device_config = device_config,
+        modulation_config = deepcopy(modulation_config),
+        storage_config = {"home": tempfile.mkdtemp(), "store": "last"},
+    )
+    simbox.init()
+    simbox.solve()
+    return simbox
+
+def reference_run(Nz=1024):
+    """ Noiseless run of the same propagation with fixed fine steps."""
+    simbox = SimulationBox(
+        crystal_config = deepcopy(crystal_config),
+        beam_config = beam_config,
+        simulation_config = {**simulation_config, "Nz": Nz, "lz": 20e-3, "noise": 0.},
+        device_config = device_config,
+        modulation_config = deepcopy(modulation_config),
+        storage_config = {"home": tempfile.mkdtemp(), "store": "last"},
+    )
+    simbox.init()
+    simbox.solve()
+    return simbox.field.copy()
+
+def test_adaptive_error_tracks_tolerance():
+    reference = reference_run()
+    errors = []
+    for tolerance in (1e-3, 1e-5):
+        simbox = adaptive_run(tolerance)
+        history = np.array(simbox.adaptive_history)
+        assert history[-1, 0] == pytest.approx(simbox.Nz * simbox.dz)
+        assert np.all(history[:, 2] <= tolerance)
+        errors.append(np.linalg.norm(simbox.field - reference) / np.linalg.norm(reference))
+    assert errors[1] < errors[0] / 10
+
+def test_adaptive_steps_respect_max_refinement():
+    simbox = adaptive_run(1e-9, max_refinement=1)
+    history = np.array(simbox.adaptive_history)
+    assert history[-1, 0] == pytest.approx(simbox.Nz * simbox.dz)
+    assert history[:, 1].min() == pytest.approx(simbox.dz / 2)
+    assert np.all(history[:, 2] > 1e-9)  # accepted at the smallest step despite the tolerance
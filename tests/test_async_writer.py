@@ -0,0 +1,41 @@
+import os
+import sys
+import threading
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from test_load_methods import LoadBox, SimulationBox, beam_config, crystal_config, device_config, modulation_config, simulation_config
+
+def stored_run(home, storage_config):
+    """ Run with the given storage and load back every stored step."""
+    storage_config = {"home": home, "store": "stride", "stride": 2, **storage_config}
+    simbox = SimulationBox(
+        crystal_config = deepcopy(crystal_config),
+        beam_config = beam_config,
+        simulation_config = simulation_config,
+        device_config = device_config,
+        modulation_config = deepcopy(modulation_config),
+        storage_config = storage_config,
+    )
+    simbox.init()
+    simbox.solve()
+    assert not hasattr(simbox, "_async_writer")  # closed by the end of the run
+    
+    loadbox = LoadBox(simulation_config, storage_config)
+    loadbox.load_fields()
+    return loadbox
+
+@pytest.mark.parametrize("storage_format", ["files", "trajectory"])
+def test_async_storage_matches_sync_storage(tmp_path, storage_format):
+    threads = threading.active_count()
+    sync = stored_run(str(tmp_path / "sync"), {"format": storage_format})
+    asynchronous = stored_run(str(tmp_path / "async"), {"format": storage_format, "async": True, "queue_size": 2})
+    assert threading.active_count() == threads
+    
+    np.testing.assert_array_equal(asynchronous.z_index, sync.z_index)
+    np.testing.assert_array_equal(asynchronous.fields, sync.fields)
+    np.testing.assert_array_equal(asynchronous.fields1, sync.fields1)
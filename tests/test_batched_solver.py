@@ -0,0 +1,73 @@
+import os
+import sys
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from test_load_methods import SimulationBox, beam_config, crystal_config, device_config, modulation_config, simulation_config
+from src.core.boxes.simulation import SimulationBoxMethods
+from src.core.engines.solvers.nls.eq_coefs.models import CoupledWavevectorPhotorefractiveModel
+from src.core.engines.solvers.nls.solver_2d.batched_solver import BatchedCoupledSplitStepSolver
+from src.fields.fields_2d import SecondMoireLatticeGaussian2D
+
+class BatchedSimulationBox(BatchedCoupledSplitStepSolver, SecondMoireLatticeGaussian2D, CoupledWavevectorPhotorefractiveModel, SimulationBoxMethods):
+    pass
+
+def make_box(box_class, home, **config):
+    simbox = box_class(
+        crystal_config = deepcopy(crystal_config),
+        beam_config = beam_config,
+        simulation_config = {**simulation_config, **config},
+        device_config = device_config,
+        modulation_config = deepcopy(modulation_config),
+        storage_config = {"home": home, "store": "last"},
+    )
+    simbox.init()
+    return simbox
+
+def push_realizations(simbox, nbatch):
+    """ Push nbatch noisy realizations of the fields, returning copies of them."""
+    realizations = []
+    for _ in range(nbatch):
+        simbox.modulate_field()
+        simbox.push_realization()
+        realizations.append((simbox.field.copy(), simbox.field1.copy()))
+    return realizations
+
+def individual_run(home, field, field1):
+    simbox = make_box(SimulationBox, home)
+    simbox.field, simbox.field1 = field.copy(), field1.copy()
+    simbox.solve()
+    return simbox
+
+def test_batch_matches_individual_runs(tmp_path):
+    batch = make_box(BatchedSimulationBox, str(tmp_path / "batch"))
+    for run in range(2):  # the second run stands for the next point of a sweep
+        realizations = push_realizations(batch, 3)
+        batch.solve()
+        assert batch.field.shape == (64, 64, 3)
+        assert batch.nbatch == 3
+        for index, (field, field1) in enumerate(realizations):
+            simbox = individual_run(str(tmp_path / f"run{run}_{index}"), field, field1)
+            np.testing.assert_allclose(batch.get_realization(index), simbox.field, rtol=0, atol=1e-12)
+            np.testing.assert_allclose(batch.get_realization1(index), simbox.field1, rtol=0, atol=1e-12)
+
+def test_solve_continues_the_propagated_batch(tmp_path):
+    batch = make_box(BatchedSimulationBox, str(tmp_path / "batch"))
+    realizations = push_realizations(batch, 2)
+    batch.solve()
+    batch.solve()  # no realizations pushed, the propagated batch is not restacked
+    for index, (field, field1) in enumerate(realizations):
+        simbox = individual_run(str(tmp_path / f"run{index}"), field, field1)
+        simbox.solve()
+        np.testing.assert_allclose(batch.get_realization(index), simbox.field, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(batch.get_realization1(index), simbox.field1, rtol=0, atol=1e-12)
+
+def test_adaptive_batch_is_rejected(tmp_path):
+    batch = make_box(BatchedSimulationBox, str(tmp_path), iteration="adaptive")
+    push_realizations(batch, 2)
+    with pytest.raises(ValueError):
+        batch.solve()
@@ -0,0 +1,69 @@
+import os
+import sys
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from test_load_methods import SimulationBox, beam_config, crystal_config, device_config, modulation_config, simulation_config
+
+class Interrupted(Exception):
+    pass
+
+def checkpointed_box(home, simulation_config=simulation_config, crystal_config=crystal_config, iteration="standard"):
+    """ Box storing every other step and checkpointing every 4 steps, with its configuration stored in home."""
+    simulation_config = {**simulation_config, "Nz": 12, "iteration": iteration}
+    storage_config = {"home": home, "store": "stride", "stride": 2, "checkpoint": 4}
+    simbox = SimulationBox(
+        crystal_config = deepcopy(crystal_config),
+        beam_config = beam_config,
+        simulation_config = simulation_config,
+        device_config = device_config,
+        modulation_config = deepcopy(modulation_config),
+        storage_config = storage_config,
+    )
+    simbox.store_configs(crystal_config, beam_config, simulation_config, device_config, modulation_config, storage_config)
+    return simbox
+
+def interrupt(simbox, index):
+    """ Make the box raise Interrupted right after storing the step at index."""
+    store_step = simbox.store_step
+    def interrupted_store_step(step=None):
+        store_step(step)
+        if step == index:
+            raise Interrupted
+    simbox.store_step = interrupted_store_step
+
+@pytest.mark.parametrize("iteration", ["standard", "fused"])
+def test_resume_matches_uninterrupted_run(tmp_path, iteration):
+    simbox = checkpointed_box(str(tmp_path / "interrupted"), iteration=iteration)
+    simbox.init()
+    interrupt(simbox, 6)
+    with pytest.raises(Interrupted):
+        simbox.solve()
+    
+    reference = checkpointed_box(str(tmp_path / "reference"), iteration=iteration)
+    reference.init()
+    reference.solve()
+    
+    resumed = checkpointed_box(str(tmp_path / "interrupted"), iteration=iteration)
+    resumed.resume()
+    np.testing.assert_array_equal(resumed.field, reference.field)
+    np.testing.assert_array_equal(resumed.field1, reference.field1)
+
+@pytest.mark.parametrize("changes", [
+    {"simulation_config": {**simulation_config, "Nx": 32, "Ny": 32}},
+    {"simulation_config": {**simulation_config, "lz": 12e-3}},
+    {"crystal_config": {**crystal_config, "tension": 300}},
+])
+def test_resume_rejects_mismatched_checkpoint(tmp_path, changes):
+    simbox = checkpointed_box(str(tmp_path))
+    simbox.init()
+    interrupt(simbox, 6)
+    with pytest.raises(Interrupted):
+        simbox.solve()
+    
+    with pytest.raises(ValueError):
+        checkpointed_box(str(tmp_path), **changes).resume()
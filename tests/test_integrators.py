@@ -0,0 +1,42 @@
+import os
+import sys
+import tempfile
+import warnings
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from test_load_methods import SimulationBox, beam_config, crystal_config, device_config, modulation_config, simulation_config
+
+def propagate(scheme, Nz, alpha, fold_absorption=True):
+    """ Last field of a noiseless run of Nz steps."""
+    simbox = SimulationBox(
+        crystal_config = {**crystal_config, "alpha": alpha, "alpha1": alpha},
+        beam_config = beam_config,
+        simulation_config = {**simulation_config, "Nz": Nz, "lz": 20e-3, "noise": 0., "scheme": scheme},
+        device_config = device_config,
+        modulation_config = deepcopy(modulation_config),
+        storage_config = {"home": tempfile.mkdtemp(), "store": "last"},
+    )
+    simbox.fold_absorption = fold_absorption
+    simbox.init()
+    simbox.solve()
+    return simbox.field.copy()
+
+def convergence_order(scheme, alpha, fold_absorption=True, Nz=16):
+    """ Order estimated from the differences between runs of Nz, 2*Nz and 4*Nz steps."""
+    fields = [propagate(scheme, Nz*2**level, alpha, fold_absorption) for level in range(3)]
+    return np.log2(np.linalg.norm(fields[0] - fields[1]) / np.linalg.norm(fields[1] - fields[2]))
+
+@pytest.mark.parametrize("alpha", [0., 30.])
+@pytest.mark.parametrize("scheme, order, Nz", [("strang", 2, 16), ("yoshida4", 4, 16), ("rk4ip", 4, 32)])
+def test_convergence_order(scheme, order, Nz, alpha):
+    assert convergence_order(scheme, alpha, Nz=Nz) == pytest.approx(order, abs=.4)
+
+def test_yoshida_folds_uniform_absorption_when_folding_is_disabled():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert convergence_order("yoshida4", 30., fold_absorption=False) == pytest.approx(4, abs=.4)
@@ -0,0 +1,87 @@
+import os
+import sys
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.boxes.simulation import SimulationBoxMethods
+from src.core.engines.solvers.nls.eq_coefs.models import CoupledWavevectorPhotorefractiveModel
+from src.core.engines.solvers.nls.solver_2d.coupled_solver import CoupledSplitStepSolver
+from src.core.storage.load_methods import LoadCoupledSimulation
+from src.fields.fields_2d import SecondMoireLatticeGaussian2D
+
+simulation_config = {"Nx": 64, "Ny": 64, "Nz": 6, "lx": 1.5e-3, "ly": 1.5e-3, "lz": 6e-3, "noise": .05, "seed": 0}
+crystal_config = {"n": 2.36, "n1": 2.36, "electro_optic_coef": 250e-12, "electro_optic_coef1": 250e-12, "tension": 400,
+                  "Isat": 3.75, "alpha": 0., "alpha1": 0., "Lx": 5e-3, "Ly": 5e-3, "Lz": 20e-3}
+beam_config = {"wavelength": 633e-9, "wavelength1": 532e-9, "c": -1., "c1": -.1}
+modulation_config = {
+    "landscape_config": {},
+    "envelope_config": {"I": .3, "width": 60e-6, "center": (0,0), "exponent": 1.},
+    "landscape1_config": {"angle": np.atan(3/4), "angle1": 0., "a": 1e-4, "a1": 1e-4, "p": 1., "p1": 1.},
+    "envelope1_config": {"I": 16*3.75, "width": 500e-6, "center": (0,0), "exponent": 4.},
+}
+device_config = {"device": 0, "backend": "numpy"}
+
+class SimulationBox(CoupledSplitStepSolver, SecondMoireLatticeGaussian2D, CoupledWavevectorPhotorefractiveModel, SimulationBoxMethods):
+    pass
+
+class LoadBox(LoadCoupledSimulation):
+    """ Box that only loads, without solver nor grid."""
+    def __init__(self, simulation_config, storage_config):
+        self.Nz = simulation_config["Nz"]
+        super().__init__(storage_config=storage_config)
+
+def test_load_windowed_downsampled_run(tmp_path):
+    storage_config = {"home": str(tmp_path), "store": "stride", "stride": 2, "window": ((8, 56), (16, 48)), "downsample": 2}
+    simbox = SimulationBox(
+        crystal_config = deepcopy(crystal_config),
+        beam_config = beam_config,
+        simulation_config = simulation_config,
+        device_config = device_config,
+        modulation_config = deepcopy(modulation_config),
+        storage_config = storage_config,
+    )
+    simbox.init()
+    simbox.solve()
+    
+    loadbox = LoadBox(simulation_config, {"home": str(tmp_path), "store": "stride", "stride": 2})
+    loadbox.load_fields()
+    
+    np.testing.assert_array_equal(loadbox.z_index, [0, 2, 4, 6])
+    assert loadbox.fields.shape == (4, 24, 16)
+    np.testing.assert_array_equal(loadbox.fields[-1], simbox.field[8:56:2, 16:48:2])
+    np.testing.assert_array_equal(loadbox.fields1[-1], simbox.field1[8:56:2, 16:48:2])
+    
+    view = loadbox.view_field()
+    assert view.shape == (4, 24, 16)
+    np.testing.assert_array_equal(view[-1], simbox.field[8:56:2, 16:48:2])
+
+def test_stride_run_stores_the_last_step(tmp_path):
+    for iteration in ("standard", "fused", "adaptive"):
+        home = str(tmp_path / iteration)
+        config = {**simulation_config, "Nz": 8, "iteration": iteration}
+        storage_config = {"home": home, "store": "stride", "stride": 3}
+        simbox = SimulationBox(
+            crystal_config = deepcopy(crystal_config),
+            beam_config = beam_config,
+            simulation_config = config,
+            device_config = device_config,
+            modulation_config = deepcopy(modulation_config),
+            storage_config = storage_config,
+        )
+        simbox.init()
+        simbox.solve()
+        
+        loadbox = LoadBox(config, {"home": home, "store": "stride", "stride": 3})
+        loadbox.load_fields()
+        np.testing.assert_array_equal(loadbox.z_index, [0, 3, 6, 8])
+        np.testing.assert_array_equal(loadbox.fields[-1], simbox.field)
+
+def test_invalid_storage_policies_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        LoadBox(simulation_config, {"home": str(tmp_path), "store": "stride", "stride": 0})
+    with pytest.raises(ValueError):
+        LoadBox(simulation_config, {"home": str(tmp_path), "store": "planes"})
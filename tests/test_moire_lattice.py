@@ -0,0 +1,46 @@
+import os
+import sys
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from test_load_methods import SimulationBox, beam_config, crystal_config, device_config, modulation_config, simulation_config
+from src.fields.landscapes.lattices.moire_lattices.double_lattices import lattice_sum, moire_lattice
+from src.fields.landscapes.lattices.single_lattices.two_dimensional import planewave_lattice
+
+def meshgrid_lattice(x, y, angles, a, p):
+    """ Moire lattice summed from the planewave lattices of rotated meshgrids."""
+    xx, yy = np.meshgrid(x, y)
+    rotated = [(xx*np.cos(angle) - yy*np.sin(angle), xx*np.sin(angle) + yy*np.cos(angle)) for angle in angles]
+    return lattice_sum(*rotated[0], *rotated[1], a, p, planewave_lattice)
+
+@pytest.mark.parametrize("angles, p", [
+    ((np.atan(3/4), 0.), (1., 1.)),
+    ((.1, -.3), (1., .5)),
+    ((np.atan(3/4), 0.), (1., -.5)),
+])
+def test_separable_lattice_matches_meshgrid_lattice(angles, p):
+    x, y = np.arange(-48, 48) * 2e-5, np.arange(-40, 40) * 2.5e-5  # the origin is a grid point, as in the boxes
+    a = (1e-4, 1e-4)
+    
+    reference = meshgrid_lattice(x, y, angles, a, p)
+    lattice = moire_lattice(x, y, angles, a, p)
+    assert lattice.dtype == np.float64
+    np.testing.assert_allclose(lattice, reference.real, atol=1e-12)
+    np.testing.assert_allclose(reference.imag, 0., atol=1e-12)
+
+def test_box_lattice_matches_meshgrid_lattice(tmp_path):
+    simbox = SimulationBox(
+        crystal_config = deepcopy(crystal_config),
+        beam_config = beam_config,
+        simulation_config = simulation_config,
+        device_config = device_config,
+        modulation_config = deepcopy(modulation_config),
+        storage_config = {"home": str(tmp_path), "store": "last"},
+    )
+    simbox.init()
+    reference = meshgrid_lattice(simbox.x, simbox.y, simbox.angle, simbox.a, simbox.p)
+    np.testing.assert_allclose(simbox.landscape_function1(), reference.real, atol=1e-12)
@@ -0,0 +1,72 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.core.engines.solvers.nls.propagators.cache import PropagatorCache
+
+class CountingCache(PropagatorCache):
+    """ Cache over a fake grid that records every propagator it builds."""
+    scheme = "strang"
+    linear_fractions = (.5,)
+    step_levels = 1
+    
+    def __init__(self, Nx=8):
+        self.Nx = Nx
+        self.builds = []
+    
+    @property
+    def grid_key(self,):
+        return (self.Nx,)
+    
+    def get_fields(self, copy=True):
+        return (None, None)
+    
+    def build_propagator(self, kinetic, dz, step=.5, absorption=0.):
+        self.builds.append((kinetic, dz, step, absorption))
+        return (self.Nx, kinetic, dz, step, absorption)
+
+def test_propagators_are_keyed_on_every_argument():
+    cache = CountingCache()
+    cache.propagator_cache_size = 8
+    keys = [(1., .1, .5, 0.), (2., .1, .5, 0.), (1., .2, .5, 0.), (1., .1, 1., 0.), (1., .1, .5, .3)]
+    for key in keys + keys:
+        assert cache.propagator(*key) == (8, *key)
+    assert cache.builds == keys
+
+def test_default_size_covers_fractions_levels_and_fields():
+    cache = CountingCache()
+    assert cache.propagator_cache_size == 2
+    cache.step_levels = 3
+    assert cache.propagator_cache_size == 6
+    cache.propagator_cache_size = 4
+    assert cache.propagator_cache_size == 4
+
+def test_least_recently_used_propagator_is_evicted():
+    cache = CountingCache()
+    cache.propagator_cache_size = 2
+    cache.propagator(1., .1)
+    cache.propagator(2., .1)
+    cache.propagator(1., .1)  # hit, the second propagator becomes the least recently used
+    cache.propagator(3., .1)
+    assert list(cache.propagators) == [(1., .1, .5, 0.), (3., .1, .5, 0.)]
+    cache.propagator(1., .1)
+    cache.propagator(2., .1)
+    assert len(cache.builds) == 4
+    assert len(cache.propagators) == 2
+
+def test_cycle_within_the_size_builds_each_propagator_once():
+    cache = CountingCache()
+    cache.propagator_cache_size = 12
+    for _ in range(5):
+        for kinetic in range(12):
+            cache.propagator(float(kinetic), .1)
+    assert len(cache.builds) == 12
+
+def test_grid_change_invalidates_the_cache():
+    cache = CountingCache()
+    assert cache.propagator(1., .1) == (8, 1., .1, .5, 0.)
+    cache.Nx = 16
+    assert cache.propagator(1., .1) == (16, 1., .1, .5, 0.)
+    assert len(cache.propagators) == 1
+    assert len(cache.builds) == 2
@@ -0,0 +1,48 @@
+import os
+import sys
+from copy import deepcopy
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from test_load_methods import LoadBox, SimulationBox, beam_config, crystal_config, device_config, modulation_config, simulation_config
+
+def make_box(home, base_config=simulation_config, **config):
+    return SimulationBox(
+        crystal_config = deepcopy(crystal_config),
+        beam_config = beam_config,
+        simulation_config = {**base_config, **config},
+        device_config = device_config,
+        modulation_config = deepcopy(modulation_config),
+        storage_config = {"home": home, "store": "last"},
+    )
+
+def test_feature_keys_are_read_by_their_classes(tmp_path):
+    simbox = make_box(str(tmp_path), iteration="Adaptive", scheme="RK4IP", tolerance=1e-4, max_refinement=3,
+                      nonlinear_kernel="fused", mesh="lean", noise_chunk=16, precision="single")
+    assert simbox.iteration_mode == "adaptive"
+    assert simbox.scheme == "rk4ip"
+    assert simbox.adaptive_tolerance == 1e-4
+    assert simbox.adaptive_max_refinement == 3
+    assert simbox.nonlinear_kernel == "fused"
+    assert simbox.lean_mesh
+    assert simbox.noise_chunk == 16
+    assert simbox.precision == "single"
+    assert simbox.seed == simulation_config["seed"]
+    
+    defaults = make_box(str(tmp_path))
+    assert (defaults.iteration_mode, defaults.scheme, defaults.nonlinear_kernel, defaults.mesh_mode) == ("standard", "strang", "standard", "dense")
+
+def test_fresh_seed_is_stored_with_the_fields(tmp_path):
+    config = {key: value for key, value in simulation_config.items() if key != "seed"}  # the run draws a fresh seed
+    simbox = make_box(str(tmp_path / "fresh"), config)
+    simbox.init()
+    
+    loadbox = LoadBox(config, {"home": str(tmp_path / "fresh")})
+    seed = loadbox.get_field_seed(loadbox.get_field_directory(0)[0])
+    assert seed == simbox.seed
+    
+    rerun = make_box(str(tmp_path / "rerun"), config, seed=seed)
+    rerun.init()
+    np.testing.assert_array_equal(rerun.field, loadbox.get_field(loadbox.get_field_directory(0)[0]))
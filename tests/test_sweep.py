@@ -0,0 +1,73 @@
+import os
+import pickle
+import sys
+from copy import deepcopy
+
+import h5py
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from test_load_methods import beam_config, crystal_config, device_config, modulation_config, simulation_config
+from src.core.boxes.parallel import ParallelSweep
+from src.core.boxes.simulation import SimulationBoxMethods
+from src.core.boxes.sweep import SweepBoxMethods
+from src.core.engines.solvers.nls.eq_coefs.models import CoupledWavevectorPhotorefractiveModel
+from src.core.engines.solvers.nls.solver_2d.coupled_solver import CoupledSplitStepSolver
+from src.fields.fields_2d import SecondMoireLatticeGaussian2D
+
+class SweepBox(CoupledSplitStepSolver, SecondMoireLatticeGaussian2D, CoupledWavevectorPhotorefractiveModel, SweepBoxMethods):
+    pass
+
+class SimulationBox(CoupledSplitStepSolver, SecondMoireLatticeGaussian2D, CoupledWavevectorPhotorefractiveModel, SimulationBoxMethods):
+    """ Box of the parallel sweep, importable by its spawned workers."""
+    pass
+
+def point_field(home, index, directory, filename):
+    with h5py.File(os.path.join(home, "Sweep", f"point_{index}", directory, filename), "r") as f:
+        return f["field"][()]
+
+def test_sweep_stores_every_point(tmp_path):
+    sweepbox = SweepBox(
+        crystal_config = deepcopy(crystal_config),
+        beam_config = beam_config,
+        simulation_config = simulation_config,
+        device_config = device_config,
+        modulation_config = deepcopy(modulation_config),
+        storage_config = {"home": str(tmp_path), "store": "last"},
+    )
+    points = [{"I1": 10.}, {"I1": 40.}]
+    sweepbox.sweep(points)
+    
+    for index, point in enumerate(points):
+        with open(tmp_path / "Sweep" / f"point_{index}" / "sweep_point.pickle", "rb") as fpkl:
+            stored = pickle.load(fpkl)
+        assert stored == {"point": point, "sweep_index": index, "seed": simulation_config["seed"]}
+        assert os.path.exists(tmp_path / "Sweep" / f"point_{index}" / "Field1" / "field_last.h5")
+    with open(tmp_path / "Sweep" / "sweep_points.pickle", "rb") as fpkl:
+        assert pickle.load(fpkl) == dict(enumerate(points))
+
+def test_parallel_points_match_serial_points(tmp_path):
+    config = {key: value for key, value in simulation_config.items() if key != "seed"}  # the sweeps draw a fresh seed
+    configs = {
+        "crystal_config": deepcopy(crystal_config),
+        "beam_config": beam_config,
+        "simulation_config": config,
+        "device_config": device_config,
+        "modulation_config": deepcopy(modulation_config),
+        "storage_config": {"home": str(tmp_path / "parallel"), "store": "last"},
+    }
+    parallel = ParallelSweep(SimulationBox, configs, workers=2, backend="numpy", threads=1)
+    parallel.run([{}, {}])
+    
+    sweepbox = SweepBox(**{**deepcopy(configs), "simulation_config": {**config, "seed": parallel.seed},
+                           "storage_config": {"home": str(tmp_path / "serial"), "store": "last"}})
+    sweepbox.sweep([{}, {}])
+    
+    for index in range(2):
+        for directory, filename in [("Field", "field_0.h5"), ("Field1", "field_0.h5"), ("Field", "field_last.h5")]:
+            np.testing.assert_array_equal(
+                point_field(tmp_path / "parallel", index, directory, filename),
+                point_field(tmp_path / "serial", index, directory, filename),
+            )
+    assert not np.array_equal(point_field(tmp_path / "serial", 0, "Field", "field_0.h5"), point_field(tmp_path / "serial", 1, "Field", "field_0.h5"))